@@ -22,6 +22,7 @@
 
 import json
 import logging
+import threading
 import time
 import typing as t
 import uuid
@@ -38,14 +39,18 @@ from operate.bridge.providers.native_bridge_provider import (
     OmnibridgeContractAdaptor,
     OptimismContractAdaptor,
 )
-from operate.bridge.providers.provider import Provider, ProviderRequest
+from operate.bridge.providers.provider import (
+    GasPricingContext,
+    Provider,
+    ProviderRequest,
+)
 from operate.bridge.providers.relay_provider import RelayProvider
 from operate.constants import ZERO_ADDRESS
 from operate.ledger.profiles import USDC
 from operate.operate_types import Chain
 from operate.resource import LocalResource
 from operate.services.manage import get_assets_balances
-from operate.utils import merge_sum_dicts, subtract_dicts
+from operate.utils import concurrent_map, merge_sum_dicts, subtract_dicts
 from operate.wallet.master import MasterWalletManager
 
 
@@ -56,6 +61,31 @@ BRIDGE_REQUEST_BUNDLE_PREFIX = "rb-"
 LIFI_PROVIDER_ID = "lifi-provider"
 RELAY_PROVIDER_ID = "relay-provider"
 
+DEFAULT_PROVIDER_MAX_CONCURRENT_REQUESTS = 4
+PROVIDER_MAX_CONCURRENT_REQUESTS = {
+    LIFI_PROVIDER_ID: 2,
+    RELAY_PROVIDER_ID: 2,
+}
+
+# Shared by all the bridge manager instances, as one is created per API call
+_provider_semaphores: t.Dict[str, threading.BoundedSemaphore] = {}
+_provider_semaphores_lock = threading.Lock()
+
+T = t.TypeVar("T")
+
+
+def _provider_semaphore(provider_id: str) -> threading.BoundedSemaphore:
+    """Get the semaphore bounding the concurrent requests to a provider."""
+    with _provider_semaphores_lock:
+        if provider_id not in _provider_semaphores:
+            _provider_semaphores[provider_id] = threading.BoundedSemaphore(
+                PROVIDER_MAX_CONCURRENT_REQUESTS.get(
+                    provider_id, DEFAULT_PROVIDER_MAX_CONCURRENT_REQUESTS
+                )
+            )
+        return _provider_semaphores[provider_id]
+
+
 NATIVE_BRIDGE_PROVIDER_CONFIGS: t.Dict[str, t.Any] = {
     "native-ethereum-to-base": {
         "from_chain": "ethereum",
@@ -228,6 +258,25 @@ class BridgeManager:
             logger=logger,
         )
 
+    def _map_provider_requests(
+        self,
+        fn: t.Callable[[Provider, ProviderRequest], T],
+        provider_requests: t.List[ProviderRequest],
+    ) -> t.List[T]:
+        """Apply a provider call to each request concurrently, preserving their order.
+
+        Each request is handled by its own provider, so the requests are processed
+        concurrently, while the calls to each provider are bounded by its limit
+        of concurrent requests.
+        """
+
+        def _call(provider_request: ProviderRequest) -> T:
+            provider = self._providers[provider_request.provider_id]
+            with _provider_semaphore(provider_request.provider_id):
+                return fn(provider, provider_request)
+
+        return concurrent_map(_call, provider_requests)
+
     def _store_data(self) -> None:
         self.logger.info("[BRIDGE MANAGER] Storing data to file.")
         self.data.store()
@@ -335,15 +384,22 @@ class BridgeManager:
 
         bundle = self._get_updated_bundle(requests_params, force_update)
 
-        balances = {}
-        for chain in bundle.get_from_chains():
+        def _get_balances(chain: Chain) -> t.Dict:
             ledger_api = self.wallet_manager.load(chain.ledger_type).ledger_api(chain)
-            balances[chain.value] = get_assets_balances(
+            return get_assets_balances(
                 ledger_api=ledger_api,
                 asset_addresses={ZERO_ADDRESS} | bundle.get_from_tokens(chain),
                 addresses=bundle.get_from_addresses(chain),
             )
 
+        chains = list(bundle.get_from_chains())
+        balances = {
+            chain.value: chain_balances
+            for chain, chain_balances in zip(
+                chains, concurrent_map(_get_balances, chains)
+            )
+        }
+
         bridge_total_requirements = self.bridge_total_requirements(bundle)
 
         bridge_refill_requirements = cast(
@@ -398,13 +454,31 @@ class BridgeManager:
 
         self.logger.info("[BRIDGE MANAGER] Executing quotes.")
 
-        for request in bundle.provider_requests:
-            provider = self._providers[request.provider_id]
-            provider.execute(request)
-            self._store_data()
+        # The nonces of each sender are managed locally, so the requests are executed
+        # concurrently, and the bundle is settled in about one block time
+        store_lock = threading.Lock()
+
+        def _execute(
+            provider: Provider, provider_request: ProviderRequest
+        ) -> t.Optional[Exception]:
+            try:
+                provider.execute(provider_request)
+                return None
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(
+                    f"[BRIDGE MANAGER] Error executing request {provider_request.id}: {e}"
+                )
+                return e
+            finally:
+                with store_lock:
+                    self._store_data()
+                    bundle.store()
+
+        errors = self._map_provider_requests(_execute, bundle.provider_requests)
+        for error in errors:
+            if error is not None:
+                raise error
 
-        self._store_data()
-        bundle.store()
         self.logger.info(f"[BRIDGE MANAGER] Bundle id {bundle_id} executed.")
         return self.get_status_json(bundle_id)
 
@@ -426,10 +500,10 @@ class BridgeManager:
 
         initial_status = [request.status for request in bundle.provider_requests]
 
-        provider_request_status = []
-        for request in bundle.provider_requests:
-            provider = self._providers[request.provider_id]
-            provider_request_status.append(provider.status_json(request))
+        provider_request_status = self._map_provider_requests(
+            lambda provider, request: provider.status_json(request),
+            bundle.provider_requests,
+        )
 
         updated_status = [request.status for request in bundle.provider_requests]
 
@@ -443,18 +517,22 @@ class BridgeManager:
 
     def bridge_total_requirements(self, bundle: ProviderRequestBundle) -> t.Dict:
         """Sum bridge requirements."""
-        requirements = []
-        for provider_request in bundle.provider_requests:
-            provider = self._providers[provider_request.provider_id]
-            requirements.append(provider.requirements(provider_request))
-
+        # The gas pricing of each chain is shared by all the transactions of the bundle
+        gas_pricing_context = GasPricingContext()
+        requirements = self._map_provider_requests(
+            lambda provider, request: provider.requirements(
+                request, gas_pricing_context=gas_pricing_context
+            ),
+            bundle.provider_requests,
+        )
         return merge_sum_dicts(*requirements)
 
     def quote_bundle(self, bundle: ProviderRequestBundle) -> None:
         """Update the bundle with the quotes."""
-        for provider_request in bundle.provider_requests:
-            provider = self._providers[provider_request.provider_id]
-            provider.quote(provider_request)
+        self._map_provider_requests(
+            lambda provider, request: provider.quote(request),
+            bundle.provider_requests,
+        )
         bundle.timestamp = int(time.time())
 
     def last_executed_bundle_id(self) -> t.Optional[str]:
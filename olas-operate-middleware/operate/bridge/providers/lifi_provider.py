@@ -32,6 +32,7 @@ from autonomy.chain.base import registry_contracts
 from operate.bridge.providers.provider import (
     DEFAULT_MAX_QUOTE_RETRIES,
     MESSAGE_QUOTE_ZERO,
+    GasPricingContext,
     Provider,
     ProviderRequest,
     ProviderRequestStatus,
@@ -198,7 +199,11 @@ class LiFiProvider(Provider):
 
             time.sleep(2)
 
-    def _get_approve_tx(self, provider_request: ProviderRequest) -> t.Optional[t.Dict]:
+    def _get_approve_tx(
+        self,
+        provider_request: ProviderRequest,
+        gas_pricing_context: t.Optional[GasPricingContext] = None,
+    ) -> t.Optional[t.Dict]:
         """Get the approve transaction."""
         self.logger.info(
             f"[LI.FI PROVIDER] Get appprove transaction for request {provider_request.id}."
@@ -240,11 +245,17 @@ class LiFiProvider(Provider):
             amount=from_amount,
         )
         approve_tx["gas"] = 200_000  # TODO backport to ERC20 contract as default
-        Provider._update_with_gas_pricing(approve_tx, from_ledger_api)
+        Provider._update_with_gas_pricing(
+            approve_tx, from_ledger_api, gas_pricing_context
+        )
         Provider._update_with_gas_estimate(approve_tx, from_ledger_api)
         return approve_tx
 
-    def _get_bridge_tx(self, provider_request: ProviderRequest) -> t.Optional[t.Dict]:
+    def _get_bridge_tx(
+        self,
+        provider_request: ProviderRequest,
+        gas_pricing_context: t.Optional[GasPricingContext] = None,
+    ) -> t.Optional[t.Dict]:
         """Get the bridge transaction."""
         self.logger.info(
             f"[LI.FI PROVIDER] Get bridge transaction for request {provider_request.id}."
@@ -285,7 +296,9 @@ class LiFiProvider(Provider):
                 transaction_request["from"]
             ),
         }
-        Provider._update_with_gas_pricing(bridge_tx, from_ledger_api)
+        Provider._update_with_gas_pricing(
+            bridge_tx, from_ledger_api, gas_pricing_context
+        )
         Provider._update_with_gas_estimate(bridge_tx, from_ledger_api)
         return bridge_tx
 
@@ -294,10 +307,14 @@ class LiFiProvider(Provider):
     ) -> t.List[t.Tuple[str, t.Dict]]:
         """Get the sorted list of transactions to execute the quote."""
         txs = []
-        approve_tx = self._get_approve_tx(provider_request)
+        approve_tx = self._get_approve_tx(
+            provider_request, gas_pricing_context=kwargs.get("gas_pricing_context")
+        )
         if approve_tx:
             txs.append(("approve_tx", approve_tx))
-        bridge_tx = self._get_bridge_tx(provider_request)
+        bridge_tx = self._get_bridge_tx(
+            provider_request, gas_pricing_context=kwargs.get("gas_pricing_context")
+        )
         if bridge_tx:
             txs.append(("bridge_tx", bridge_tx))
         return txs
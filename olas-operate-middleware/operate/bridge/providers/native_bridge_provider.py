@@ -36,6 +36,7 @@ from operate.bridge.providers.provider import (
     MESSAGE_EXECUTION_FAILED_ETA,
     MESSAGE_EXECUTION_FAILED_REVERTED,
     MESSAGE_QUOTE_ZERO,
+    GasPricingContext,
     Provider,
     ProviderRequest,
     ProviderRequestStatus,
@@ -482,7 +483,11 @@ class NativeBridgeProvider(Provider):
         provider_request.quote_data = quote_data
         provider_request.status = ProviderRequestStatus.QUOTE_DONE
 
-    def _get_approve_tx(self, provider_request: ProviderRequest) -> t.Optional[t.Dict]:
+    def _get_approve_tx(
+        self,
+        provider_request: ProviderRequest,
+        gas_pricing_context: t.Optional[GasPricingContext] = None,
+    ) -> t.Optional[t.Dict]:
         """Get the approve transaction."""
         self.logger.info(
             f"[NATIVE BRIDGE PROVIDER] Get appprove transaction for request {provider_request.id}."
@@ -512,11 +517,17 @@ class NativeBridgeProvider(Provider):
             amount=to_amount,
         )
         approve_tx["gas"] = 200_000  # TODO backport to ERC20 contract as default
-        Provider._update_with_gas_pricing(approve_tx, from_ledger_api)
+        Provider._update_with_gas_pricing(
+            approve_tx, from_ledger_api, gas_pricing_context
+        )
         Provider._update_with_gas_estimate(approve_tx, from_ledger_api)
         return approve_tx
 
-    def _get_bridge_tx(self, provider_request: ProviderRequest) -> t.Optional[t.Dict]:
+    def _get_bridge_tx(
+        self,
+        provider_request: ProviderRequest,
+        gas_pricing_context: t.Optional[GasPricingContext] = None,
+    ) -> t.Optional[t.Dict]:
         """Get the bridge transaction."""
         self.logger.info(
             f"[NATIVE BRIDGE PROVIDER] Get bridge transaction for request {provider_request.id}."
@@ -534,7 +545,9 @@ class NativeBridgeProvider(Provider):
             from_ledger_api=from_ledger_api, provider_request=provider_request
         )
 
-        Provider._update_with_gas_pricing(bridge_tx, from_ledger_api)
+        Provider._update_with_gas_pricing(
+            bridge_tx, from_ledger_api, gas_pricing_context
+        )
         Provider._update_with_gas_estimate(bridge_tx, from_ledger_api)
         return bridge_tx
 
@@ -543,10 +556,14 @@ class NativeBridgeProvider(Provider):
     ) -> t.List[t.Tuple[str, t.Dict]]:
         """Get the sorted list of transactions to execute the quote."""
         txs = []
-        approve_tx = self._get_approve_tx(provider_request)
+        approve_tx = self._get_approve_tx(
+            provider_request, gas_pricing_context=kwargs.get("gas_pricing_context")
+        )
         if approve_tx:
             txs.append(("approve_tx", approve_tx))
-        bridge_tx = self._get_bridge_tx(provider_request)
+        bridge_tx = self._get_bridge_tx(
+            provider_request, gas_pricing_context=kwargs.get("gas_pricing_context")
+        )
         if bridge_tx:
             txs.append(("bridge_tx", bridge_tx))
         return txs
@@ -23,6 +23,7 @@
 import copy
 import enum
 import logging
+import threading
 import time
 import typing as t
 import uuid
@@ -31,9 +32,7 @@ from dataclasses import dataclass
 from math import ceil
 
 from aea.crypto.base import LedgerApi
-from autonomy.chain.tx import TxSettler
 from web3 import Web3
-from web3.middleware import geth_poa_middleware
 
 from operate.constants import (
     ON_CHAIN_INTERACT_RETRIES,
@@ -41,6 +40,7 @@ from operate.constants import (
     ON_CHAIN_INTERACT_TIMEOUT,
     ZERO_ADDRESS,
 )
+from operate.ledger.nonce import NonceManager
 from operate.operate_types import Chain
 from operate.resource import LocalResource
 from operate.wallet.master import MasterWalletManager
@@ -68,6 +68,11 @@ ERC20_APPROVE_SELECTOR = "0x095ea7b3"  # First 4 bytes of Web3.keccak(text='appr
 
 GAS_ESTIMATE_BUFFER = 1.10
 
+# errors of the node when sending a transaction, as classified by `TxSettler`
+TX_ERRORS_ALREADY_KNOWN = ("already known", "AlreadyKnown")
+TX_ERRORS_NONCE_TOO_LOW = ("nonce too low", "OldNonce")
+TX_ERRORS_TO_REPRICE = ("FeeTooLow", "transaction underpriced")
+
 
 @dataclass
 class QuoteData(LocalResource):
@@ -120,6 +125,35 @@ class ProviderRequest(LocalResource):
     execution_data: t.Optional[ExecutionData]
 
 
+class GasPricingContext:
+    """Gas pricing shared by the transactions of a requirements pass.
+
+    The gas pricing of each ledger api (i.e., of each chain) is fetched once and
+    reused by all the transactions built during the pass, from any thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the context."""
+        self._gas_pricing: t.Dict[int, t.Tuple[LedgerApi, t.Dict]] = {}
+        self._locks: t.Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, ledger_api: LedgerApi) -> t.Optional[t.Dict]:
+        """Get the gas pricing of the ledger api, fetching it on first use."""
+        key = id(ledger_api)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self._gas_pricing:
+                gas_pricing = ledger_api.try_get_gas_pricing()
+                if gas_pricing is None:
+                    return None
+                # The ledger api is kept alive so that its id is not reused
+                self._gas_pricing[key] = (ledger_api, gas_pricing)
+            return self._gas_pricing[key][1]
+
+
 class Provider(ABC):
     """(Abstract) Provider.
 
@@ -227,26 +261,16 @@ class Provider(ABC):
         from_chain = provider_request.params["from"]["chain"]
         chain = Chain(from_chain)
         wallet = self.wallet_manager.load(chain.ledger_type)
-        ledger_api = wallet.ledger_api(chain)
-
-        # TODO: Backport to open aea/autonomy
-        if chain == Chain.OPTIMISM:
-            ledger_api.api.middleware_onion.inject(geth_poa_middleware, layer=0)
-
-        return ledger_api
+        # the proof of authority middleware is injected by the ledger api pool where needed
+        return wallet.ledger_api(chain)
 
     def _to_ledger_api(self, provider_request: ProviderRequest) -> LedgerApi:
         """Get the from ledger api."""
         from_chain = provider_request.params["to"]["chain"]
         chain = Chain(from_chain)
         wallet = self.wallet_manager.load(chain.ledger_type)
-        ledger_api = wallet.ledger_api(chain)
-
-        # TODO: Backport to open aea/autonomy
-        if chain == Chain.OPTIMISM:
-            ledger_api.api.middleware_onion.inject(geth_poa_middleware, layer=0)
-
-        return ledger_api
+        # the proof of authority middleware is injected by the ledger api pool where needed
+        return wallet.ledger_api(chain)
 
     @abstractmethod
     def quote(self, provider_request: ProviderRequest) -> None:
@@ -260,8 +284,16 @@ class Provider(ABC):
         """Get the sorted list of transactions to execute the quote."""
         raise NotImplementedError()
 
-    def requirements(self, provider_request: ProviderRequest) -> t.Dict:
-        """Gets the requirements to execute the quote, with updated gas estimation."""
+    def requirements(
+        self,
+        provider_request: ProviderRequest,
+        gas_pricing_context: t.Optional[GasPricingContext] = None,
+    ) -> t.Dict:
+        """Gets the requirements to execute the quote, with updated gas estimation.
+
+        The gas pricing is fetched once per chain for all the transactions of the
+        request, or of all the requests sharing the same `gas_pricing_context`.
+        """
         self.logger.info(f"[PROVIDER] Requirements for request {provider_request.id}.")
 
         self._validate(provider_request)
@@ -270,8 +302,9 @@ class Provider(ABC):
         from_address = provider_request.params["from"]["address"]
         from_token = provider_request.params["from"]["token"]
         from_ledger_api = self._from_ledger_api(provider_request)
+        gas_pricing_context = gas_pricing_context or GasPricingContext()
 
-        txs = self._get_txs(provider_request)
+        txs = self._get_txs(provider_request, gas_pricing_context=gas_pricing_context)
 
         if not txs:
             return {
@@ -291,20 +324,22 @@ class Provider(ABC):
             self.logger.debug(
                 f"[PROVIDER] Processing transaction {tx_label} for request {provider_request.id}."
             )
-            self._update_with_gas_pricing(tx, from_ledger_api)
+            self._update_with_gas_pricing(tx, from_ledger_api, gas_pricing_context)
             gas_key = "gasPrice" if "gasPrice" in tx else "maxFeePerGas"
             gas_fees = tx.get(gas_key, 0) * tx["gas"]
             tx_value = int(tx.get("value", 0))
             total_gas_fees += gas_fees
             total_native += tx_value + gas_fees
 
-            self.logger.debug(
-                f"[PROVIDER] Transaction {gas_key}={tx.get(gas_key, 0)} maxPriorityFeePerGas={tx.get('maxPriorityFeePerGas', -1)} gas={tx['gas']} {gas_fees=} {tx_value=}"
-            )
-            self.logger.debug(f"[PROVIDER] {from_ledger_api.api.eth.gas_price=}")
-            self.logger.debug(
-                f"[PROVIDER] {from_ledger_api.api.eth.get_block('latest').baseFeePerGas=}"
-            )
+            # The diagnostics request the chain, so they only run when they are logged
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"[PROVIDER] Transaction {gas_key}={tx.get(gas_key, 0)} maxPriorityFeePerGas={tx.get('maxPriorityFeePerGas', -1)} gas={tx['gas']} {gas_fees=} {tx_value=}"
+                )
+                self.logger.debug(f"[PROVIDER] {from_ledger_api.api.eth.gas_price=}")
+                self.logger.debug(
+                    f"[PROVIDER] {from_ledger_api.api.eth.get_block('latest').baseFeePerGas=}"
+                )
 
             if tx.get("to", "").lower() == from_token.lower() and tx.get(
                 "data", ""
@@ -365,53 +400,49 @@ class Provider(ABC):
                 f"Cannot execute request {provider_request.id}: execution data already present."
             )
 
-        txs = self._get_txs(provider_request)
+        timestamp = time.time()
+        try:
+            txs = self._get_txs(provider_request)
 
-        if not txs:
-            self.logger.info(
-                f"[PROVIDER] {MESSAGE_EXECUTION_SKIPPED} ({provider_request.status=})"
-            )
-            execution_data = ExecutionData(
-                elapsed_time=0,
-                message=f"{MESSAGE_EXECUTION_SKIPPED} ({provider_request.status=})",
-                timestamp=int(time.time()),
-                from_tx_hash=None,
-                to_tx_hash=None,
-                provider_data=None,
-            )
-            provider_request.execution_data = execution_data
-            provider_request.status = ProviderRequestStatus.EXECUTION_DONE
-            return
+            if not txs:
+                self.logger.info(
+                    f"[PROVIDER] {MESSAGE_EXECUTION_SKIPPED} ({provider_request.status=})"
+                )
+                execution_data = ExecutionData(
+                    elapsed_time=0,
+                    message=f"{MESSAGE_EXECUTION_SKIPPED} ({provider_request.status=})",
+                    timestamp=int(time.time()),
+                    from_tx_hash=None,
+                    to_tx_hash=None,
+                    provider_data=None,
+                )
+                provider_request.execution_data = execution_data
+                provider_request.status = ProviderRequestStatus.EXECUTION_DONE
+                return
 
-        try:
             self.logger.info(f"[PROVIDER] Executing request {provider_request.id}.")
-            timestamp = time.time()
             chain = Chain(provider_request.params["from"]["chain"])
             from_address = provider_request.params["from"]["address"]
             wallet = self.wallet_manager.load(chain.ledger_type)
             from_ledger_api = self._from_ledger_api(provider_request)
-            tx_settler = TxSettler(
-                ledger_api=from_ledger_api,
-                crypto=wallet.crypto,
-                chain_type=Chain(provider_request.params["from"]["chain"]),
-                timeout=ON_CHAIN_INTERACT_TIMEOUT,
-                retries=ON_CHAIN_INTERACT_RETRIES,
-                sleep=ON_CHAIN_INTERACT_SLEEP,
-            )
-            tx_hashes = []
 
-            for tx_label, tx in txs:
-                self.logger.info(f"[PROVIDER] Executing transaction {tx_label}.")
-                nonce = from_ledger_api.api.eth.get_transaction_count(from_address)
-                tx["nonce"] = nonce  # TODO: backport to TxSettler
-                setattr(  # noqa: B010
-                    tx_settler, "build", lambda *args, **kwargs: tx  # noqa: B023
-                )
-                tx_receipt = tx_settler.transact(
-                    method=lambda: {},
-                    contract="",
-                    kwargs={},
-                    dry_run=False,
+            # The transactions are sent back-to-back with locally assigned nonces,
+            # so that all of them are settled in about one block time
+            sent_tx_hashes = []
+            with NonceManager().reserve(
+                ledger_api=from_ledger_api, chain=chain, address=from_address
+            ) as next_nonce:
+                for tx_label, tx in txs:
+                    self.logger.info(f"[PROVIDER] Sending transaction {tx_label}.")
+                    tx["nonce"] = next_nonce()
+                    sent_tx_hashes.append(
+                        self._send_tx(tx, wallet.crypto, from_ledger_api)
+                    )
+
+            tx_hashes = []
+            for (tx_label, _), tx_hash in zip(txs, sent_tx_hashes):
+                tx_receipt = from_ledger_api.api.eth.wait_for_transaction_receipt(
+                    tx_hash, timeout=ON_CHAIN_INTERACT_TIMEOUT
                 )
                 self.logger.info(f"[PROVIDER] Transaction {tx_label} settled.")
                 tx_hashes.append(tx_receipt.get("transactionHash", "").hex())
@@ -435,6 +466,10 @@ class Provider(ABC):
 
         except Exception as e:  # pylint: disable=broad-except
             self.logger.error(f"[PROVIDER] Error executing request: {e}")
+            NonceManager().invalidate(
+                chain=Chain(provider_request.params["from"]["chain"]),
+                address=provider_request.params["from"]["address"],
+            )
             execution_data = ExecutionData(
                 elapsed_time=time.time() - timestamp,
                 message=f"{MESSAGE_EXECUTION_FAILED} {str(e)}",
@@ -482,6 +517,73 @@ class Provider(ABC):
 
         return {"message": None, "status": provider_request.status.value}
 
+    @classmethod
+    def _send_tx(cls, tx: t.Dict, crypto: t.Any, ledger_api: LedgerApi) -> str:
+        """Sign and send a transaction, without waiting for its receipt.
+
+        A transaction which the node already knows is taken as sent, as an earlier
+        attempt reached the node even if its call failed. Underpriced transactions are
+        repriced and sent again, as `TxSettler` does.
+        """
+        tx_hashes: t.List[str] = []
+        error = ""
+        for _ in range(ON_CHAIN_INTERACT_RETRIES):
+            signed_tx = crypto.sign_transaction(tx)
+            tx_hash = signed_tx.hash.hex()
+            tx_hashes.append(tx_hash)
+            try:
+                sent_tx_hash = ledger_api.send_signed_transaction(
+                    signed_tx, raise_on_try=True
+                )
+                if sent_tx_hash is not None:
+                    return sent_tx_hash
+                error = "no transaction hash returned"
+            except Exception as e:  # pylint: disable=broad-except
+                error = str(e)
+
+            if any(message in error for message in TX_ERRORS_ALREADY_KNOWN):
+                return tx_hash
+            if any(message in error for message in TX_ERRORS_NONCE_TOO_LOW):
+                # the nonce is used by an earlier attempt, unless it was used elsewhere
+                for attempted_tx_hash in tx_hashes:
+                    if cls._is_mined(attempted_tx_hash, ledger_api):
+                        return attempted_tx_hash
+                break
+            if any(message in error for message in TX_ERRORS_TO_REPRICE):
+                cls._reprice(tx, ledger_api)
+            time.sleep(ON_CHAIN_INTERACT_SLEEP)
+
+        raise RuntimeError(
+            f"Unable to send transaction with nonce {tx['nonce']}: {error}"
+        )
+
+    @staticmethod
+    def _is_mined(tx_hash: str, ledger_api: LedgerApi) -> bool:
+        try:
+            return ledger_api.api.eth.get_transaction_receipt(tx_hash) is not None
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    # TODO backport to open aea/autonomy
+    @staticmethod
+    def _reprice(tx: t.Dict, ledger_api: LedgerApi) -> None:
+        if "maxFeePerGas" in tx:
+            old_price = {
+                "maxFeePerGas": tx["maxFeePerGas"],
+                "maxPriorityFeePerGas": tx["maxPriorityFeePerGas"],
+            }
+        else:
+            old_price = {"gasPrice": tx["gasPrice"]}
+
+        gas_pricing = ledger_api.try_get_gas_pricing(old_price=old_price)
+        if gas_pricing is None:
+            raise RuntimeError("Unable to reprice the transaction.")
+
+        tx.pop("maxFeePerGas", None)
+        tx.pop("gasPrice", None)
+        tx.pop("maxPriorityFeePerGas", None)
+        tx.update(gas_pricing)
+
     @staticmethod
     def _tx_timestamp(tx_hash: str, ledger_api: LedgerApi) -> int:
         receipt = ledger_api.api.eth.get_transaction_receipt(tx_hash)
@@ -491,12 +593,19 @@ class Provider(ABC):
     # TODO backport to open aea/autonomy
     # TODO This gas pricing management should possibly be done at a lower level in the library
     @staticmethod
-    def _update_with_gas_pricing(tx: t.Dict, ledger_api: LedgerApi) -> None:
+    def _update_with_gas_pricing(
+        tx: t.Dict,
+        ledger_api: LedgerApi,
+        gas_pricing_context: t.Optional[GasPricingContext] = None,
+    ) -> None:
         tx.pop("maxFeePerGas", None)
         tx.pop("gasPrice", None)
         tx.pop("maxPriorityFeePerGas", None)
 
-        gas_pricing = ledger_api.try_get_gas_pricing()
+        if gas_pricing_context is None:
+            gas_pricing = ledger_api.try_get_gas_pricing()
+        else:
+            gas_pricing = gas_pricing_context.get(ledger_api)
         if gas_pricing is None:
             raise RuntimeError("Unable to retrieve gas pricing.")
 
@@ -338,7 +338,9 @@ class RelayProvider(Provider):
                 tx["maxFeePerGas"] = int(tx.get("maxFeePerGas", 0))
                 tx["maxPriorityFeePerGas"] = int(tx.get("maxPriorityFeePerGas", 0))
                 tx["nonce"] = from_ledger_api.api.eth.get_transaction_count(tx["from"])
-                Provider._update_with_gas_pricing(tx, from_ledger_api)
+                Provider._update_with_gas_pricing(
+                    tx, from_ledger_api, kwargs.get("gas_pricing_context")
+                )
                 Provider._update_with_gas_estimate(tx, from_ledger_api)
                 txs.append((f"{step['id']}-{i}", tx))
 
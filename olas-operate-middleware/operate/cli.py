@@ -30,6 +30,7 @@ from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
 from http import HTTPStatus
 from pathlib import Path
+from time import time
 from types import FrameType
 
 import psutil
@@ -51,6 +52,7 @@ from operate.constants import (
     MIN_PASSWORD_LENGTH,
     OPERATE_HOME,
     SERVICES_DIR,
+    STAKING_PARAMS_JSON,
     USER_JSON,
     WALLETS_DIR,
     WALLET_RECOVERY_DIR,
@@ -74,6 +76,7 @@ from operate.quickstart.terminate_on_chain_service import terminate_service
 from operate.services.deployment_runner import stop_deployment_manager
 from operate.services.health_checker import HealthChecker
 from operate.utils import subtract_dicts
+from operate.utils.cache import BALANCES, ChainDataCache, StakingParamsStore
 from operate.utils.gnosis import get_assets_balances
 from operate.wallet.master import MasterWalletManager
 from operate.wallet.wallet_recovery_manager import (
@@ -125,6 +128,7 @@ class OperateApp:
             path=self._keys,
             logger=logger,
         )
+        StakingParamsStore().setup(path=self._path / STAKING_PARAMS_JSON)
         self.password: t.Optional[str] = os.environ.get("OPERATE_USER_PASSWORD")
 
         mm = MigrationManager(self._path, logger)
@@ -374,6 +378,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         with suppress(Exception):
             await watchdog_task
 
+        with suppress(Exception):
+            await health_checker.close()
+
     app = FastAPI(lifespan=lifespan)
 
     def set_parent_watchdog(app):
@@ -413,6 +420,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
         allow_headers=["*"],
         allow_credentials=True,
+        expose_headers=["Age"],
     )
 
     @app.middleware("http")
@@ -843,6 +851,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
 
         return JSONResponse(content=output)
 
+    @app.get("/api/v2/services/health_checker/metrics")
+    async def _get_health_checker_metrics(request: Request) -> JSONResponse:
+        """Get the health checker's probe latencies, fail counters and restart counts."""
+        return JSONResponse(content=health_checker.metrics)
+
     @app.get("/api/v2/service/{service_config_id}")
     async def _get_service(request: Request) -> JSONResponse:
         """Get a service."""
@@ -895,10 +908,17 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         if not operate.service_manager().exists(service_config_id=service_config_id):
             return service_not_found_error(service_config_id=service_config_id)
 
+        refill_requirements = operate.service_manager().refill_requirements(
+            service_config_id=service_config_id
+        )
+        # seconds since the oldest of the cached balances were read
+        fetched_at = ChainDataCache().fetched_at(
+            scope=service_config_id, data_classes=(BALANCES,)
+        )
+        age = int(time() - fetched_at) if fetched_at is not None else 0
         return JSONResponse(
-            content=operate.service_manager().refill_requirements(
-                service_config_id=service_config_id
-            )
+            content=refill_requirements,
+            headers={"Age": str(age)},
         )
 
     @app.post("/api/v2/service")
@@ -29,10 +29,12 @@ KEYS_DIR = "keys"
 WALLETS_DIR = "wallets"
 WALLET_RECOVERY_DIR = "wallet_recovery"
 DEPLOYMENT_DIR = "deployment"
+AGENT_PACKAGES_DIR = "agent_packages"
 DEPLOYMENT_JSON = "deployment.json"
 CONFIG_JSON = "config.json"
 USER_JSON = "user.json"
 HEALTHCHECK_JSON = "healthcheck.json"
+STAKING_PARAMS_JSON = "staking_params.json"
 
 AGENT_PERSISTENT_STORAGE_DIR = "persistent_data"
 AGENT_PERSISTENT_STORAGE_ENV_VAR = "STORE_PATH"
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Process-wide manager of the senders' nonces."""
+
+import typing as t
+from contextlib import contextmanager
+from threading import Lock
+
+from aea.crypto.base import LedgerApi
+
+from operate.operate_types import Chain
+from operate.utils import SingletonMeta
+
+
+SenderKey = t.Tuple[Chain, str]
+
+
+class NonceManager(metaclass=SingletonMeta):
+    """Process-wide manager of the nonces of each sender, per chain.
+
+    The nonces are assigned locally, so that the transactions of a sender can be
+    submitted back-to-back without waiting for the previous ones to be mined.
+    They are reconciled with the pending nonce of the chain on every reservation,
+    and after an error.
+    """
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self._nonces: t.Dict[SenderKey, int] = {}
+        self._locks: t.Dict[SenderKey, Lock] = {}
+        self._lock = Lock()
+
+    @contextmanager
+    def reserve(
+        self, ledger_api: LedgerApi, chain: Chain, address: str
+    ) -> t.Iterator[t.Callable[[], int]]:
+        """Hold the nonces of the sender, yielding a function that assigns the next one.
+
+        The transactions sent while the nonces are held get consecutive nonces. If an
+        error is raised, the nonces are reconciled with the pending nonce of the chain
+        on the next reservation.
+        """
+        key = (chain, address.lower())
+        with self._lock:
+            lock = self._locks.setdefault(key, Lock())
+
+        with lock:
+            pending_nonce = ledger_api.api.eth.get_transaction_count(address, "pending")
+            # the local nonce is ahead when the rpc does not see the last transactions yet
+            nonce = max(self._nonces.get(key, 0), pending_nonce)
+
+            def _next_nonce() -> int:
+                nonlocal nonce
+                nonce += 1
+                return nonce - 1
+
+            try:
+                yield _next_nonce
+            except BaseException:
+                self._nonces.pop(key, None)
+                raise
+            self._nonces[key] = nonce
+
+    def invalidate(
+        self, chain: t.Optional[Chain] = None, address: t.Optional[str] = None
+    ) -> None:
+        """Reconcile the nonces of the given chain and sender, or all of them if none is given."""
+        with self._lock:
+            for key in list(self._nonces):
+                key_chain, key_address = key
+                if chain not in (None, key_chain) or (
+                    address is not None and address.lower() != key_address
+                ):
+                    continue
+                del self._nonces[key]
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Process-wide pool of ledger APIs."""
+
+import typing as t
+from copy import deepcopy
+from threading import Lock
+
+from aea.crypto.base import LedgerApi
+from aea.crypto.registries import make_ledger_api
+from aea_ledger_ethereum import DEFAULT_GAS_PRICE_STRATEGIES, EIP1559, GWEI, to_wei
+from web3.middleware import simple_cache_middleware
+
+from operate.ledger import get_default_rpc
+from operate.operate_types import Chain, LedgerType
+from operate.utils import SingletonMeta
+
+
+LedgerApiKey = t.Tuple[LedgerType, Chain, str]
+
+# chains which produce blocks with extra data that need to be parsed as in proof of authority chains
+POA_CHAINS = (Chain.OPTIMISM,)
+# chains with a lower fallback for the max fee per gas
+LOW_FEE_CHAINS = (Chain.BASE, Chain.MODE, Chain.OPTIMISM)
+
+
+def make_chain_ledger_api(ledger_type: LedgerType, chain: Chain, rpc: str) -> LedgerApi:
+    """Make a new ledger api object for the given chain."""
+    gas_price_strategies = deepcopy(DEFAULT_GAS_PRICE_STRATEGIES)
+    if chain in LOW_FEE_CHAINS:
+        gas_price_strategies[EIP1559]["fallback_estimate"]["maxFeePerGas"] = to_wei(
+            5, GWEI
+        )
+
+    ledger_api = make_ledger_api(
+        ledger_type.name.lower(),
+        address=rpc,
+        chain_id=chain.id,
+        gas_price_strategies=gas_price_strategies,
+        poa_chain=chain in POA_CHAINS,
+    )
+    # caches the responses which never change for an rpc, such as the chain id
+    ledger_api.api.middleware_onion.add(
+        simple_cache_middleware, name="simple_cache_middleware"
+    )
+    return ledger_api
+
+
+class LedgerApiPool(metaclass=SingletonMeta):
+    """Process-wide pool of ledger api objects, reused across calls for the same ledger type, chain and rpc.
+
+    The web3 provider of each object keeps its HTTP sessions alive between requests,
+    and the chain id is only requested once per object.
+    """
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self._ledger_apis: t.Dict[LedgerApiKey, LedgerApi] = {}
+        self._lock = Lock()
+
+    def get(
+        self,
+        ledger_type: LedgerType,
+        chain: Chain,
+        rpc: t.Optional[str] = None,
+    ) -> LedgerApi:
+        """Get the ledger api object for the given chain, creating it if it does not exist."""
+        key = (ledger_type, chain, rpc or get_default_rpc(chain=chain))
+        with self._lock:
+            if key not in self._ledger_apis:
+                self._ledger_apis[key] = make_chain_ledger_api(*key)
+            return self._ledger_apis[key]
+
+    def invalidate(
+        self,
+        chain: t.Optional[Chain] = None,
+        rpc: t.Optional[str] = None,
+    ) -> None:
+        """Remove the ledger api objects of the given chain and rpc, or all of them if none is given."""
+        with self._lock:
+            for key in list(self._ledger_apis):
+                _, key_chain, key_rpc = key
+                if chain not in (None, key_chain) or rpc not in (None, key_rpc):
+                    continue
+                del self._ledger_apis[key]
@@ -20,6 +20,7 @@
 """Local resource representation."""
 
 import enum
+import functools
 import json
 import os
 import platform
@@ -27,7 +28,7 @@ import shutil
 import time
 import types
 import typing as t
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 
 
@@ -37,16 +38,41 @@ from pathlib import Path
 N_BACKUPS = 5
 
 
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _identity(obj: t.Any) -> t.Any:
+    """Return the object as is."""
+    return obj
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_field_names(cls: t.Type) -> t.Tuple[str, ...]:
+    """Get the names of the fields of a dataclass."""
+    return tuple(field.name for field in fields(cls))
+
+
 def serialize(obj: t.Any) -> t.Any:
     """Serialize object."""
-    if is_dataclass(obj):
-        return serialize(asdict(obj))
+    if type(obj) in _PRIMITIVE_TYPES:
+        return obj
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # same output as `serialize(asdict(obj))` without deep copying the fields first
+        return {
+            name: serialize(getattr(obj, name))
+            for name in _dataclass_field_names(type(obj))
+        }
     if isinstance(obj, Path):
         return str(obj)
     if isinstance(obj, dict):
         return {serialize(key): serialize(obj=value) for key, value in obj.items()}
     if isinstance(obj, list):
         return [serialize(obj=value) for value in obj]
+    if isinstance(obj, tuple):
+        # `asdict` recurses into the tuples and namedtuples of the fields too
+        if hasattr(obj, "_fields"):
+            return type(obj)(*(serialize(obj=value) for value in obj))
+        return type(obj)(serialize(obj=value) for value in obj)
     if isinstance(obj, enum.Enum):
         return obj.value
     if isinstance(obj, bytes):
@@ -54,46 +80,70 @@ def serialize(obj: t.Any) -> t.Any:
     return obj
 
 
-def deserialize(obj: t.Any, otype: t.Any) -> t.Any:
-    """Desrialize a json object."""
+def _build_deserializer(otype: t.Any) -> t.Callable[[t.Any], t.Any]:
+    """Build the deserializer of a type from its type hints."""
 
     origin = getattr(otype, "__origin__", None)
 
     # Handle Union and Optional
     # types.UnionType only exists in Python 3.10+
-    is_union_type = hasattr(types, 'UnionType') and isinstance(otype, types.UnionType)
+    is_union_type = hasattr(types, "UnionType") and isinstance(otype, types.UnionType)
     if origin is t.Union or is_union_type:
-        for arg in t.get_args(otype):
-            if arg is type(None):  # noqa: E721
-                continue
-            try:
-                return deserialize(obj, arg)
-            except Exception:  # pylint: disable=broad-except  # nosec
-                continue
-        return None
+        members = tuple(
+            _get_deserializer(arg)
+            for arg in t.get_args(otype)
+            if arg is not type(None)  # noqa: E721
+        )
+
+        def _deserialize_union(obj: t.Any) -> t.Any:
+            for member in members:
+                try:
+                    return member(obj)
+                except Exception:  # pylint: disable=broad-except  # nosec
+                    continue
+            return None
+
+        return _deserialize_union
 
     base = getattr(otype, "__class__")  # noqa: B009
     if base.__name__ == "_GenericAlias":  # type: ignore
         args = otype.__args__  # type: ignore
         if len(args) == 1:
-            (atype,) = args
-            return [deserialize(arg, atype) for arg in obj]
+            item = _get_deserializer(args[0])
+            if item is _identity:
+                return list
+            return lambda obj: [item(arg) for arg in obj]
         if len(args) == 2:
-            (ktype, vtype) = args
-            return {
-                deserialize(key, ktype): deserialize(val, vtype)
-                for key, val in obj.items()
-            }
-        return obj
+            key, value = map(_get_deserializer, args)
+            if key is _identity and value is _identity:
+                return lambda obj: dict(obj.items())
+            return lambda obj: {key(k): value(v) for k, v in obj.items()}
+        return _identity
     if base is enum.EnumMeta:
-        return otype(obj)
+        return otype
     if otype is Path:
-        return Path(obj)
+        return Path
     if is_dataclass(otype):
-        return otype.from_json(obj)
+        return lambda obj: otype.from_json(obj)
     if otype is bytes:
-        return bytes.fromhex(obj)
-    return obj
+        return bytes.fromhex
+    return _identity
+
+
+_compile_deserializer = functools.lru_cache(maxsize=None)(_build_deserializer)
+
+
+def _get_deserializer(otype: t.Any) -> t.Callable[[t.Any], t.Any]:
+    """Get the deserializer of a type, compiled once per type."""
+    try:
+        return _compile_deserializer(otype)
+    except TypeError:  # unhashable type hints are not cached
+        return _build_deserializer(otype)
+
+
+def deserialize(obj: t.Any, otype: t.Any) -> t.Any:
+    """Desrialize a json object."""
+    return _get_deserializer(otype)(obj)
 
 
 def _safe_file_operation(operation: t.Callable, *args: t.Any, **kwargs: t.Any) -> None:
@@ -118,28 +168,57 @@ class LocalResource:
 
     _file: t.Optional[str] = None
 
+    # codecs compiled once per class from the type hints, see `_json_fields` and `_from_json_plan`
+    _json_fields_cache: t.Dict[t.Type, t.Tuple[str, ...]] = {}
+    _from_json_plan_cache: t.Dict[
+        t.Type, t.Tuple[t.Tuple[str, t.Callable[[t.Any], t.Any]], ...]
+    ] = {}
+
     def __init__(self, path: t.Optional[Path] = None) -> None:
         """Initialize local resource."""
         self.path = path
 
+    def _json_fields(self) -> t.Tuple[str, ...]:
+        """Get the names of the fields to serialize."""
+        cls = type(self)
+        names = LocalResource._json_fields_cache.get(cls)
+        if names is None:
+            names = tuple(
+                pname
+                for pname in self.__annotations__
+                if not pname.startswith("_") and pname != "path"
+            )
+            LocalResource._json_fields_cache[cls] = names
+        return names
+
+    @classmethod
+    def _from_json_plan(
+        cls,
+    ) -> t.Tuple[t.Tuple[str, t.Callable[[t.Any], t.Any]], ...]:
+        """Get the names and deserializers of the fields to deserialize."""
+        plan = LocalResource._from_json_plan_cache.get(cls)
+        if plan is None:
+            plan = tuple(
+                (pname, _get_deserializer(ptype))
+                for pname, ptype in cls.__annotations__.items()
+                if not pname.startswith("_")
+            )
+            LocalResource._from_json_plan_cache[cls] = plan
+        return plan
+
     @property
     def json(self) -> t.Dict:
         """To dictionary object."""
-        obj = {}
-        for pname, _ in self.__annotations__.items():
-            if pname.startswith("_") or pname == "path":
-                continue
-            obj[pname] = serialize(self.__dict__[pname])
-        return obj
+        values = self.__dict__
+        return {pname: serialize(values[pname]) for pname in self._json_fields()}
 
     @classmethod
     def from_json(cls, obj: t.Dict) -> "LocalResource":
         """Load LocalResource from json."""
-        kwargs = {}
-        for pname, ptype in cls.__annotations__.items():
-            if pname.startswith("_"):
-                continue
-            kwargs[pname] = deserialize(obj=obj[pname], otype=ptype)
+        kwargs = {
+            pname: deserializer(obj[pname])
+            for pname, deserializer in cls._from_json_plan()
+        }
         return cls(**kwargs)
 
     @classmethod
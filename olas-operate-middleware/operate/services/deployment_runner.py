@@ -26,6 +26,7 @@ import platform
 import shutil  # nosec
 import subprocess  # nosec
 import sys  # nosec
+import tempfile
 import time
 import typing as t
 from abc import ABC, ABCMeta, abstractmethod
@@ -103,6 +104,7 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
     TM_CONTROL_URL = constants.TM_CONTROL_URL
     SLEEP_BEFORE_TM_KILL = 2  # seconds
     START_TRIES = constants.DEPLOYMENT_START_TRIES_NUM
+    AGENT_PACKAGES_CACHE_SIZE = 3  # per agent
     logger = setup_logger(name="operate.base_deployment_runner")
 
     def _open_agent_runner_log_file(self) -> TextIOWrapper:
@@ -182,6 +184,96 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
         )
         return env
 
+    def _operate_home(self) -> t.Optional[Path]:
+        """Get the operate home of the deployment, or None if it is not in a services directory."""
+        for path in Path(self._work_directory).resolve().parents:
+            if path.name == constants.SERVICES_DIR:
+                return path.parent
+        return None
+
+    def _agent_package_cache_path(self) -> t.Optional[Path]:
+        """Get the cache path of the agent package, or None if it cannot be cached."""
+        env = json.loads(
+            (self._work_directory / "agent.json").read_text(encoding="utf-8")
+        )
+        author_name, *version_hash = env["AEA_AGENT"].split(":")
+        operate_home = self._operate_home()
+        # only the packages which are content-addressed are cached
+        if len(version_hash) != 2 or operate_home is None:
+            return None
+        author, name = author_name.split("/")
+        return (
+            operate_home
+            / constants.AGENT_PACKAGES_DIR
+            / f"{author}_{name}_{version_hash[1]}"
+        )
+
+    def is_agent_package_cached(self) -> bool:
+        """Check whether the agent package can be set up without fetching it."""
+        try:
+            cache_path = self._agent_package_cache_path()
+        except (OSError, ValueError, KeyError):
+            return False
+        return cache_path is not None and cache_path.exists()
+
+    def _store_agent_package(self, agent_dir: Path, cache_path: Path) -> None:
+        """Store a fetched agent package in the cache, keeping the most recent ones."""
+        # each deployment stages the package in its own directory
+        tmp_path: t.Optional[Path] = None
+        try:
+            tmp_path = Path(
+                tempfile.mkdtemp(
+                    dir=cache_path.parent, prefix=f"{cache_path.name}.tmp-"
+                )
+            )
+            shutil.copytree(agent_dir, tmp_path, dirs_exist_ok=True)
+            tmp_path.rename(cache_path)
+        except OSError:
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            if cache_path.exists():
+                # another deployment of the same agent stored it first
+                self.logger.info(f"The agent package {cache_path} is already cached")
+            else:
+                self.logger.exception(f"Failed to cache the agent package {cache_path}")
+            return
+
+        # the cached packages of the same agent differ by their hash
+        prefix = cache_path.name.rsplit("_", 1)[0] + "_"
+        cached = sorted(
+            (
+                path
+                for path in cache_path.parent.iterdir()
+                if path.name.startswith(prefix) and ".tmp-" not in path.name
+            ),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in cached[self.AGENT_PACKAGES_CACHE_SIZE :]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _fetch_agent(self, env: Dict, agent_dir: Path) -> None:
+        """Fetch the agent package, reusing the cached one when possible."""
+        working_dir = self._work_directory
+        cache_path = self._agent_package_cache_path()
+        if cache_path is not None and cache_path.exists():
+            self.logger.info(f"Using the cached agent package {cache_path}")
+            shutil.copytree(cache_path, agent_dir)
+            os.utime(cache_path)
+            return
+
+        self._run_aea_command(
+            "-s",
+            "fetch",
+            env["AEA_AGENT"],
+            "--alias",
+            agent_dir.name,
+            cwd=working_dir,
+        )
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._store_agent_package(agent_dir=agent_dir, cache_path=cache_path)
+
     def _setup_agent(self) -> None:
         """Setup agent."""
         working_dir = self._work_directory
@@ -208,24 +300,27 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
             with suppress(Exception):
                 shutil.rmtree(agent_dir_full_path, ignore_errors=True)
 
-        self._run_aea_command(
-            "-s",
-            "fetch",
-            env["AEA_AGENT"],
-            "--alias",
-            agent_alias_name,
-            cwd=working_dir,
-        )
+        # the package is cached before the keys are added
+        self._fetch_agent(env=env, agent_dir=agent_dir_full_path)
 
-        # Add keys
-        shutil.copy(
-            working_dir / "ethereum_private_key.txt",
-            working_dir / "agent" / "ethereum_private_key.txt",
-        )
+        try:
+            # Add keys
+            shutil.copy(
+                working_dir / "ethereum_private_key.txt",
+                working_dir / "agent" / "ethereum_private_key.txt",
+            )
 
-        self._run_aea_command("-s", "add-key", "ethereum", cwd=working_dir / "agent")
+            self._run_aea_command(
+                "-s", "add-key", "ethereum", cwd=working_dir / "agent"
+            )
 
-        self._run_aea_command("-s", "issue-certificates", cwd=working_dir / "agent")
+            self._run_aea_command("-s", "issue-certificates", cwd=working_dir / "agent")
+        except Exception:
+            # the next start attempt fetches the package again
+            cache_path = self._agent_package_cache_path()
+            if cache_path is not None:
+                shutil.rmtree(cache_path, ignore_errors=True)
+            raise
 
     def start(self) -> None:
         """Start the deployment with retries."""
@@ -711,13 +806,16 @@ class DeploymentManager:
         if self.get_state(build_dir=build_dir) in [States.STARTING, States.STOPPING]:
             raise ValueError("Service already in transition")
 
+        deployment_runner = self._get_deployment_runner(build_dir=build_dir)
+
         # doing pre check for ipfs works fine, also network connection is ok.
-        self.check_ipfs_connection_works()
+        # not needed when the agent package is cached, as it is not fetched.
+        if not deployment_runner.is_agent_package_cached():
+            self.check_ipfs_connection_works()
 
         self.logger.info(f"Starting deployment {build_dir}...")
         self._states[build_dir] = States.STARTING
         try:
-            deployment_runner = self._get_deployment_runner(build_dir=build_dir)
             deployment_runner.start()
             self.logger.info(f"Started deployment {build_dir}")
             self._states[build_dir] = States.STARTED
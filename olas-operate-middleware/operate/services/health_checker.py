@@ -21,11 +21,13 @@
 import asyncio
 import json
 import logging
+import random
+import time
 import typing as t
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from http import HTTPStatus
 from pathlib import Path
-from traceback import print_exc
 
 import aiohttp  # type: ignore
 
@@ -33,214 +35,322 @@ from operate.constants import HEALTHCHECK_JSON, HEALTH_CHECK_URL
 from operate.services.manage import ServiceManager  # type: ignore
 
 
+@dataclass
+class ServiceHealth:
+    """Health check state and metrics of a service."""
+
+    service_path: Path
+    port_up: bool = False
+    port_wait_started_at: float = field(default_factory=time.monotonic)
+    next_probe_at: float = 0.0
+    fails: int = 0
+    probing: bool = False
+    restarting: bool = False
+    probes: int = 0
+    restarts: int = 0
+    last_probe_latency: t.Optional[float] = None
+    total_probe_latency: float = 0.0
+
+    @property
+    def metrics(self) -> t.Dict:
+        """Get the metrics of the service."""
+        return {
+            "port_up": self.port_up,
+            "restarting": self.restarting,
+            "fails": self.fails,
+            "probes": self.probes,
+            "restarts": self.restarts,
+            "last_probe_latency": self.last_probe_latency,
+            "average_probe_latency": (
+                self.total_probe_latency / self.probes if self.probes else None
+            ),
+        }
+
+
 class HealthChecker:
-    """Health checker manager."""
+    """Health checker manager.
+
+    A single scheduler task probes all the services over a shared HTTP session,
+    and the restarts run on a bounded shared executor.
+    """
 
     SLEEP_PERIOD_DEFAULT = 30
     PORT_UP_TIMEOUT_DEFAULT = 300  # seconds
+    PORT_UP_SLEEP_PERIOD_DEFAULT = 15
     REQUEST_TIMEOUT_DEFAULT = 90
     NUMBER_OF_FAILS_DEFAULT = 300
+    RESTART_WORKERS_DEFAULT = 2
+    JITTER = 0.1  # fraction of the probe period
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         service_manager: ServiceManager,
         logger: logging.Logger,
         port_up_timeout: t.Optional[int] = None,
         sleep_period: t.Optional[int] = None,
         number_of_fails: t.Optional[int] = None,
+        port_up_sleep_period: t.Optional[int] = None,
+        restart_workers: t.Optional[int] = None,
     ) -> None:
         """Init the healtch checker."""
-        self._jobs: t.Dict[str, asyncio.Task] = {}
+        self._services: t.Dict[str, ServiceHealth] = {}
         self._service_manager = service_manager
         self.logger = logger
         self.port_up_timeout = port_up_timeout or self.PORT_UP_TIMEOUT_DEFAULT
         self.sleep_period = sleep_period or self.SLEEP_PERIOD_DEFAULT
         self.number_of_fails = number_of_fails or self.NUMBER_OF_FAILS_DEFAULT
+        self.port_up_sleep_period = (
+            port_up_sleep_period or self.PORT_UP_SLEEP_PERIOD_DEFAULT
+        )
+        self._restart_executor = ThreadPoolExecutor(
+            max_workers=restart_workers or self.RESTART_WORKERS_DEFAULT,
+            thread_name_prefix="health_checker_restart",
+        )
+        self._scheduler: t.Optional[asyncio.Task] = None
+        self._wakeup: t.Optional[asyncio.Event] = None
+        self._session: t.Optional[aiohttp.ClientSession] = None
+        self._tasks: t.Set[asyncio.Task] = set()
+        self._restarts = 0
 
     def start_for_service(self, service_config_id: str) -> None:
         """Start for a specific service."""
         self.logger.info(
             f"[HEALTH_CHECKER]: Starting healthcheck job for {service_config_id}"
         )
-        if service_config_id in self._jobs:
+        if service_config_id in self._services:
             self.stop_for_service(service_config_id=service_config_id)
 
-        loop = asyncio.get_running_loop()
-        self._jobs[service_config_id] = loop.create_task(
-            self.healthcheck_job(
-                service_config_id=service_config_id,
-            )
+        self._services[service_config_id] = ServiceHealth(
+            service_path=self._service_manager.load(service_config_id).path
         )
+        self._ensure_scheduler()
+        self._wake_up()
 
     def stop_for_service(self, service_config_id: str) -> None:
         """Stop for a specific service."""
-        if service_config_id not in self._jobs:
+        if service_config_id not in self._services:
             return
         self.logger.info(
             f"[HEALTH_CHECKER]: Cancelling existing healthcheck_jobs job for {service_config_id}"
         )
-        status = self._jobs[service_config_id].cancel()
-        if not status:
-            self.logger.info(
-                f"[HEALTH_CHECKER]: Healthcheck job cancellation for {service_config_id} failed"
+        # the results of an in-flight probe or restart of the service are discarded
+        del self._services[service_config_id]
+
+    @property
+    def metrics(self) -> t.Dict:
+        """Get the probe latencies, fail counters and restart counts."""
+        return {
+            "restarts": self._restarts,
+            "services": {
+                service_config_id: state.metrics
+                for service_config_id, state in self._services.items()
+            },
+        }
+
+    async def close(self) -> None:
+        """Stop the scheduler and release the shared session and executor."""
+        self._services.clear()
+        tasks = [*self._tasks, *([self._scheduler] if self._scheduler else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._scheduler = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._restart_executor.shutdown(wait=False)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by all the probes."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT_DEFAULT)
             )
+        return self._session
 
     async def check_service_health(
         self, service_config_id: str, service_path: t.Optional[Path] = None
     ) -> bool:
         """Check the service health"""
         del service_config_id
-        timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT_DEFAULT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(HEALTH_CHECK_URL) as resp:
-                try:
-                    status = resp.status
-
-                    if status != HTTPStatus.OK:
-                        # not HTTP OK -> not healthy for sure
-                        content = await resp.text()
-                        self.logger.warning(
-                            f"[HEALTH_CHECKER] Bad http status code : {status} content: {content}. not healthy!"
-                        )
-                        return False
-
-                    response_json = await resp.json()
-
-                    if service_path:
-                        healthcheck_json_path = service_path / HEALTHCHECK_JSON
-                        healthcheck_json_path.write_text(
-                            json.dumps(response_json, indent=2), encoding="utf-8"
-                        )
-
-                    return response_json.get(
-                        "is_healthy", response_json.get("is_transitioning_fast", False)
-                    )  # TODO: remove is_transitioning_fast after all the services start reporting is_healthy
-                except Exception as e:  # pylint: disable=broad-except
-                    self.logger.error(
-                        f"[HEALTH_CHECKER] error {e}. set not healthy!", exc_info=True
+        async with self._get_session().get(HEALTH_CHECK_URL) as resp:
+            try:
+                status = resp.status
+
+                if status != HTTPStatus.OK:
+                    # not HTTP OK -> not healthy for sure
+                    content = await resp.text()
+                    self.logger.warning(
+                        f"[HEALTH_CHECKER] Bad http status code : {status} content: {content}. not healthy!"
                     )
                     return False
 
-    async def healthcheck_job(
-        self,
-        service_config_id: str,
-    ) -> None:
-        """Start a background health check job."""
+                response_json = await resp.json()
 
-        service_path = self._service_manager.load(service_config_id).path
-        try:
-            self.logger.info(
-                f"[HEALTH_CHECKER] Start healthcheck job for service: {service_config_id}"
+                if service_path:
+                    healthcheck_json_path = service_path / HEALTHCHECK_JSON
+                    healthcheck_json_path.write_text(
+                        json.dumps(response_json, indent=2), encoding="utf-8"
+                    )
+
+                return response_json.get(
+                    "is_healthy", response_json.get("is_transitioning_fast", False)
+                )  # TODO: remove is_transitioning_fast after all the services start reporting is_healthy
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(
+                    f"[HEALTH_CHECKER] error {e}. set not healthy!", exc_info=True
+                )
+                return False
+
+    def _ensure_scheduler(self) -> None:
+        """Start the scheduler, if it is not running."""
+        if self._scheduler is None or self._scheduler.done():
+            self._wakeup = asyncio.Event()
+            self._scheduler = asyncio.get_running_loop().create_task(self._schedule())
+
+    def _wake_up(self) -> None:
+        """Wake the scheduler up to reschedule the probes."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _spawn(self, coroutine: t.Coroutine) -> None:
+        """Run a probe or a restart in the background."""
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _schedule_probe(self, state: ServiceHealth, period: float) -> None:
+        """Schedule the next probe of a service, jittered so that they spread out."""
+        state.next_probe_at = time.monotonic() + period * random.uniform(  # nosec
+            1 - self.JITTER, 1 + self.JITTER
+        )
+
+    async def _schedule(self) -> None:
+        """Start the due probes of all the services, sleeping until the next one is due."""
+        wakeup = t.cast(asyncio.Event, self._wakeup)
+        while True:
+            wakeup.clear()
+            now = time.monotonic()
+            idle = [
+                (service_config_id, state)
+                for service_config_id, state in self._services.items()
+                if not (state.probing or state.restarting)
+            ]
+            for service_config_id, state in idle:
+                if state.next_probe_at <= now:
+                    state.probing = True
+                    self._spawn(self._probe(service_config_id, state))
+
+            next_probe_at = min(
+                (state.next_probe_at for _, state in idle if not state.probing),
+                default=None,
+            )
+            timeout = (
+                None
+                if next_probe_at is None
+                else max(next_probe_at - time.monotonic(), 0)
             )
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
 
-            async def _wait_for_port(sleep_period: int = 15) -> None:
-                self.logger.info("[HEALTH_CHECKER]: wait port is up")
-                while True:
-                    try:
-                        await self.check_service_health(service_config_id, service_path)
-                        self.logger.info("[HEALTH_CHECKER]: port is UP")
-                        return
-                    except aiohttp.ClientConnectionError:
-                        self.logger.error(
-                            "[HEALTH_CHECKER]: error connecting http port"
-                        )
-                    await asyncio.sleep(sleep_period)
-
-            async def _check_port_ready(
-                timeout: int = self.port_up_timeout, sleep_period: int = 15
-            ) -> bool:
-                try:
-                    await asyncio.wait_for(
-                        _wait_for_port(sleep_period=sleep_period), timeout=timeout
-                    )
-                    return True
-                except asyncio.TimeoutError:
-                    return False
+    async def _probe(self, service_config_id: str, state: ServiceHealth) -> None:
+        """Probe a service, restarting it if it is not healthy for too long."""
+        started_at = time.monotonic()
+        try:
+            healthy = await self.check_service_health(
+                service_config_id, state.service_path
+            )
+            reachable = True
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(
+                f"[HEALTH_CHECKER] {service_config_id} port read failed. assume not healthy {e}"
+            )
+            healthy = reachable = False
+        latency = time.monotonic() - started_at
 
-            async def _check_health(
-                number_of_fails: int = 5, sleep_period: int = self.sleep_period
-            ) -> None:
-                fails = 0
-                while True:
-                    try:
-                        # Check the service health
-                        healthy = await self.check_service_health(
-                            service_config_id, service_path
-                        )
-                    except aiohttp.ClientConnectionError as e:
-                        print_exc()
-                        self.logger.warning(
-                            f"[HEALTH_CHECKER] {service_config_id} port read failed. assume not healthy {e}"
-                        )
-                        healthy = False
-
-                    if not healthy:
-                        fails += 1
-                        self.logger.warning(
-                            f"[HEALTH_CHECKER] {service_config_id} not healthy for {fails} time in a row"
-                        )
-                    else:
-                        self.logger.info(
-                            f"[HEALTH_CHECKER] {service_config_id} is HEALTHY"
-                        )
-                        # reset fails if comes healty
-                        fails = 0
-
-                    if fails >= number_of_fails:
-                        # too much fails, exit
-                        self.logger.error(
-                            f"[HEALTH_CHECKER]  {service_config_id} failed {fails} times in a row. restart"
-                        )
-                        return
-
-                    await asyncio.sleep(sleep_period)
-
-            async def _restart(
-                service_manager: ServiceManager, service_config_id: str
-            ) -> None:
-                def _do_restart() -> None:
-                    service_manager.stop_service_locally(
-                        service_config_id=service_config_id,
-                        use_docker=True,
-                    )
-                    service_manager.deploy_service_locally(
-                        service_config_id=service_config_id,
-                        use_docker=True,
-                    )
+        try:
+            if self._services.get(service_config_id) is not state:
+                return
+            state.probing = False
+            state.probes += 1
+            state.last_probe_latency = latency
+            state.total_probe_latency += latency
 
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor() as executor:
-                    future = loop.run_in_executor(executor, _do_restart)
-                    await future
-                    exception = future.exception()
-                    if exception is not None:
-                        raise exception
-
-            # upper cycle
-            while True:
-                self.logger.info(
-                    f"[HEALTH_CHECKER] {service_config_id} wait for port ready"
-                )
-                if await _check_port_ready(timeout=self.port_up_timeout):
-                    # blocking till restart needed
+            if not state.port_up:
+                if reachable:
                     self.logger.info(
                         f"[HEALTH_CHECKER]  {service_config_id} port is ready, checking health every {self.sleep_period}"
                     )
-                    await _check_health(
-                        number_of_fails=self.number_of_fails,
-                        sleep_period=self.sleep_period,
-                    )
-
-                else:
+                    state.port_up = True
+                    state.next_probe_at = time.monotonic()
+                elif (
+                    time.monotonic() - state.port_wait_started_at
+                    >= self.port_up_timeout
+                ):
                     self.logger.info(
-                        "[HEALTH_CHECKER] port not ready within timeout. restart deployment"
+                        f"[HEALTH_CHECKER] {service_config_id} port not ready within timeout. restart deployment"
                     )
+                    self._schedule_restart(service_config_id, state)
+                else:
+                    self._schedule_probe(state, self.port_up_sleep_period)
+                return
+
+            if healthy:
+                self.logger.info(f"[HEALTH_CHECKER] {service_config_id} is HEALTHY")
+                # reset fails if comes healty
+                state.fails = 0
+            else:
+                state.fails += 1
+                self.logger.warning(
+                    f"[HEALTH_CHECKER] {service_config_id} not healthy for {state.fails} time in a row"
+                )
+
+            if state.fails >= self.number_of_fails:
+                self.logger.error(
+                    f"[HEALTH_CHECKER]  {service_config_id} failed {state.fails} times in a row. restart"
+                )
+                self._schedule_restart(service_config_id, state)
+                return
+            self._schedule_probe(state, self.sleep_period)
+        finally:
+            self._wake_up()
+
+    def _schedule_restart(self, service_config_id: str, state: ServiceHealth) -> None:
+        """Restart a service in the background, without probing it meanwhile."""
+        state.restarting = True
+        state.restarts += 1
+        self._restarts += 1
+        self._spawn(self._restart(service_config_id, state))
+
+    async def _restart(self, service_config_id: str, state: ServiceHealth) -> None:
+        """Restart a service on the shared executor, then wait for its port again."""
+
+        def _do_restart() -> None:
+            self._service_manager.stop_service_locally(
+                service_config_id=service_config_id,
+                use_docker=True,
+            )
+            self._service_manager.deploy_service_locally(
+                service_config_id=service_config_id,
+                use_docker=True,
+            )
 
-                # perform restart
-                # TODO: blocking!!!!!!!
-                await _restart(self._service_manager, service_config_id)
-        except Exception:
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._restart_executor, _do_restart
+            )
+        except Exception:  # pylint: disable=broad-except
             self.logger.exception(
-                f"Problems running healthcheck job for {service_config_id}"
+                f"Problems restarting the deployment of {service_config_id}"
+            )
+        finally:
+            state.restarting = False
+            state.port_up = False
+            state.fails = 0
+            state.port_wait_started_at = state.next_probe_at = time.monotonic()
+            self.logger.info(
+                f"[HEALTH_CHECKER] {service_config_id} wait for port ready"
             )
-            raise
+            self._wake_up()
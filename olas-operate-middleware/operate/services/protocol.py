@@ -29,6 +29,7 @@ import tempfile
 import typing as t
 from enum import Enum
 from pathlib import Path
+from threading import Lock
 from typing import Optional, Union, cast
 
 from aea.configurations.data_types import PackageType
@@ -70,16 +71,27 @@ from operate.data.contracts.recovery_module.contract import RecoveryModule
 from operate.data.contracts.staking_token.contract import StakingTokenContract
 from operate.operate_types import Chain as OperateChain
 from operate.operate_types import ContractAddresses
+from operate.utils.cache import ChainDataCache, STAKING_PARAMS, StakingParamsStore
 from operate.utils.gnosis import (
     MultiSendOperation,
     SafeOperation,
     hash_payload_to_hex,
+    multicall,
     skill_input_hex_to_payload,
 )
 from operate.wallet.master import MasterWallet
 
 
 ETHEREUM_ERC20 = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
+# Staking params read from the staking contract, by the getter which reads each of them
+STAKING_PARAMS_FUNCTIONS = {
+    "agent_ids": "getAgentIds",
+    "service_registry": "serviceRegistry",
+    "staking_token": "stakingToken",
+    "service_registry_token_utility": "serviceRegistryTokenUtility",
+    "min_staking_deposit": "minStakingDeposit",
+    "activity_checker": "activityChecker",
+}
 
 
 class StakingState(Enum):
@@ -572,11 +584,14 @@ class MintManager(MintHelper):
 # End Backport
 
 
+# the chain and contract configs, and the environment, are shared by the whole
+# process, so the chain utils of concurrent threads patch them one at a time
+_CHAIN_CONFIGS_LOCK = Lock()
+
+
 class _ChainUtil:
     """On chain service management."""
 
-    _cache = {}
-
     def __init__(
         self,
         rpc: str,
@@ -589,13 +604,15 @@ class _ChainUtil:
         self.wallet = wallet
         self.contracts = contracts
         self.chain_type = chain_type or ChainType.CUSTOM
-        os.environ[f"{self.chain_type.name}_CHAIN_RPC"] = self.rpc
+        with _CHAIN_CONFIGS_LOCK:
+            os.environ[f"{self.chain_type.name}_CHAIN_RPC"] = self.rpc
 
     def _patch(self) -> None:
         """Patch contract and chain config."""
-        ChainConfigs.get(self.chain_type).rpc = self.rpc
-        for name, address in self.contracts.items():
-            ContractConfigs.get(name=name).contracts[self.chain_type] = address
+        with _CHAIN_CONFIGS_LOCK:
+            ChainConfigs.get(self.chain_type).rpc = self.rpc
+            for name, address in self.contracts.items():
+                ContractConfigs.get(name=name).contracts[self.chain_type] = address
 
     @property
     def safe(self) -> str:
@@ -869,16 +886,117 @@ class _ChainUtil:
         if staking_contract is None and fallback_params is not None:
             return fallback_params
 
-        cache = _ChainUtil._cache
-        if staking_contract in cache.setdefault("get_staking_params", {}):
-            return cache["get_staking_params"][staking_contract]
+        return ChainDataCache().get(
+            data_class=STAKING_PARAMS,
+            chain=self.chain_type.value,
+            scope=staking_contract,
+            compute=lambda: self._get_staking_params(staking_contract),
+        )
 
-        self._patch()
-        staking_manager = StakingManager(
-            key=self.wallet.key_path,
-            password=self.wallet.password,
-            chain_type=self.chain_type,
+    def _get_staking_params(self, staking_contract: str) -> t.Dict:
+        """Read the staking params from the staking contract, with a single multicall if possible.
+
+        Only the params read through the multicall are persisted, as the fallback cannot
+        tell a failed call from a contract that is not a dual staking contract.
+        """
+
+        def _staking_manager() -> StakingManager:
+            self._patch()
+            return StakingManager(
+                key=self.wallet.key_path,
+                password=self.wallet.password,
+                chain_type=self.chain_type,
+            )
+
+        try:
+            return StakingParamsStore().get(
+                chain=self.chain_type.value,
+                staking_contract=staking_contract,
+                compute=lambda: self._get_multicall_staking_params(
+                    staking_manager=_staking_manager(),
+                    staking_contract=staking_contract,
+                ),
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logging.warning(
+                f"Cannot read the staking params of {staking_contract} through Multicall3, "
+                f"falling back to one call per param: {e}"
+            )
+        return self._get_staking_params_one_by_one(
+            staking_manager=_staking_manager(), staking_contract=staking_contract
         )
+
+    def _get_multicall_staking_params(
+        self, staking_manager: StakingManager, staking_contract: str
+    ) -> t.Dict:
+        """Read the staking params from the staking contract with a single multicall."""
+        staking_instance = staking_manager.staking_ctr.get_instance(
+            ledger_api=self.ledger_api,
+            contract_address=staking_contract,
+        )
+        dual_staking_instance = staking_manager.dual_staking_ctr.get_instance(
+            ledger_api=self.ledger_api,
+            contract_address=staking_contract,
+        )
+        functions = {
+            param: getattr(staking_instance.functions, function_name)()
+            for param, function_name in STAKING_PARAMS_FUNCTIONS.items()
+        }
+        # the dual staking calls are expected to fail if the contract is not a dual staking contract
+        functions["second_token"] = dual_staking_instance.functions.secondToken()
+        functions[
+            "second_token_amount"
+        ] = dual_staking_instance.functions.secondTokenAmount()
+
+        results = multicall(
+            ledger_api=self.ledger_api,
+            calls=[
+                (
+                    staking_contract,
+                    True,
+                    function._encode_transaction_data(),  # pylint: disable=protected-access
+                )
+                for function in functions.values()
+            ],
+        )
+        values: t.Dict[str, t.Any] = {}
+        for (param, function), (success, return_data) in zip(
+            functions.items(), results
+        ):
+            if not success or not return_data:
+                values[param] = None
+                continue
+            (abi_output,) = function.abi["outputs"]
+            output_type = abi_output["type"]
+            (value,) = self.ledger_api.api.codec.decode([output_type], return_data)
+            if output_type == "address":
+                value = self.ledger_api.api.to_checksum_address(value)
+            elif output_type.endswith("[]"):
+                value = list(value)
+            values[param] = value
+
+        missing = [param for param in STAKING_PARAMS_FUNCTIONS if values[param] is None]
+        if missing:
+            raise ValueError(f"Calls to {missing} failed.")
+
+        output = {
+            "staking_contract": staking_contract,
+            **{param: values[param] for param in STAKING_PARAMS_FUNCTIONS},
+            "additional_staking_tokens": {},
+        }
+        if (
+            values["second_token"] is not None
+            and values["second_token_amount"] is not None
+        ):
+            output["additional_staking_tokens"][values["second_token"]] = values[
+                "second_token_amount"
+            ]
+        return output
+
+    def _get_staking_params_one_by_one(
+        self, staking_manager: StakingManager, staking_contract: str
+    ) -> t.Dict:
+        """Read the staking params from the staking contract, one call per param."""
         agent_ids = staking_manager.agent_ids(
             staking_contract=staking_contract,
         )
@@ -928,8 +1046,6 @@ class _ChainUtil:
             # avoid any issues we are simply catching all exceptions.
             pass
 
-        cache["get_staking_params"][staking_contract] = output
-
         return output
 
 
@@ -29,10 +29,11 @@ import tempfile
 import time
 import typing as t
 import uuid
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from json import JSONDecodeError
 from pathlib import Path
+from threading import Lock
 from traceback import print_exc
 
 from aea.configurations.constants import (
@@ -73,6 +74,7 @@ from operate.constants import (
     HEALTHCHECK_JSON,
 )
 from operate.keys import KeysManager
+from operate.ledger.pool import LedgerApiPool
 from operate.operate_http.exceptions import NotAllowed
 from operate.operate_types import (
     Chain,
@@ -92,6 +94,7 @@ from operate.operate_types import (
 from operate.resource import LocalResource
 from operate.services.deployment_runner import run_host_deployment, stop_host_deployment
 from operate.services.utils import tendermint
+from operate.utils import SingletonMeta
 from operate.utils.ssl import create_ssl_certificate
 
 
@@ -754,6 +757,7 @@ class Service(LocalResource):
 
     _helper: t.Optional[ServiceHelper] = None
     _deployment: t.Optional[Deployment] = None
+    _service_yaml: t.Optional[t.Tuple[str, t.Dict]] = None
 
     _file = CONFIG_JSON
 
@@ -781,6 +785,11 @@ class Service(LocalResource):
         """Load a service"""
         return super().load(path)  # type: ignore
 
+    def store(self) -> None:
+        """Store the service, writing it through to the registry of loaded services."""
+        super().store()
+        ServiceRegistry().put(self)
+
     @property
     def helper(self) -> ServiceHelper:
         """Get service helper."""
@@ -885,10 +894,14 @@ class Service(LocalResource):
 
     def service_public_id(self, include_version: bool = True) -> str:
         """Get the public id (based on the service hash)."""
-        with (self.package_absolute_path / DEFAULT_SERVICE_CONFIG_FILE).open(
-            "r", encoding="utf-8"
-        ) as fp:
-            service_yaml, *_ = yaml_load_all(fp)
+        # the package of a hash never changes, so its service.yaml is only read once
+        if self._service_yaml is None or self._service_yaml[0] != self.hash:
+            with (self.package_absolute_path / DEFAULT_SERVICE_CONFIG_FILE).open(
+                "r", encoding="utf-8"
+            ) as fp:
+                service_yaml, *_ = yaml_load_all(fp)
+            self._service_yaml = (self.hash, service_yaml)
+        service_yaml = self._service_yaml[1]
 
         public_id = f"{service_yaml['author']}/{service_yaml['name']}"
 
@@ -1098,7 +1111,10 @@ class Service(LocalResource):
                 config  # type: ignore
             )
 
-            self.chain_configs[chain].ledger_config.rpc = config["rpc"]
+            ledger_config = self.chain_configs[chain].ledger_config
+            if ledger_config.rpc != config["rpc"]:
+                LedgerApiPool().invalidate(chain=Chain(chain), rpc=ledger_config.rpc)
+            ledger_config.rpc = config["rpc"]
 
         self.store()
 
@@ -1169,3 +1185,58 @@ class Service(LocalResource):
 
         if updated:
             self.store()
+
+
+class ServiceRegistry(metaclass=SingletonMeta):
+    """Process-wide registry of the loaded services, invalidated when their config changes on disk."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._services: t.Dict[Path, t.Tuple[t.Tuple[int, int, int], Service]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _signature(path: Path) -> t.Optional[t.Tuple[int, int, int]]:
+        """Get the signature of the config file of a service, if it exists."""
+        try:
+            stat = (path / CONFIG_JSON).stat()
+        except FileNotFoundError:
+            return None
+        # the config is replaced on every store, so the inode changes along with it
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: Path) -> Service:
+        """Get a copy of the service stored in the given path, loading it only if its config changed."""
+        signature = self._signature(path)
+        with self._lock:
+            entry = self._services.get(path)
+        if entry is not None and entry[0] == signature:
+            return deepcopy(entry[1])
+
+        service = Service.load(path=path)
+        with self._lock:
+            self._services[path] = (
+                t.cast(t.Tuple[int, int, int], signature),
+                deepcopy(service),
+            )
+        return service
+
+    def put(self, service: Service) -> None:
+        """Put a copy of a service which has just been stored."""
+        signature = self._signature(service.path)
+        if signature is None:
+            with self._lock:
+                self._services.pop(service.path, None)
+            return
+
+        service = deepcopy(service)
+        with self._lock:
+            self._services[service.path] = (signature, service)
+
+    def prune(self, root: Path, paths: t.Iterable[Path]) -> None:
+        """Drop the services stored under the root which are not in the given paths."""
+        paths = set(paths)
+        with self._lock:
+            for path in list(self._services):
+                if path.parent == root and path not in paths:
+                    del self._services[path]
@@ -34,9 +34,9 @@ import traceback
 from http import HTTPStatus
 from logging import Logger
 from pathlib import Path
-from threading import Event, Thread
-from time import sleep
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from threading import Event, Lock, Thread
+from time import sleep, time
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, cast
 
 import requests
 from flask import Flask, Response, jsonify, request
@@ -61,6 +61,22 @@ DEFAULT_RPC_LISTEN_ADDRESS = f"{_TCP}0.0.0.0:26657"
 
 IS_DEV_MODE = False
 
+TM_LOG_MAX_BYTES = int(os.environ.get("TM_LOG_MAX_BYTES", 10 * 1024 * 1024))
+TM_LOG_MAX_AGE = int(os.environ.get("TM_LOG_MAX_AGE", 24 * 60 * 60))  # seconds
+TM_LOG_BACKUP_COUNT = 3
+TM_LOG_BUFFER_SIZE = 64 * 1024
+TM_LOG_FLUSH_INTERVAL = 1.0  # seconds
+
+RESTART_TRIGGERS = (
+    # this occurs when we lose connection from the tm side
+    "RPC HTTP server stopped",
+    # whenever the node is stopped because of a closed connection
+    # from on any of the tendermint modules (abci, p2p, rpc, etc)
+    # we restart the node
+    "Stopping abci.socketClient for error: read message: EOF",
+)
+RESTART_TRIGGERS_REGEX = re.compile("|".join(map(re.escape, RESTART_TRIGGERS)))
+
 logging.basicConfig(
     filename=os.environ.get("LOG_FILE", DEFAULT_LOG_FILE),
     level=logging.DEBUG,
@@ -86,6 +102,128 @@ class StoppableThread(
         """Check if the thread is stopped."""
         return self._stop_event.is_set()
 
+    def wait(self, timeout: float) -> bool:
+        """Wait for the stop event, returning whether it is set."""
+        return self._stop_event.wait(timeout)
+
+
+class RotatingLogWriter:
+    """Buffered writer of a log file, rotated by size and by age.
+
+    The file is kept open between writes and flushed periodically from a
+    background thread, so that writing a line does not issue any syscall.
+    Once closed, the lines written are flushed right away, until the writer
+    is opened again.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        max_bytes: int = TM_LOG_MAX_BYTES,
+        max_age: float = TM_LOG_MAX_AGE,
+        backup_count: int = TM_LOG_BACKUP_COUNT,
+        flush_interval: float = TM_LOG_FLUSH_INTERVAL,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        :param path: path of the log file.
+        :param max_bytes: size of the file after which it is rotated.
+        :param max_age: seconds after which the file is rotated.
+        :param backup_count: number of rotated files kept.
+        :param flush_interval: seconds between flushes of the buffer.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self._file: Optional[TextIO] = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._lock = Lock()
+        self._flushing: Optional[StoppableThread] = None
+        self._closed = False
+
+    def write(self, line: str) -> None:
+        """Write a line to the buffer, rotating the file if needed."""
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif self._size >= self.max_bytes or time() - self._opened_at >= (
+                self.max_age
+            ):
+                self._rotate()
+            file = cast(TextIO, self._file)
+            file.write(line)
+            self._size += len(line.encode(ENCODING))
+            if self._closed:
+                # there are no periodic flushes once the writer is closed
+                file.flush()
+
+    def open(self) -> None:
+        """Resume the periodic flushes after the writer was closed."""
+        with self._lock:
+            self._closed = False
+            if self._file is not None:
+                self._start_flushing()
+
+    def flush(self) -> None:
+        """Flush the buffer to the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Flush the buffer and close the file."""
+        with self._lock:
+            self._closed = True
+        if self._flushing is not None:
+            self._flushing.stop()
+            self._flushing.join()
+            self._flushing = None
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self) -> None:
+        """Open the file, and start the periodic flushes."""
+        self._file = open(  # pylint: disable=consider-using-with
+            self.path, "a", encoding=ENCODING, buffering=TM_LOG_BUFFER_SIZE
+        )
+        self._size = self._file.tell()
+        self._opened_at = time()
+        if not self._closed:
+            self._start_flushing()
+
+    def _start_flushing(self) -> None:
+        """Start the periodic flushes, if they are not running."""
+        if self._flushing is None:
+            self._flushing = StoppableThread(
+                target=self._flush_periodically, daemon=True
+            )
+            self._flushing.start()
+
+    def _rotate(self) -> None:
+        """Rotate the files, as `path` -> `path.1` -> ... -> `path.{backup_count}`."""
+        cast(TextIO, self._file).close()
+        for i in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every `flush_interval` seconds until stopped."""
+        flushing = cast(StoppableThread, self._flushing)
+        while not flushing.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
 
 class TendermintParams:  # pylint: disable=too-few-public-methods
     """Tendermint node parameters."""
@@ -191,6 +329,7 @@ class TendermintNode:
         self.logger = logger or logging.getLogger()
         self.log_file = os.environ.get("LOG_FILE", DEFAULT_TENDERMINT_LOG_FILE)
         self.write_to_log = write_to_log
+        self._log_writer = RotatingLogWriter(path=self.log_file)
 
     def _build_init_command(self) -> List[str]:
         """Build the 'init' command."""
@@ -219,24 +358,16 @@ class TendermintNode:
                 if self._process is not None and self._process.stdout is not None:
                     line = self._process.stdout.readline()
                     self.log(line)
-                    for trigger in [
-                        # this occurs when we lose connection from the tm side
-                        "RPC HTTP server stopped",
-                        # whenever the node is stopped because of a closed connection
-                        # from on any of the tendermint modules (abci, p2p, rpc, etc)
-                        # we restart the node
-                        "Stopping abci.socketClient for error: read message: EOF",
-                    ]:
-                        if self._monitoring.stopped():
-                            break
-                        if line.find(trigger) >= 0:
-                            self._stop_tm_process()
-                            # we can only reach this step if monitoring was activated
-                            # so we make sure that after reset the monitoring continues
-                            self._start_tm_process()
-                            self.log(
-                                f"Restarted the HTTP RPC server, as a connection was dropped with message:\n\t\t {line}\n"
-                            )
+                    if self._monitoring.stopped():
+                        break
+                    if RESTART_TRIGGERS_REGEX.search(line) is not None:
+                        self._stop_tm_process()
+                        # we can only reach this step if monitoring was activated
+                        # so we make sure that after reset the monitoring continues
+                        self._start_tm_process()
+                        self.log(
+                            f"Restarted the HTTP RPC server, as a connection was dropped with message:\n\t\t {line}\n"
+                        )
             except Exception as e:  # pylint: disable=broad-except
                 self.log(f"Error!: {str(e)}")
         self.log("Monitoring thread terminated\n")
@@ -262,6 +393,7 @@ class TendermintNode:
 
     def start(self, debug: bool = False) -> None:
         """Start a Tendermint node process."""
+        self._log_writer.open()
         self._start_tm_process(debug)
         self._start_monitoring_thread()
 
@@ -316,6 +448,7 @@ class TendermintNode:
         """Stop a Tendermint node process."""
         self._stop_monitoring_thread()
         self._stop_tm_process()
+        self._log_writer.close()
 
     @staticmethod
     def _write_to_console(line: str) -> None:
@@ -324,9 +457,8 @@ class TendermintNode:
         sys.stdout.flush()
 
     def _write_to_file(self, line: str) -> None:
-        """Write line to console."""
-        with open(self.log_file, "a", encoding=ENCODING) as file:
-            file.write(line)
+        """Write line to the log file."""
+        self._log_writer.write(line)
 
     def log(self, line: str) -> None:
         """Open and write a line to the log file."""
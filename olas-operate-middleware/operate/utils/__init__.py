@@ -22,10 +22,18 @@
 import shutil
 import time
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from threading import Lock
 
 
+# threads of `concurrent_map`
+CONCURRENT_MAP_MAX_WORKERS = 8
+
+ItemType = t.TypeVar("ItemType")
+ResultType = t.TypeVar("ResultType")
+
+
 class SingletonMeta(type):
     """A metaclass for creating thread-safe singleton classes."""
 
@@ -40,6 +48,27 @@ class SingletonMeta(type):
         return cls._instances[cls]
 
 
+def concurrent_map(
+    fn: t.Callable[[ItemType], ResultType], items: t.Iterable[ItemType]
+) -> t.List[ResultType]:
+    """
+    Call `fn` on each of the items on a bounded thread pool, returning the results in order.
+
+    Meant for calls that wait on the network, such as reading from the RPCs of
+    several chains. The first exception raised by a call is raised once all the
+    calls are done.
+    """
+
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(items), CONCURRENT_MAP_MAX_WORKERS)
+    ) as executor:
+        return list(executor.map(fn, items))
+
+
 def create_backup(path: Path) -> Path:
     """Creates a backup of the specified path.
 
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Process-wide cache of the data read from the chains."""
+
+import json
+import os
+import time
+import typing as t
+from copy import deepcopy
+from pathlib import Path
+from threading import Lock
+
+from operate.utils import SingletonMeta
+
+
+STAKING_PARAMS = "staking_params"
+PROTOCOL_ASSET_REQUIREMENTS = "protocol_asset_requirements"
+BONDED_ASSETS = "bonded_assets"
+BALANCES = "balances"
+SAFE_OWNERS = "safe_owners"
+
+# Time to live, in seconds, of each class of data
+DEFAULT_TTLS = {
+    STAKING_PARAMS: float(os.environ.get("OPERATE_STAKING_PARAMS_TTL", 86400)),
+    PROTOCOL_ASSET_REQUIREMENTS: float(
+        os.environ.get("OPERATE_PROTOCOL_ASSET_REQUIREMENTS_TTL", 3600)
+    ),
+    BONDED_ASSETS: float(os.environ.get("OPERATE_BONDED_ASSETS_TTL", 60)),
+    BALANCES: float(os.environ.get("OPERATE_BALANCES_TTL", 10)),
+    SAFE_OWNERS: float(os.environ.get("OPERATE_SAFE_OWNERS_TTL", 3600)),
+}
+
+# Version of the format of the persisted staking params, stored data of other versions are discarded
+STAKING_PARAMS_STORE_VERSION = 1
+
+T = t.TypeVar("T")
+
+
+class ChainDataCache(metaclass=SingletonMeta):
+    """Cache of the data read from the chains, keyed by data class, chain and scope.
+
+    The scope is the service config id for the data of a service,
+    or the contract address for the data of a contract.
+    """
+
+    def __init__(self, ttls: t.Optional[t.Dict[str, float]] = None) -> None:
+        """Initialize the cache."""
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._entries: t.Dict[
+            t.Tuple[str, str, str], t.Tuple[float, t.Hashable, t.Any]
+        ] = {}
+        self._lock = Lock()
+
+    def get(
+        self,
+        data_class: str,
+        chain: str,
+        scope: str,
+        compute: t.Callable[[], T],
+        inputs: t.Hashable = None,
+    ) -> T:
+        """Get the cached data, computing and storing them if they have expired.
+
+        The data are also computed again if they were computed from other `inputs`,
+        e.g., for another set of addresses.
+        """
+        key = (data_class, chain, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[1] == inputs
+            and time.time() - entry[0] < self.ttls[data_class]
+        ):
+            return deepcopy(entry[2])
+
+        fetched_at = time.time()
+        value = compute()
+        with self._lock:
+            self._entries[key] = (fetched_at, inputs, deepcopy(value))
+        return value
+
+    def fetched_at(
+        self, scope: str, data_classes: t.Optional[t.Iterable[str]] = None
+    ) -> t.Optional[float]:
+        """Get the time at which the oldest unexpired data of the given scope and data classes were read."""
+        data_classes = set(data_classes) if data_classes is not None else None
+        now = time.time()
+        with self._lock:
+            timestamps = [
+                entry[0]
+                for (data_class, _, entry_scope), entry in self._entries.items()
+                if entry_scope == scope
+                and (data_classes is None or data_class in data_classes)
+                and now - entry[0] < self.ttls[data_class]
+            ]
+        return min(timestamps, default=None)
+
+    def invalidate(
+        self,
+        chain: t.Optional[str] = None,
+        scope: t.Optional[str] = None,
+        data_classes: t.Optional[t.Iterable[str]] = None,
+    ) -> None:
+        """Invalidate the data matching the given chain, scope and data classes."""
+        data_classes = set(data_classes) if data_classes is not None else None
+        with self._lock:
+            for key in list(self._entries):
+                data_class, entry_chain, entry_scope = key
+                if (
+                    (chain is None or entry_chain == chain)
+                    and (scope is None or entry_scope == scope)
+                    and (data_classes is None or data_class in data_classes)
+                ):
+                    del self._entries[key]
+
+
+class StakingParamsStore(metaclass=SingletonMeta):
+    """Persistent store of the staking params, keyed by chain and staking contract.
+
+    The staking params are set when a staking contract is deployed and never change,
+    so they are kept across restarts once read. The store is in-memory only until
+    `setup` gives it a file.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self.path: t.Optional[Path] = None
+        self._params: t.Dict[str, t.Dict[str, t.Dict]] = {}
+        self._lock = Lock()
+
+    def setup(self, path: Path) -> None:
+        """Set the file of the store, loading the params stored in it."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        params = (
+            data.get("params", {})
+            if isinstance(data, dict)
+            and data.get("version") == STAKING_PARAMS_STORE_VERSION
+            else {}
+        )
+        with self._lock:
+            self.path = path
+            self._params = params
+
+    def get(
+        self, chain: str, staking_contract: str, compute: t.Callable[[], t.Dict]
+    ) -> t.Dict:
+        """Get the staking params of a contract, computing and storing them if they are not stored yet."""
+        contract = staking_contract.lower()
+        with self._lock:
+            params = self._params.get(chain, {}).get(contract)
+        if params is not None:
+            return deepcopy(params)
+
+        params = compute()
+        with self._lock:
+            self._params.setdefault(chain, {})[contract] = deepcopy(params)
+            self._write()
+        return params
+
+    def _write(self) -> None:
+        """Write the store to its file, if any."""
+        if self.path is None:
+            return
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"version": STAKING_PARAMS_STORE_VERSION, "params": self._params},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
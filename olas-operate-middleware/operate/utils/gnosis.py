@@ -45,6 +45,48 @@ from operate.operate_types import Chain
 logger = setup_logger(name="operate.utils.gnosis")
 MAX_UINT256 = 2**256 - 1
 SENTINEL_OWNERS = "0x0000000000000000000000000000000000000001"
+# Multicall3 is deployed at the same address on all the supported chains, see https://www.multicall3.com
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+MULTICALL_BATCH_SIZE = 500
+GET_ETH_BALANCE_SELECTOR = "0x4d2301cc"
+BALANCE_OF_SELECTOR = "0x70a08231"
+GET_OWNERS_SELECTOR = "0xa0e67e2b"
+UINT256_SIZE = 32
 
 
 class SafeOperation(Enum):
@@ -595,6 +637,59 @@ def get_asset_balance(
         ) from e
 
 
+def _encode_balance_call(asset_address: str, address: str) -> t.Tuple[str, bool, str]:
+    """Encode a Multicall3 call reading the native or ERC20 balance of an address."""
+    encoded_address = address.lower().replace("0x", "").rjust(2 * UINT256_SIZE, "0")
+    if asset_address == ZERO_ADDRESS:
+        return MULTICALL3_ADDRESS, True, GET_ETH_BALANCE_SELECTOR + encoded_address
+    return (
+        Web3.to_checksum_address(asset_address),
+        True,
+        BALANCE_OF_SELECTOR + encoded_address,
+    )
+
+
+def multicall(
+    ledger_api: LedgerApi,
+    calls: t.Sequence[t.Tuple[str, bool, str]],
+) -> t.List[t.Tuple[bool, bytes]]:
+    """
+    Make (target, allow failure, call data) calls through Multicall3, with one RPC call per batch of calls.
+
+    :return: the success and return data of each call.
+    """
+    contract = ledger_api.api.eth.contract(
+        address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+    )
+    results: t.List[t.Tuple[bool, bytes]] = []
+    for i in range(0, len(calls), MULTICALL_BATCH_SIZE):
+        results.extend(
+            contract.functions.aggregate3(calls[i : i + MULTICALL_BATCH_SIZE]).call()
+        )
+    return results
+
+
+def get_multicall_balances(
+    ledger_api: LedgerApi,
+    asset_address_pairs: t.Sequence[t.Tuple[str, str]],
+) -> t.List[t.Optional[int]]:
+    """
+    Get the balances of (asset, address) pairs through Multicall3, with one RPC call per batch of pairs.
+
+    The balance of a pair is `None` if its call failed, e.g., if the asset is not an ERC20 token.
+    """
+    calls = [
+        _encode_balance_call(asset_address, address)
+        for asset_address, address in asset_address_pairs
+    ]
+    return [
+        int.from_bytes(return_data, "big")
+        if success and len(return_data) == UINT256_SIZE
+        else None
+        for success, return_data in multicall(ledger_api, calls)
+    ]
+
+
 def get_assets_balances(
     ledger_api: LedgerApi,
     asset_addresses: t.Set[str],
@@ -605,15 +700,72 @@ def get_assets_balances(
     Get the balances of a list of native assets or ERC20 tokens.
 
     If asset address is a zero address, return the native balance.
+    The balances are read in batches through Multicall3, falling back to one call per balance if this fails.
     """
     output: t.Dict[str, t.Dict[str, int]] = {}
-
+    pairs = []
     for asset, address in itertools.product(asset_addresses, addresses):
-        output.setdefault(address, {})[asset] = get_asset_balance(
-            ledger_api=ledger_api,
-            asset_address=asset,
-            address=address,
-            raise_on_invalid_address=raise_on_invalid_address,
-        )
+        if not Web3.is_address(address):
+            if raise_on_invalid_address:
+                raise ValueError(f"Invalid address: {address}")
+            output.setdefault(address, {})[asset] = 0
+            continue
+        output.setdefault(address, {})
+        pairs.append((asset, address))
+
+    balances: t.List[t.Optional[int]] = [None] * len(pairs)
+    if len(pairs) > 1:
+        try:
+            balances = get_multicall_balances(ledger_api, pairs)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(
+                f"Cannot get balances through Multicall3 rpc={ledger_api._api.provider.endpoint_uri}, "  # pylint: disable=protected-access
+                f"falling back to one call per balance: {e}"
+            )
+
+    for (asset, address), balance in zip(pairs, balances):
+        if balance is None:
+            balance = get_asset_balance(
+                ledger_api=ledger_api,
+                asset_address=asset,
+                address=address,
+                raise_on_invalid_address=raise_on_invalid_address,
+            )
+        output[address][asset] = balance
 
     return output
+
+
+def get_owners_and_balances(
+    ledger_api: LedgerApi,
+    safe: str,
+    asset_addresses: t.Sequence[str],
+) -> t.Tuple[t.List[str], t.Dict[str, int]]:
+    """
+    Get the owners of a safe and its balances of a list of native assets or ERC20 tokens.
+
+    All of them are read with a single Multicall3 call, falling back to one call per read if this fails.
+    """
+    calls = [(Web3.to_checksum_address(safe), False, GET_OWNERS_SELECTOR)]
+    calls.extend(_encode_balance_call(asset, safe) for asset in asset_addresses)
+    try:
+        (_, owners_data), *results = multicall(ledger_api, calls)
+        (owners,) = ledger_api.api.codec.decode(["address[]"], owners_data)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning(
+            f"Cannot get the owners and balances of {safe} through Multicall3 rpc={ledger_api._api.provider.endpoint_uri}, "  # pylint: disable=protected-access
+            f"falling back to one call per read: {e}"
+        )
+        owners = get_owners(ledger_api=ledger_api, safe=safe)
+        results = [(False, b"")] * len(asset_addresses)
+
+    balances = {}
+    for asset, (success, return_data) in zip(asset_addresses, results):
+        balances[asset] = (
+            int.from_bytes(return_data, "big")
+            if success and len(return_data) == UINT256_SIZE
+            else get_asset_balance(
+                ledger_api=ledger_api, asset_address=asset, address=safe
+            )
+        )
+    return [Web3.to_checksum_address(owner) for owner in owners], balances
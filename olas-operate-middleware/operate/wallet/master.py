@@ -23,13 +23,10 @@ import json
 import logging
 import os
 import typing as t
-from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from aea.crypto.base import Crypto, LedgerApi
-from aea.crypto.registries import make_ledger_api
-from aea_ledger_ethereum import DEFAULT_GAS_PRICE_STRATEGIES, EIP1559, GWEI, to_wei
 from aea_ledger_ethereum.ethereum import EthereumApi, EthereumCrypto
 from autonomy.chain.base import registry_contracts
 from autonomy.chain.config import ChainType as ChainProfile
@@ -42,17 +39,20 @@ from operate.constants import (
     ON_CHAIN_INTERACT_TIMEOUT,
     ZERO_ADDRESS,
 )
-from operate.ledger import get_default_rpc
+from operate.ledger.pool import LedgerApiPool
 from operate.ledger.profiles import ERC20_TOKENS, OLAS, USDC
 from operate.operate_types import Chain, LedgerType
 from operate.resource import LocalResource
-from operate.utils import create_backup
+from operate.utils import concurrent_map, create_backup
+from operate.utils.cache import BALANCES, ChainDataCache, SAFE_OWNERS
 from operate.utils.gnosis import add_owner
 from operate.utils.gnosis import create_safe as create_gnosis_safe
 from operate.utils.gnosis import (
     drain_eoa,
     get_asset_balance,
+    get_assets_balances,
     get_owners,
+    get_owners_and_balances,
     remove_owner,
     swap_owner,
 )
@@ -111,18 +111,7 @@ class MasterWallet(LocalResource):
         rpc: t.Optional[str] = None,
     ) -> LedgerApi:
         """Get ledger api object."""
-        gas_price_strategies = deepcopy(DEFAULT_GAS_PRICE_STRATEGIES)
-        if chain in (Chain.BASE, Chain.MODE, Chain.OPTIMISM):
-            gas_price_strategies[EIP1559]["fallback_estimate"]["maxFeePerGas"] = to_wei(
-                5, GWEI
-            )
-
-        return make_ledger_api(
-            self.ledger_type.name.lower(),
-            address=(rpc or get_default_rpc(chain=chain)),
-            chain_id=chain.id,
-            gas_price_strategies=gas_price_strategies,
-        )
+        return LedgerApiPool().get(self.ledger_type, chain, rpc)
 
     def transfer(
         self,
@@ -402,18 +391,21 @@ class EthereumMasterWallet(MasterWallet):
             )
 
         if from_safe:
-            return self._transfer_from_safe(
+            tx_hash = self._transfer_from_safe(
                 to=to,
                 amount=amount,
                 chain=chain,
                 rpc=rpc,
             )
-        return self._transfer_from_eoa(
-            to=to,
-            amount=amount,
-            chain=chain,
-            rpc=rpc,
-        )
+        else:
+            tx_hash = self._transfer_from_eoa(
+                to=to,
+                amount=amount,
+                chain=chain,
+                rpc=rpc,
+            )
+        ChainDataCache().invalidate(chain=chain.value, data_classes=(BALANCES,))
+        return tx_hash
 
     # pylint: disable=too-many-arguments
     def transfer_erc20(
@@ -457,20 +449,23 @@ class EthereumMasterWallet(MasterWallet):
             )
 
         if from_safe:
-            return self._transfer_erc20_from_safe(
+            tx_hash = self._transfer_erc20_from_safe(
                 token=token,
                 to=to,
                 amount=amount,
                 chain=chain,
                 rpc=rpc,
             )
-        return self._transfer_erc20_from_eoa(
-            token=token,
-            to=to,
-            amount=amount,
-            chain=chain,
-            rpc=rpc,
-        )
+        else:
+            tx_hash = self._transfer_erc20_from_eoa(
+                token=token,
+                to=to,
+                amount=amount,
+                chain=chain,
+                rpc=rpc,
+            )
+        ChainDataCache().invalidate(chain=chain.value, data_classes=(BALANCES,))
+        return tx_hash
 
     def transfer_asset(
         self,
@@ -543,6 +538,7 @@ class EthereumMasterWallet(MasterWallet):
                 withdrawal_address=withdrawal_address,
                 chain_id=chain.id,
             )
+            ChainDataCache().invalidate(chain=chain.value, data_classes=(BALANCES,))
 
     @classmethod
     def new(
@@ -648,6 +644,7 @@ class EthereumMasterWallet(MasterWallet):
             self.safes = {}
         self.safes[chain] = safe
         self.store()
+        ChainDataCache().invalidate(chain=chain.value)
         return tx_hash
 
     def update_backup_owner(
@@ -682,6 +679,30 @@ class EthereumMasterWallet(MasterWallet):
         if old_backup_owner == backup_owner:
             return False
 
+        # the cached owners are dropped before and after the update, so none are read mid-update
+        ChainDataCache().invalidate(
+            chain=chain.value, scope=safe, data_classes=(SAFE_OWNERS,)
+        )
+        try:
+            return self._update_backup_owner(
+                ledger_api=ledger_api,
+                safe=safe,
+                old_backup_owner=old_backup_owner,
+                backup_owner=backup_owner,
+            )
+        finally:
+            ChainDataCache().invalidate(
+                chain=chain.value, scope=safe, data_classes=(SAFE_OWNERS,)
+            )
+
+    def _update_backup_owner(
+        self,
+        ledger_api: LedgerApi,
+        safe: str,
+        old_backup_owner: t.Optional[str],
+        backup_owner: t.Optional[str],
+    ) -> bool:
+        """Add, remove or swap the backup owner of a safe."""
         if not old_backup_owner and backup_owner:
             add_owner(
                 ledger_api=ledger_api,
@@ -711,35 +732,60 @@ class EthereumMasterWallet(MasterWallet):
 
         return False
 
+    def _get_safe_owners_and_balances(
+        self, chain: Chain, safe: str, asset_addresses: t.List[str]
+    ) -> t.Tuple[t.List[str], t.Dict[str, int]]:
+        """Get the owners of a safe, cached until they are updated, and its balances."""
+        ledger_api = self.ledger_api(chain=chain)
+        balances: t.Dict[str, int] = {}
+
+        def _get_owners() -> t.List[str]:
+            # the owners are read along with the balances, in a single multicall
+            owners, fetched_balances = get_owners_and_balances(
+                ledger_api=ledger_api, safe=safe, asset_addresses=asset_addresses
+            )
+            balances.update(fetched_balances)
+            return owners
+
+        owners = ChainDataCache().get(
+            data_class=SAFE_OWNERS,
+            chain=chain.value,
+            scope=safe,
+            compute=_get_owners,
+        )
+        if not balances:
+            fetched_balances = get_assets_balances(
+                ledger_api=ledger_api,
+                asset_addresses=set(asset_addresses),
+                addresses={safe},
+            )[safe]
+            balances.update(
+                (asset, fetched_balances[asset]) for asset in asset_addresses
+            )
+        return owners, balances
+
     @property
     def extended_json(self) -> t.Dict:
         """Get JSON representation with extended information (e.g., safe owners)."""
-        rpc = None
         tokens = (OLAS, USDC)
         wallet_json = self.json
 
         if not self.safes:
             return wallet_json
 
-        owner_sets = set()
-        for chain, safe in self.safes.items():
-            ledger_api = self.ledger_api(chain=chain, rpc=rpc)
-            owners = get_owners(ledger_api=ledger_api, safe=safe)
-            owners.remove(self.address)
-
-            balances: t.Dict[str, int] = {}
-            balances[ZERO_ADDRESS] = ledger_api.get_balance(safe) or 0
-            for token in tokens:
-                balance = (
-                    registry_contracts.erc20.get_instance(
-                        ledger_api=ledger_api,
-                        contract_address=token[chain],
-                    )
-                    .functions.balanceOf(safe)
-                    .call()
-                )
-                balances[token[chain]] = balance
+        chains = list(self.safes)
+        safes_data = concurrent_map(
+            lambda chain: self._get_safe_owners_and_balances(
+                chain=chain,
+                safe=self.safes[chain],
+                asset_addresses=[ZERO_ADDRESS, *(token[chain] for token in tokens)],
+            ),
+            chains,
+        )
 
+        owner_sets = set()
+        for chain, (owners, balances) in zip(chains, safes_data):
+            owners = [owner for owner in owners if owner != self.address]
             wallet_json["safes"][chain.value] = {
                 wallet_json["safes"][chain.value]: {
                     "backup_owners": owners,
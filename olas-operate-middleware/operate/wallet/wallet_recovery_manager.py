@@ -27,6 +27,7 @@ from pathlib import Path
 
 from operate.account.user import UserAccount
 from operate.constants import USER_JSON, WALLETS_DIR
+from operate.utils.cache import ChainDataCache, SAFE_OWNERS
 from operate.utils.gnosis import get_owners
 from operate.wallet.master import MasterWalletManager
 
@@ -207,4 +208,6 @@ class WalletRecoveryManager:
         except Exception as e:
             raise RuntimeError from e
 
+        # the owners of the safes were swapped outside of the wallets
+        ChainDataCache().invalidate(data_classes=(SAFE_OWNERS,))
         self.logger.info("[WALLET RECOVERY MANAGER] Recovery step 2 finish")
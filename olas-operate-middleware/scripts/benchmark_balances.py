@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Benchmark the batched balances' reads against one read per balance, on a local stand-in node.
+
+The stand-in node answers the JSON-RPC calls used to read balances, including Multicall3's `aggregate3`,
+and delays each HTTP request to simulate the round trip to a remote RPC.
+
+Usage: `python scripts/benchmark_balances.py --addresses 5 --tokens 4 --latency 50`
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import threading
+import time
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aea.crypto.registries import make_ledger_api
+from eth_abi import decode, encode
+from web3 import Web3
+
+from operate.constants import ZERO_ADDRESS
+from operate.utils.gnosis import (
+    BALANCE_OF_SELECTOR,
+    GET_ETH_BALANCE_SELECTOR,
+    MULTICALL3_ADDRESS,
+    get_asset_balance,
+    get_assets_balances,
+)
+
+
+CHAIN_ID = 100
+AGGREGATE3_SELECTOR = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4].hex()
+
+
+def balance_of(asset: str, address: str) -> int:
+    """Get the deterministic balance of an address in the stand-in node."""
+    digest = hashlib.sha256(f"{asset.lower()}{address.lower()}".encode()).digest()
+    return int.from_bytes(digest[:12], "big")
+
+
+def call(to: str, data: str) -> bytes:
+    """Execute an `eth_call` in the stand-in node."""
+    selector, args = data[:10], bytes.fromhex(data[10:])
+    if to.lower() == MULTICALL3_ADDRESS.lower() and selector == AGGREGATE3_SELECTOR:
+        (calls,) = decode(["(address,bool,bytes)[]"], args)
+        results = [
+            (True, call(target, "0x" + call_data.hex()))
+            for target, _, call_data in calls
+        ]
+        return encode(["(bool,bytes)[]"], [results])
+
+    (address,) = decode(["address"], args)
+    if (
+        to.lower() == MULTICALL3_ADDRESS.lower()
+        and selector == GET_ETH_BALANCE_SELECTOR
+    ):
+        return encode(["uint256"], [balance_of(ZERO_ADDRESS, address)])
+    if selector == BALANCE_OF_SELECTOR:
+        return encode(["uint256"], [balance_of(to, address)])
+    raise ValueError(f"Unsupported call {data} to {to}.")
+
+
+class StandInNodeHandler(BaseHTTPRequestHandler):
+    """A JSON-RPC handler answering the calls used to read balances."""
+
+    latency: float = 0.0
+    round_trips: int = 0
+
+    def log_message(self, *args: t.Any) -> None:  # pylint: disable=arguments-differ
+        """Do not log the requests."""
+
+    def _respond(self, request: t.Dict) -> t.Dict:
+        """Respond to a single JSON-RPC request."""
+        method, params = request["method"], request.get("params", [])
+        if method == "eth_chainId":
+            result: t.Any = hex(CHAIN_ID)
+        elif method == "eth_getBalance":
+            result = hex(balance_of(ZERO_ADDRESS, params[0]))
+        elif method == "eth_call":
+            result = "0x" + call(params[0]["to"], params[0]["data"]).hex()
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32601, "message": f"Unsupported {method}"},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Handle a JSON-RPC request, or a batch of them."""
+        type(self).round_trips += 1
+        time.sleep(self.latency)
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if isinstance(request, list):
+            response: t.Any = [self._respond(item) for item in request]
+        else:
+            response = self._respond(request)
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def get_balances_one_by_one(
+    ledger_api: t.Any, asset_addresses: t.Set[str], addresses: t.Set[str]
+) -> t.Dict[str, t.Dict[str, int]]:
+    """Get the balances with one read per balance, as they were read before batching."""
+    output: t.Dict[str, t.Dict[str, int]] = {}
+    for asset, address in itertools.product(asset_addresses, addresses):
+        output.setdefault(address, {})[asset] = get_asset_balance(
+            ledger_api, asset, address
+        )
+    return output
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--addresses", type=int, default=5)
+    parser.add_argument("--tokens", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=50, help="in milliseconds")
+    args = parser.parse_args()
+
+    StandInNodeHandler.latency = args.latency / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInNodeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ledger_api = make_ledger_api(
+        "ethereum",
+        address=f"http://127.0.0.1:{server.server_address[1]}",
+        chain_id=CHAIN_ID,
+    )
+
+    addresses = {
+        Web3.to_checksum_address(f"0x{i + 1:040x}") for i in range(args.addresses)
+    }
+    # the native asset is read along with the ERC20 tokens, as in the refill requirements
+    asset_addresses = {ZERO_ADDRESS} | {
+        Web3.to_checksum_address(f"0x{0xe0 + i:040x}") for i in range(args.tokens - 1)
+    }
+
+    results = {}
+    for name, get_balances in (
+        ("one by one", get_balances_one_by_one),
+        ("batched", get_assets_balances),
+    ):
+        StandInNodeHandler.round_trips = 0
+        start = time.perf_counter()
+        balances = get_balances(ledger_api, asset_addresses, addresses)
+        elapsed = time.perf_counter() - start
+        results[name] = (balances, elapsed, StandInNodeHandler.round_trips)
+
+    (expected, *_), (balances, *_) = results.values()
+    if balances != expected:
+        raise ValueError("The batched balances differ from the ones read one by one.")
+
+    server.shutdown()
+    print(
+        f"Reading {len(asset_addresses)} assets for {len(addresses)} addresses, "
+        f"with a {args.latency:.0f} ms round trip:"
+    )
+    for name, (_, elapsed, round_trips) in results.items():
+        print(f"{name:>12}: {elapsed * 1000:8.1f} ms, {round_trips:4d} RPC round trips")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Benchmark the compiled (de)serializers of the local resources against the reflective ones.
+
+The reflective (de)serializers are the ones `LocalResource` used before its codecs were compiled,
+which walk the type hints of every field on every call. Both are run over a realistic `Service`
+config, and their JSON outputs are checked to be identical.
+
+Usage: `python scripts/benchmark_resource.py --chains 4 --env-variables 30 --iterations 2000`
+"""
+
+import argparse
+import enum
+import json
+import time
+import types
+import typing as t
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+
+from operate.resource import LocalResource
+from operate.services.service import SERVICE_CONFIG_VERSION, Service
+
+
+CHAINS = ("gnosis", "base", "optimism", "mode", "ethereum", "polygon")
+
+
+def reflective_serialize(obj: t.Any) -> t.Any:
+    """Serialize an object by reflection."""
+    if is_dataclass(obj):
+        return reflective_serialize(asdict(obj))
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, dict):
+        return {
+            reflective_serialize(key): reflective_serialize(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [reflective_serialize(value) for value in obj]
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, bytes):
+        return obj.hex()
+    return obj
+
+
+def reflective_deserialize(obj: t.Any, otype: t.Any) -> t.Any:
+    """Deserialize a json object by reflection."""
+    origin = getattr(otype, "__origin__", None)
+    is_union_type = hasattr(types, "UnionType") and isinstance(otype, types.UnionType)
+    if origin is t.Union or is_union_type:
+        for arg in t.get_args(otype):
+            if arg is type(None):  # noqa: E721
+                continue
+            try:
+                return reflective_deserialize(obj, arg)
+            except Exception:  # pylint: disable=broad-except  # nosec
+                continue
+        return None
+
+    base = getattr(otype, "__class__")  # noqa: B009
+    if base.__name__ == "_GenericAlias":  # type: ignore
+        args = otype.__args__  # type: ignore
+        if len(args) == 1:
+            (atype,) = args
+            return [reflective_deserialize(arg, atype) for arg in obj]
+        if len(args) == 2:
+            (ktype, vtype) = args
+            return {
+                reflective_deserialize(key, ktype): reflective_deserialize(val, vtype)
+                for key, val in obj.items()
+            }
+        return obj
+    if base is enum.EnumMeta:
+        return otype(obj)
+    if otype is Path:
+        return Path(obj)
+    if is_dataclass(otype):
+        return reflective_from_json(otype, obj)
+    if otype is bytes:
+        return bytes.fromhex(obj)
+    return obj
+
+
+def reflective_to_json(resource: LocalResource) -> t.Dict:
+    """Serialize a local resource by reflection."""
+    obj = {}
+    for pname, _ in resource.__annotations__.items():
+        if pname.startswith("_") or pname == "path":
+            continue
+        obj[pname] = reflective_serialize(resource.__dict__[pname])
+    return obj
+
+
+def reflective_from_json(cls: t.Type, obj: t.Dict) -> t.Any:
+    """Deserialize a local resource by reflection."""
+    kwargs = {}
+    for pname, ptype in cls.__annotations__.items():
+        if pname.startswith("_"):
+            continue
+        kwargs[pname] = reflective_deserialize(obj[pname], ptype)
+    return cls(**kwargs)
+
+
+def compiled_to_json(resource: LocalResource) -> t.Dict:
+    """Serialize a local resource with its compiled codec."""
+    # `Service.json` also reads the service package, which is not part of the codec
+    return LocalResource.json.fget(resource)  # type: ignore  # pylint: disable=no-member
+
+
+def compiled_from_json(cls: t.Type, obj: t.Dict) -> t.Any:
+    """Deserialize a local resource with its compiled codec."""
+    return cls.from_json(obj)
+
+
+def service_config(chains: int, env_variables: int) -> t.Dict:
+    """Get a realistic service config."""
+    chain_configs = {}
+    for i, chain in enumerate(CHAINS[:chains]):
+        chain_configs[chain] = {
+            "ledger_config": {"rpc": f"https://rpc.{chain}.example", "chain": chain},
+            "chain_data": {
+                "instances": [f"0x{i + 1:040x}"],
+                "token": 1000 + i,
+                "multisig": f"0x{0xA0 + i:040x}",
+                "user_params": {
+                    "staking_program_id": f"pearl_beta_{i}",
+                    "nft": "bafybeig64atqaladigoc3ds4arltdu63wkdrk3gesjfvnfdmz35amv7faq",
+                    "agent_id": 14,
+                    "cost_of_bond": 10**18,
+                    "fund_requirements": {
+                        f"0x{asset:040x}": {"agent": 2 * 10**18, "safe": 5 * 10**18}
+                        for asset in range(3)
+                    },
+                },
+            },
+        }
+    return {
+        "version": SERVICE_CONFIG_VERSION,
+        "service_config_id": "sc-0d6a3a3e-0a57-4d69-a3a3-6c5e2a3b1d3e",
+        "hash": "bafybeibiiuhqronhgkxjo7x5xve24lkbqom5rve6q6yecc6sygnzhmtjsu",
+        "hash_history": {
+            str(1730000000 + i): f"bafybei{i:052d}" for i in range(5)
+        },
+        "agent_addresses": [f"0x{1:040x}"],
+        "home_chain": CHAINS[0],
+        "chain_configs": chain_configs,
+        "description": "Trader agent for omen prediction markets",
+        "env_variables": {
+            f"VAR_{i}": {
+                "name": f"Variable {i}",
+                "description": f"Description of variable {i}",
+                "value": f"value_{i}",
+                "provision_type": "fixed",
+            }
+            for i in range(env_variables)
+        },
+        "path": "/tmp/.operate/services/sc-0d6a3a3e-0a57-4d69-a3a3-6c5e2a3b1d3e",  # nosec
+        "package_path": "trader_pearl",
+        "name": "Trader Agent",
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chains", type=int, default=4)
+    parser.add_argument("--env-variables", type=int, default=30)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    config = service_config(chains=args.chains, env_variables=args.env_variables)
+    results = {}
+    for name, from_json, to_json in (
+        ("reflective", reflective_from_json, reflective_to_json),
+        ("compiled", compiled_from_json, compiled_to_json),
+    ):
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            service = from_json(Service, config)
+        load = (time.perf_counter() - start) / args.iterations
+
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            obj = to_json(service)
+        store = (time.perf_counter() - start) / args.iterations
+        results[name] = (json.dumps(obj, indent=2), load, store)
+
+    (expected, *_), (output, *_) = results.values()
+    if output != expected:
+        raise ValueError("The compiled codec's JSON differs from the reflective one.")
+
+    print(
+        f"(De)serializing a service with {args.chains} chains and "
+        f"{args.env_variables} environment variables:"
+    )
+    for name, (_, load, store) in results.items():
+        print(
+            f"{name:>12}: from_json {load * 1e6:8.1f} us, json {store * 1e6:8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
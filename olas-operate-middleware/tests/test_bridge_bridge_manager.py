@@ -20,6 +20,7 @@
 """Tests for bridge.bridge_manager module."""
 
 
+import threading
 import time
 import typing as t
 from functools import cache
@@ -29,6 +30,11 @@ import pytest
 import requests
 from deepdiff import DeepDiff
 
+from operate.bridge.bridge_manager import (
+    LIFI_PROVIDER_ID,
+    PROVIDER_MAX_CONCURRENT_REQUESTS,
+    RELAY_PROVIDER_ID,
+)
 from operate.bridge.providers.lifi_provider import LiFiProvider
 from operate.bridge.providers.native_bridge_provider import (
     BridgeContractAdaptor,
@@ -39,6 +45,7 @@ from operate.bridge.providers.native_bridge_provider import (
 from operate.bridge.providers.provider import (
     MESSAGE_QUOTE_ZERO,
     Provider,
+    ProviderRequest,
     ProviderRequestStatus,
 )
 from operate.bridge.providers.relay_provider import RelayProvider
@@ -462,6 +469,59 @@ class TestBridgeManager:
 
         assert not diff, "Wrong refill requirements."
 
+    def test_map_provider_requests(
+        self,
+        tmp_path: Path,
+        password: str,
+    ) -> None:
+        """test_map_provider_requests"""
+
+        operate = OperateApp(
+            home=tmp_path / OPERATE_TEST,
+        )
+        operate.setup()
+        operate.create_user_account(password=password)
+        operate.password = password
+        operate.wallet_manager.create(ledger_type=LedgerType.ETHEREUM)
+        bridge_manager = operate.bridge_manager
+
+        lock = threading.Lock()
+        in_flight: t.Dict[str, int] = {LIFI_PROVIDER_ID: 0, RELAY_PROVIDER_ID: 0}
+        max_in_flight: t.Dict[str, int] = {LIFI_PROVIDER_ID: 0, RELAY_PROVIDER_ID: 0}
+
+        def _call(provider: Provider, request: ProviderRequest) -> str:
+            with lock:
+                in_flight[provider.provider_id] += 1
+                max_in_flight[provider.provider_id] = max(
+                    max_in_flight[provider.provider_id],
+                    in_flight[provider.provider_id],
+                )
+            time.sleep(0.05)
+            with lock:
+                in_flight[provider.provider_id] -= 1
+            return request.id
+
+        provider_requests = [
+            ProviderRequest(
+                params={},
+                provider_id=provider_id,
+                id=f"r-{i}",
+                status=ProviderRequestStatus.CREATED,
+                quote_data=None,
+                execution_data=None,
+            )
+            for i, provider_id in enumerate([LIFI_PROVIDER_ID, RELAY_PROVIDER_ID] * 4)
+        ]
+
+        start = time.time()
+        result = bridge_manager._map_provider_requests(_call, provider_requests)
+        elapsed = time.time() - start
+
+        assert result == [request.id for request in provider_requests]
+        for provider_id, count in max_in_flight.items():
+            assert count == PROVIDER_MAX_CONCURRENT_REQUESTS[provider_id]
+        assert elapsed < 0.05 * len(provider_requests), "Requests were not concurrent."
+
     @pytest.mark.parametrize("to_chain_enum", [Chain.BASE, Chain.MODE, Chain.OPTIMISM])
     def test_correct_providers_bridge_native(
         self,
@@ -23,6 +23,8 @@
 import time
 import typing as t
 from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 import pytest
 from aea.helpers.logging import setup_logger
@@ -42,6 +44,7 @@ from operate.bridge.providers.native_bridge_provider import (
 )
 from operate.bridge.providers.provider import (
     ExecutionData,
+    GasPricingContext,
     MESSAGE_EXECUTION_FAILED,
     MESSAGE_EXECUTION_FAILED_QUOTE_FAILED,
     MESSAGE_EXECUTION_SKIPPED,
@@ -112,6 +115,141 @@ def get_transfer_amount(
         return 0
 
 
+class TestGasPricingContext:
+    """Tests for bridge.providers.provider.GasPricingContext class."""
+
+    def test_get(self) -> None:
+        """test_get"""
+
+        class _LedgerApi:
+            calls = 0
+
+            def try_get_gas_pricing(self) -> t.Dict:
+                self.calls += 1
+                return {"maxFeePerGas": 2, "maxPriorityFeePerGas": 1}
+
+        ledger_api_1, ledger_api_2 = _LedgerApi(), _LedgerApi()
+        gas_pricing_context = GasPricingContext()
+        txs = [{"gas": 1, "gasPrice": 3} for _ in range(4)]
+        for i, tx in enumerate(txs):
+            Provider._update_with_gas_pricing(
+                tx, (ledger_api_1, ledger_api_2)[i % 2], gas_pricing_context  # type: ignore
+            )
+
+        assert ledger_api_1.calls == 1, "Gas pricing not reused."
+        assert ledger_api_2.calls == 1, "Gas pricing not reused."
+        assert all(
+            tx == {"gas": 1, "maxFeePerGas": 2, "maxPriorityFeePerGas": 1} for tx in txs
+        ), "Wrong gas pricing."
+
+
+class _SendLedgerApi:
+    """Ledger API whose node answers the sent transactions with the given errors, repeating the last one."""
+
+    def __init__(self, errors: t.List[t.Optional[Exception]]) -> None:
+        """Initialize the ledger API."""
+        self.errors = errors
+        self.sent: t.List[t.Dict] = []
+        self.old_prices: t.List[t.Dict] = []
+        self.api = SimpleNamespace(
+            eth=SimpleNamespace(get_transaction_receipt=lambda tx_hash: None)
+        )
+
+    def send_signed_transaction(
+        self, tx_signed: t.Any, raise_on_try: bool = False
+    ) -> str:
+        """Send a transaction."""
+        assert raise_on_try, "The errors of the node are not raised."
+        self.sent.append(dict(tx_signed.tx))
+        error = self.errors.pop(0) if len(self.errors) > 1 else self.errors[0]
+        if error is not None:
+            raise error
+        return tx_signed.hash.hex()
+
+    def try_get_gas_pricing(self, old_price: t.Dict) -> t.Dict:
+        """Get the gas pricing, bumped from the old one."""
+        self.old_prices.append(old_price)
+        return {key: value * 2 for key, value in old_price.items()}
+
+
+class _Crypto:
+    """Crypto which signs a transaction into its hash."""
+
+    @staticmethod
+    def sign_transaction(tx: t.Dict) -> t.Any:
+        """Sign a transaction."""
+        tx_hash = Web3.keccak(text=repr(sorted(tx.items())))
+        return SimpleNamespace(tx=dict(tx), hash=tx_hash)
+
+
+class TestSendTx:
+    """Tests for bridge.providers.provider.Provider._send_tx method."""
+
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self) -> t.Iterator[None]:
+        with mock.patch("operate.bridge.providers.provider.ON_CHAIN_INTERACT_SLEEP", 0):
+            yield
+
+    def test_already_known(self) -> None:
+        """Test that a transaction which reached the node before its call failed is taken as sent."""
+        tx = {"nonce": 7, "gasPrice": 10}
+        ledger_api = _SendLedgerApi(
+            [TimeoutError("Read timed out"), ValueError({"message": "already known"})]
+        )
+
+        tx_hash = Provider._send_tx(tx, _Crypto(), ledger_api)  # type: ignore
+
+        assert tx_hash == _Crypto.sign_transaction(tx).hash.hex()
+        assert ledger_api.sent == [tx, tx]
+
+    def test_reprice(self) -> None:
+        """Test that an underpriced transaction is repriced and sent again."""
+        tx = {"nonce": 7, "maxFeePerGas": 10, "maxPriorityFeePerGas": 1}
+        ledger_api = _SendLedgerApi(
+            [ValueError({"message": "replacement transaction underpriced"}), None]
+        )
+
+        tx_hash = Provider._send_tx(tx, _Crypto(), ledger_api)  # type: ignore
+
+        assert ledger_api.old_prices == [
+            {"maxFeePerGas": 10, "maxPriorityFeePerGas": 1}
+        ]
+        assert ledger_api.sent[-1] == {
+            "nonce": 7,
+            "maxFeePerGas": 20,
+            "maxPriorityFeePerGas": 2,
+        }
+        assert tx_hash == _Crypto.sign_transaction(ledger_api.sent[-1]).hash.hex()
+
+    def test_nonce_too_low(self) -> None:
+        """Test that a nonce used by an earlier attempt is taken as sent, and that it fails otherwise."""
+        tx = {"nonce": 7, "gasPrice": 10}
+        tx_hash = _Crypto.sign_transaction(tx).hash.hex()
+        ledger_api = _SendLedgerApi(
+            [TimeoutError("Read timed out"), ValueError({"message": "nonce too low"})]
+        )
+        ledger_api.api.eth.get_transaction_receipt = lambda h: (
+            {"transactionHash": h} if h == tx_hash else None
+        )
+
+        assert Provider._send_tx(tx, _Crypto(), ledger_api) == tx_hash  # type: ignore
+
+        ledger_api = _SendLedgerApi([ValueError({"message": "nonce too low"})])
+        with pytest.raises(RuntimeError, match="nonce too low"):
+            Provider._send_tx(tx, _Crypto(), ledger_api)  # type: ignore
+        assert len(ledger_api.sent) == 1
+
+    def test_error(self) -> None:
+        """Test that the error of the node is reported once the retries are exhausted."""
+        tx = {"nonce": 7, "gasPrice": 10}
+        ledger_api = _SendLedgerApi(
+            [ValueError({"message": "insufficient funds for gas"})]
+        )
+
+        with pytest.raises(RuntimeError, match="nonce 7: .*insufficient funds for gas"):
+            Provider._send_tx(tx, _Crypto(), ledger_api)  # type: ignore
+
+
 class TestNativeBridgeProvider:
     """Tests for bridge.providers.NativeBridgeProvider class."""
 
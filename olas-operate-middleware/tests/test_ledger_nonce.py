@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for ledger.nonce module."""
+
+import typing as t
+from types import SimpleNamespace
+
+import pytest
+
+from operate.ledger.nonce import NonceManager
+from operate.operate_types import Chain
+
+
+SENDER = "0x000000000000000000000000000000000000dEaD"
+
+
+def _ledger_api(pending_nonce: t.List[int]) -> t.Any:
+    """Get a fake ledger api whose pending nonce is the first item of the list."""
+    eth = SimpleNamespace(get_transaction_count=lambda *_: pending_nonce[0])
+    return SimpleNamespace(api=SimpleNamespace(eth=eth))
+
+
+class TestNonceManager:
+    """Tests for `NonceManager`."""
+
+    def test_reserve(self) -> None:
+        """Test that the nonces are assigned locally ahead of the pending nonce."""
+        manager = NonceManager()
+        assert manager is NonceManager()
+        manager.invalidate()
+        pending_nonce = [5]
+        ledger_api = _ledger_api(pending_nonce)
+
+        with manager.reserve(ledger_api, Chain.GNOSIS, SENDER) as next_nonce:
+            assert [next_nonce(), next_nonce()] == [5, 6]
+
+        # the rpc does not see the sent transactions yet
+        with manager.reserve(ledger_api, Chain.GNOSIS, SENDER.lower()) as next_nonce:
+            assert next_nonce() == 7
+
+        # the sender sent transactions elsewhere
+        pending_nonce[0] = 10
+        with manager.reserve(ledger_api, Chain.GNOSIS, SENDER) as next_nonce:
+            assert next_nonce() == 10
+
+        with manager.reserve(ledger_api, Chain.BASE, SENDER) as next_nonce:
+            assert next_nonce() == 10
+
+    def test_reconcile(self) -> None:
+        """Test that the nonces are reconciled with the pending nonce after an error."""
+        manager = NonceManager()
+        manager.invalidate()
+        ledger_api = _ledger_api([3])
+
+        with manager.reserve(ledger_api, Chain.GNOSIS, SENDER) as next_nonce:
+            assert next_nonce() == 3
+
+        with pytest.raises(RuntimeError):
+            with manager.reserve(ledger_api, Chain.GNOSIS, SENDER) as next_nonce:
+                assert next_nonce() == 4
+                raise RuntimeError("Transaction not sent.")
+
+        with manager.reserve(ledger_api, Chain.GNOSIS, SENDER) as next_nonce:
+            assert next_nonce() == 3
+
+        manager.invalidate(chain=Chain.GNOSIS, address=SENDER)
+        with manager.reserve(ledger_api, Chain.GNOSIS, SENDER) as next_nonce:
+            assert next_nonce() == 3
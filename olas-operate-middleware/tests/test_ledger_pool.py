@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for ledger.pool module."""
+
+from operate.ledger import get_default_rpc
+from operate.ledger.pool import LedgerApiPool
+from operate.operate_types import Chain, LedgerType
+
+
+OTHER_RPC = "http://localhost:8545"
+
+
+class TestLedgerApiPool:
+    """Tests for `LedgerApiPool`."""
+
+    def test_get(self) -> None:
+        """Test that the ledger api objects are reused per ledger type, chain and rpc."""
+        pool = LedgerApiPool()
+        assert pool is LedgerApiPool()
+
+        ledger_api = pool.get(LedgerType.ETHEREUM, Chain.GNOSIS)
+        assert pool.get(LedgerType.ETHEREUM, Chain.GNOSIS) is ledger_api
+        assert (
+            pool.get(LedgerType.ETHEREUM, Chain.GNOSIS, get_default_rpc(Chain.GNOSIS))
+            is ledger_api
+        )
+        assert pool.get(LedgerType.ETHEREUM, Chain.GNOSIS, OTHER_RPC) is not ledger_api
+        assert pool.get(LedgerType.ETHEREUM, Chain.BASE) is not ledger_api
+        assert ledger_api.api.provider.endpoint_uri == get_default_rpc(Chain.GNOSIS)
+
+    def test_invalidate(self) -> None:
+        """Test that invalidated ledger api objects are created again."""
+        pool = LedgerApiPool()
+        gnosis = pool.get(LedgerType.ETHEREUM, Chain.GNOSIS)
+        gnosis_other = pool.get(LedgerType.ETHEREUM, Chain.GNOSIS, OTHER_RPC)
+        base = pool.get(LedgerType.ETHEREUM, Chain.BASE)
+
+        pool.invalidate(chain=Chain.GNOSIS, rpc=OTHER_RPC)
+        assert pool.get(LedgerType.ETHEREUM, Chain.GNOSIS) is gnosis
+        assert (
+            pool.get(LedgerType.ETHEREUM, Chain.GNOSIS, OTHER_RPC) is not gnosis_other
+        )
+
+        pool.invalidate(chain=Chain.GNOSIS)
+        assert pool.get(LedgerType.ETHEREUM, Chain.GNOSIS) is not gnosis
+        assert pool.get(LedgerType.ETHEREUM, Chain.BASE) is base
+
+        pool.invalidate()
+        assert pool.get(LedgerType.ETHEREUM, Chain.BASE) is not base
+
+    def test_poa_chain(self) -> None:
+        """Test that the proof of authority middleware is only injected for the chains which need it."""
+        pool = LedgerApiPool()
+        optimism = pool.get(LedgerType.ETHEREUM, Chain.OPTIMISM)
+        gnosis = pool.get(LedgerType.ETHEREUM, Chain.GNOSIS)
+        assert "geth_poa_middleware" in optimism.api.middleware_onion
+        assert "geth_poa_middleware" not in gnosis.api.middleware_onion
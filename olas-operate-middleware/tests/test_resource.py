@@ -22,12 +22,61 @@ import json
 import platform
 import subprocess  # nosec
 import sys
+import typing as t
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from time import sleep, time
 
 from operate.constants import ZERO_ADDRESS
 from operate.keys import Key
-from operate.operate_types import LedgerType
+from operate.operate_types import LedgerType, ServiceEnvProvisionType
+from operate.resource import LocalResource, deserialize, serialize
+
+
+@dataclass
+class _Leaf(LocalResource):
+    """Leaf resource."""
+
+    agent: float
+    raw: bytes
+
+
+@dataclass
+class _Root(LocalResource):
+    """Root resource."""
+
+    version: int
+    history: t.Dict[int, str]
+    leaves: t.Dict[str, _Leaf]
+    tags: t.List[str]
+    ledger: LedgerType
+    path: Path
+    leaf: t.Optional[_Leaf] = None
+    name: t.Optional[str] = None
+    _cache: t.Optional[t.Dict] = None
+
+
+@dataclass
+class _Point:
+    """Point."""
+
+    x: int
+    y: int
+
+
+class _Segment(t.NamedTuple):
+    """Segment."""
+
+    start: _Point
+    end: _Point
+
+
+@dataclass
+class _Path:
+    """Path of points."""
+
+    points: t.Tuple[_Point, ...]
+    segment: _Segment
 
 
 def _run_read_write() -> int:
@@ -102,3 +151,49 @@ def test_no_corruption() -> None:
     assert final_key["address"] == ZERO_ADDRESS, "Key address should match"
     assert final_key["ledger"] == LedgerType.ETHEREUM, "Ledger type should match"
     assert final_key["private_key"] == "0xkey", "Public key should match"
+
+
+def test_codec_round_trip() -> None:
+    """Test that the compiled codec round trips a resource to the same JSON."""
+    obj = {
+        "version": 8,
+        "history": {"1": "a"},
+        "leaves": {"0x0": {"agent": 1.5, "raw": "00ff"}},
+        "tags": ["x", "y"],
+        "ledger": "ethereum",
+        "path": "/tmp/root",  # nosec
+        "leaf": None,
+        "name": "root",
+    }
+    root = t.cast(_Root, _Root.from_json(obj))
+
+    assert root.leaves["0x0"] == _Leaf(agent=1.5, raw=b"\x00\xff")
+    assert root.ledger is LedgerType.ETHEREUM
+    assert root.path == Path("/tmp/root")  # nosec
+    assert root.leaf is None
+    assert json.dumps(root.json) == json.dumps(
+        {key: value for key, value in obj.items() if key != "path"}
+    )
+    assert serialize(root.leaves["0x0"]) == {"agent": 1.5, "raw": "00ff"}
+
+    # the tuples and namedtuples of dataclasses serialize like through `asdict`
+    path = _Path(
+        points=(_Point(x=1, y=2), _Point(x=3, y=4)),
+        segment=_Segment(start=_Point(x=0, y=0), end=_Point(x=5, y=6)),
+    )
+    assert json.dumps(serialize(path)) == json.dumps(asdict(path))
+    assert serialize(path)["points"] == ({"x": 1, "y": 2}, {"x": 3, "y": 4})
+    assert isinstance(serialize(path)["segment"], _Segment)
+    assert serialize((_Leaf(agent=1.0, raw=b"\x01"),)) == ({"agent": 1.0, "raw": "01"},)
+
+
+def test_deserialize_union() -> None:
+    """Test that unions deserialize to their first matching member."""
+    assert deserialize("fixed", t.Optional[ServiceEnvProvisionType]) == (
+        ServiceEnvProvisionType.FIXED
+    )
+    assert deserialize("other", t.Optional[ServiceEnvProvisionType]) is None
+    assert deserialize({"agent": 1, "raw": ""}, t.Union[int, _Leaf]) == {
+        "agent": 1,
+        "raw": "",
+    }
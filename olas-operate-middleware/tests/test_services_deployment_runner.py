@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for services.deployment_runner module."""
+
+import json
+import os
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from operate.constants import AGENT_PACKAGES_DIR, DEPLOYMENT_DIR, SERVICES_DIR
+from operate.services.deployment_runner import BaseDeploymentRunner
+
+
+AGENT = "valory/trader:0.1.0"
+AGENT_HASH = "bafybeihash"
+SERVICE_CONFIG_ID = "sc-00000000-0000-0000-0000-000000000000"
+
+
+class DummyDeploymentRunner(BaseDeploymentRunner):
+    """A deployment runner which records the aea commands instead of running them."""
+
+    def __init__(self, work_directory: Path, fail_on: t.Optional[str] = None) -> None:
+        """Init the deployment runner."""
+        super().__init__(work_directory)
+        self.fail_on = fail_on
+        self.commands: t.List[t.Tuple[str, ...]] = []
+
+    def _run_aea_command(self, *args: str, cwd: Path) -> None:
+        """Record the aea command, fetching a dummy agent package."""
+        self.commands.append(args)
+        if self.fail_on in args:
+            raise RuntimeError(f"aea command `{' '.join(args)}` failed")
+        if "fetch" in args:
+            agent_dir = cwd / args[-1]
+            agent_dir.mkdir()
+            (agent_dir / "aea-config.yaml").write_text(args[2], encoding="utf-8")
+
+    def _start_agent(self) -> None:
+        """Start aea process."""
+
+    def _start_tendermint(self) -> None:
+        """Start tendermint process."""
+
+    @property
+    def _agent_runner_bin(self) -> str:
+        """Return aea_bin path."""
+        return "aea"
+
+    @property
+    def fetches(self) -> int:
+        """Get the number of fetches of the agent package."""
+        return sum("fetch" in command for command in self.commands)
+
+
+def _work_directory(
+    home: Path, agent: str, service_config_id: str = SERVICE_CONFIG_ID
+) -> Path:
+    """Create the deployment directory of a service running the given agent."""
+    work_directory = home / SERVICES_DIR / service_config_id / DEPLOYMENT_DIR
+    work_directory.mkdir(parents=True)
+    (work_directory / "agent.json").write_text(
+        json.dumps({"AEA_AGENT": agent}), encoding="utf-8"
+    )
+    (work_directory / "ethereum_private_key.txt").write_text("0x", encoding="utf-8")
+    return work_directory
+
+
+def _cached(home: Path) -> t.List[str]:
+    """Get the names of the cached agent packages."""
+    cache_dir = home / AGENT_PACKAGES_DIR
+    return sorted(path.name for path in cache_dir.iterdir())
+
+
+class TestAgentPackagesCache:
+    """Tests for the cache of the agent packages of `BaseDeploymentRunner`."""
+
+    def test_cache_miss_and_hit(self, tmp_path: Path) -> None:
+        """Test that the agent package is fetched once, and then set up from the cache."""
+        agent = f"{AGENT}:{AGENT_HASH}"
+        runner = DummyDeploymentRunner(_work_directory(tmp_path, agent))
+
+        assert not runner.is_agent_package_cached()
+        runner._setup_agent()  # pylint: disable=protected-access
+
+        assert runner.fetches == 1
+        assert _cached(tmp_path) == [f"valory_trader_{AGENT_HASH}"]
+        assert runner.is_agent_package_cached()
+
+        # another service running the same agent
+        other = DummyDeploymentRunner(
+            _work_directory(tmp_path, agent, service_config_id="sc-other")
+        )
+        other._setup_agent()  # pylint: disable=protected-access
+
+        assert other.fetches == 0
+        agent_dir = other._work_directory / "agent"  # pylint: disable=protected-access
+        assert (agent_dir / "aea-config.yaml").read_text(encoding="utf-8") == agent
+        assert (agent_dir / "ethereum_private_key.txt").exists()
+        # the keys are not cached
+        assert not (
+            tmp_path
+            / AGENT_PACKAGES_DIR
+            / f"valory_trader_{AGENT_HASH}"
+            / "ethereum_private_key.txt"
+        ).exists()
+
+    def test_prune(self, tmp_path: Path) -> None:
+        """Test that only the most recent packages of each agent are kept."""
+        cache_dir = tmp_path / AGENT_PACKAGES_DIR
+        cache_dir.mkdir()
+        size = BaseDeploymentRunner.AGENT_PACKAGES_CACHE_SIZE
+        for i in range(size):
+            path = cache_dir / f"valory_trader_bafybeiold{i}"
+            path.mkdir()
+            os.utime(path, (i, i))
+        (cache_dir / "valory_other_bafybeiother").mkdir()
+        os.utime(cache_dir / "valory_other_bafybeiother", (0, 0))
+
+        runner = DummyDeploymentRunner(
+            _work_directory(tmp_path, f"{AGENT}:{AGENT_HASH}")
+        )
+        runner._setup_agent()  # pylint: disable=protected-access
+
+        assert runner.fetches == 1
+        assert _cached(tmp_path) == sorted(
+            [
+                "valory_other_bafybeiother",
+                f"valory_trader_{AGENT_HASH}",
+                *(f"valory_trader_bafybeiold{i}" for i in range(1, size)),
+            ]
+        )
+
+    def test_already_cached(self, tmp_path: Path) -> None:
+        """Test that a package stored by another deployment in the meantime is kept as it is."""
+        cache_path = tmp_path / AGENT_PACKAGES_DIR / f"valory_trader_{AGENT_HASH}"
+        cache_path.mkdir(parents=True)
+        (cache_path / "aea-config.yaml").write_text("winner", encoding="utf-8")
+        agent_dir = tmp_path / "agent"
+        agent_dir.mkdir()
+        (agent_dir / "aea-config.yaml").write_text("loser", encoding="utf-8")
+        runner = DummyDeploymentRunner(
+            _work_directory(tmp_path, f"{AGENT}:{AGENT_HASH}")
+        )
+
+        runner._store_agent_package(  # pylint: disable=protected-access
+            agent_dir=agent_dir, cache_path=cache_path
+        )
+
+        assert _cached(tmp_path) == [f"valory_trader_{AGENT_HASH}"]
+        assert (cache_path / "aea-config.yaml").read_text(encoding="utf-8") == "winner"
+
+    def test_failed_add_key(self, tmp_path: Path) -> None:
+        """Test that the cached package is dropped if the keys cannot be added to it."""
+        work_directory = _work_directory(tmp_path, f"{AGENT}:{AGENT_HASH}")
+        runner = DummyDeploymentRunner(work_directory, fail_on="add-key")
+
+        with pytest.raises(RuntimeError):
+            runner._setup_agent()  # pylint: disable=protected-access
+
+        assert _cached(tmp_path) == []
+        assert not runner.is_agent_package_cached()
+
+        runner = DummyDeploymentRunner(work_directory)
+        runner._setup_agent()  # pylint: disable=protected-access
+
+        assert runner.fetches == 1
+        assert _cached(tmp_path) == [f"valory_trader_{AGENT_HASH}"]
+
+    def test_unhashed_public_id(self, tmp_path: Path) -> None:
+        """Test that a package without a hash is fetched on every setup, and not cached."""
+        runner = DummyDeploymentRunner(_work_directory(tmp_path, AGENT))
+
+        for _ in range(2):
+            runner._setup_agent()  # pylint: disable=protected-access
+
+        assert runner.fetches == 2
+        assert not runner.is_agent_package_cached()
+        assert not (tmp_path / AGENT_PACKAGES_DIR).exists()
+
+    def test_not_in_services_directory(self, tmp_path: Path) -> None:
+        """Test that a package is not cached if the operate home of the deployment is unknown."""
+        work_directory = tmp_path / DEPLOYMENT_DIR
+        work_directory.mkdir()
+        (work_directory / "agent.json").write_text(
+            json.dumps({"AEA_AGENT": f"{AGENT}:{AGENT_HASH}"}), encoding="utf-8"
+        )
+        runner = DummyDeploymentRunner(work_directory)
+
+        assert runner._operate_home() is None  # pylint: disable=protected-access
+        assert not runner.is_agent_package_cached()
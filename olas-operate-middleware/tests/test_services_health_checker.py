@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for services.health_checker module."""
+
+import asyncio
+import logging
+import time
+import typing as t
+from http import HTTPStatus
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from operate.services.health_checker import HealthChecker, ServiceHealth
+
+
+SERVICE_CONFIG_ID = "sc-00000000-0000-0000-0000-000000000000"
+
+# the periods of the checker, in seconds, shortened so that the tests run fast
+PERIODS = {
+    "port_up_timeout": 0.2,
+    "sleep_period": 0.02,
+    "port_up_sleep_period": 0.02,
+}
+
+
+class ResponseStub:
+    """Stubs the response of the healthcheck endpoint."""
+
+    def __init__(self, is_healthy: bool) -> None:
+        """Initialize the response."""
+        self.status = HTTPStatus.OK
+        self.is_healthy = is_healthy
+
+    async def __aenter__(self) -> "ResponseStub":
+        """Enter the response's context."""
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        """Exit the response's context."""
+
+    async def json(self) -> t.Dict:
+        """Get the response's body."""
+        return {"is_healthy": self.is_healthy}
+
+    async def text(self) -> str:
+        """Get the response's text."""
+        return ""
+
+
+class SessionStub:
+    """Stubs the HTTP session shared by the probes.
+
+    The port is down while `reachable` is unset, and the service is healthy while `healthy` is set.
+    A probe is held in flight while `blocked` is set.
+    """
+
+    def __init__(self, reachable: bool = True, healthy: bool = True) -> None:
+        """Initialize the session."""
+        self.reachable = reachable
+        self.healthy = healthy
+        self.blocked: t.Optional[asyncio.Event] = None
+        self.requests = 0
+        self.closed = False
+
+    def get(self, url: str) -> t.Any:
+        """Request the healthcheck endpoint."""
+        del url
+        self.requests += 1
+        session = self
+
+        class _Request:
+            async def __aenter__(self) -> ResponseStub:
+                if session.blocked is not None:
+                    await session.blocked.wait()
+                if not session.reachable:
+                    raise ConnectionRefusedError("port is not up")
+                return ResponseStub(session.healthy)
+
+            async def __aexit__(self, *args: t.Any) -> None:
+                pass
+
+        return _Request()
+
+    async def close(self) -> None:
+        """Close the session."""
+        self.closed = True
+
+
+class ServiceManagerStub:
+    """Stubs the service manager, recording the restarts."""
+
+    def __init__(
+        self,
+        path: Path,
+        fail_restarts: bool = False,
+        on_deploy: t.Optional[t.Callable[[], None]] = None,
+    ) -> None:
+        """Initialize the service manager."""
+        self.path = path
+        self.fail_restarts = fail_restarts
+        self.on_deploy = on_deploy
+        self.stops = 0
+        self.deploys = 0
+
+    def load(self, service_config_id: str) -> t.Any:
+        """Load a service."""
+        del service_config_id
+        return SimpleNamespace(path=self.path)
+
+    def stop_service_locally(self, **kwargs: t.Any) -> None:
+        """Stop a service."""
+        del kwargs
+        self.stops += 1
+
+    def deploy_service_locally(self, **kwargs: t.Any) -> None:
+        """Deploy a service."""
+        del kwargs
+        self.deploys += 1
+        if self.on_deploy is not None:
+            self.on_deploy()
+        if self.fail_restarts:
+            raise RuntimeError("deployment failed")
+
+
+def _checker(
+    service_manager: ServiceManagerStub, session: SessionStub, number_of_fails: int = 2
+) -> HealthChecker:
+    """Get a health checker which probes over the given session."""
+    checker = HealthChecker(
+        service_manager=t.cast(t.Any, service_manager),
+        logger=logging.getLogger("test_health_checker"),
+        number_of_fails=number_of_fails,
+    )
+    for name, value in PERIODS.items():
+        setattr(checker, name, value)
+    checker._session = t.cast(t.Any, session)  # pylint: disable=protected-access
+    return checker
+
+
+def _state(checker: HealthChecker) -> ServiceHealth:
+    """Get the health state of the service."""
+    return checker._services[SERVICE_CONFIG_ID]  # pylint: disable=protected-access
+
+
+async def _wait_until(condition: t.Callable[[], bool], timeout: float = 5.0) -> None:
+    """Wait until the condition holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("The condition was not met in time.")
+        await asyncio.sleep(0.01)
+
+
+class TestHealthChecker:
+    """Tests for `HealthChecker`."""
+
+    def test_schedule_probe_jitter(self, tmp_path: Path) -> None:
+        """Test that the probes are scheduled within the jitter of the period, so that they spread out."""
+        checker = _checker(ServiceManagerStub(tmp_path), SessionStub())
+        state = ServiceHealth(service_path=tmp_path)
+        period = 10.0
+        delays = []
+        for _ in range(50):
+            before = time.monotonic()
+            checker._schedule_probe(state, period)  # pylint: disable=protected-access
+            delays.append(state.next_probe_at - before)
+
+        assert all(
+            period * (1 - HealthChecker.JITTER) - 0.1
+            <= delay
+            <= period * (1 + HealthChecker.JITTER) + 0.1
+            for delay in delays
+        )
+        assert len(set(delays)) > 1
+        checker._restart_executor.shutdown()  # pylint: disable=protected-access
+
+    def test_healthy_service(self, tmp_path: Path) -> None:
+        """Test that a healthy service is probed periodically and is not restarted."""
+        service_manager = ServiceManagerStub(tmp_path)
+        session = SessionStub()
+
+        async def _run() -> None:
+            checker = _checker(service_manager, session)
+            checker.start_for_service(SERVICE_CONFIG_ID)
+            await _wait_until(lambda: _state(checker).probes >= 5)
+            assert _state(checker).port_up
+            assert _state(checker).fails == 0
+            assert checker.metrics["services"][SERVICE_CONFIG_ID]["probes"] >= 5
+            await checker.close()
+
+        asyncio.run(_run())
+        assert service_manager.deploys == 0
+        assert (tmp_path / "healthcheck.json").exists()
+
+    def test_port_wait_timeout_restarts(self, tmp_path: Path) -> None:
+        """Test that a service whose port is not up within the timeout is restarted."""
+        service_manager = ServiceManagerStub(tmp_path)
+        session = SessionStub(reachable=False)
+
+        async def _run() -> None:
+            checker = _checker(service_manager, session)
+            checker.start_for_service(SERVICE_CONFIG_ID)
+            started_at = time.monotonic()
+            await _wait_until(lambda: service_manager.deploys == 1)
+            await _wait_until(lambda: not _state(checker).restarting)
+            state = _state(checker)
+            assert not state.port_up
+            assert state.restarts == 1
+            # the port is waited for again after the restart
+            assert state.port_wait_started_at >= started_at + PERIODS["port_up_timeout"]
+            await checker.close()
+
+        asyncio.run(_run())
+        assert service_manager.stops == 1
+
+    def test_fail_threshold_restarts(self, tmp_path: Path) -> None:
+        """Test that a service which is not healthy for a number of probes in a row is restarted."""
+        session = SessionStub(healthy=False)
+
+        def _on_deploy() -> None:
+            # the port of the restarted service is not up yet
+            session.reachable = False
+
+        service_manager = ServiceManagerStub(tmp_path, on_deploy=_on_deploy)
+
+        async def _run() -> None:
+            checker = _checker(service_manager, session, number_of_fails=3)
+            checker.start_for_service(SERVICE_CONFIG_ID)
+            await _wait_until(lambda: service_manager.deploys == 1)
+            await _wait_until(lambda: not _state(checker).restarting)
+            state = _state(checker)
+            assert state.fails == 0
+            assert not state.port_up
+            # one probe for the port, and one per fail
+            assert state.probes >= 4
+            assert checker.metrics["restarts"] == 1
+            await checker.close()
+
+        asyncio.run(_run())
+
+    def test_failed_restart_returns_to_port_wait(self, tmp_path: Path) -> None:
+        """Test that the port is waited for again after a failed restart, and that the service is restarted again."""
+        service_manager = ServiceManagerStub(tmp_path, fail_restarts=True)
+        session = SessionStub(reachable=False)
+
+        async def _run() -> None:
+            checker = _checker(service_manager, session)
+            checker.start_for_service(SERVICE_CONFIG_ID)
+            await _wait_until(lambda: service_manager.deploys == 1)
+            await _wait_until(lambda: not _state(checker).restarting)
+            assert not _state(checker).port_up
+            probes = _state(checker).probes
+
+            # the port is probed again, and becomes up
+            session.reachable = True
+            await _wait_until(lambda: _state(checker).port_up)
+            assert _state(checker).probes > probes
+            assert _state(checker).restarts >= 1
+            await checker.close()
+
+        asyncio.run(_run())
+
+    def test_stop_for_service_during_probe(self, tmp_path: Path) -> None:
+        """Test that the result of a probe which is in flight when the service is stopped is discarded."""
+        service_manager = ServiceManagerStub(tmp_path)
+        session = SessionStub(healthy=False)
+
+        async def _run() -> None:
+            session.blocked = asyncio.Event()
+            checker = _checker(service_manager, session, number_of_fails=1)
+            checker.start_for_service(SERVICE_CONFIG_ID)
+            state = _state(checker)
+            await _wait_until(lambda: state.probing and session.requests == 1)
+
+            checker.stop_for_service(SERVICE_CONFIG_ID)
+            session.blocked.set()
+            await _wait_until(
+                lambda: not checker._tasks  # pylint: disable=protected-access
+            )
+            assert state.probes == 0
+            assert checker.metrics["services"] == {}
+            await checker.close()
+
+        asyncio.run(_run())
+        assert service_manager.deploys == 0
+
+    def test_close(self, tmp_path: Path) -> None:
+        """Test that closing the checker stops the scheduler, the probes and releases the session and executor."""
+        service_manager = ServiceManagerStub(tmp_path)
+        session = SessionStub()
+
+        async def _run() -> None:
+            session.blocked = asyncio.Event()
+            checker = _checker(service_manager, session)
+            checker.start_for_service(SERVICE_CONFIG_ID)
+            await _wait_until(lambda: session.requests == 1)
+            tasks = set(checker._tasks)  # pylint: disable=protected-access
+            scheduler = checker._scheduler  # pylint: disable=protected-access
+
+            await checker.close()
+
+            assert session.closed
+            assert checker.metrics["services"] == {}
+            assert checker._scheduler is None  # pylint: disable=protected-access
+            assert scheduler is not None and scheduler.cancelled()
+            assert tasks and all(task.cancelled() for task in tasks)
+            with pytest.raises(RuntimeError):
+                checker._restart_executor.submit(  # pylint: disable=protected-access
+                    print
+                )
+
+        asyncio.run(_run())
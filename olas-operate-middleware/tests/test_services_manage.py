@@ -19,15 +19,20 @@
 
 """Tests for services.service module."""
 
+import shutil
+import time
 import typing as t
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 from deepdiff import DeepDiff
 
 from operate.cli import OperateApp
+from operate.constants import ZERO_ADDRESS
 from operate.operate_types import ServiceTemplate
 from operate.services.manage import ServiceManager
+from operate.services.service import Service
 
 from .test_services_service import DEFAULT_CONFIG_KWARGS
 from tests.constants import OPERATE_TEST
@@ -438,3 +443,101 @@ class TestServiceManager:
                 sender_threshold=sender_threshold,
                 sender_balance=sender_balance,
             )
+
+    def test_service_manager_refill_requirements_concurrent(
+        self, tmp_path: Path, password: str
+    ) -> None:
+        """Test that operate.service_manager().refill_requirements() evaluates the chains concurrently."""
+
+        delay = 0.5
+        chains = ("gnosis", "base", "optimism")
+
+        def _chain_refill_requirements(
+            service: t.Any, service_config_id: str, chain: str
+        ) -> t.Dict:
+            time.sleep(delay)
+            return {
+                "balances": {"0x1": {ZERO_ADDRESS: 1}},
+                "bonded_assets": {},
+                "total_requirements": {"0x1": {ZERO_ADDRESS: 2}},
+                "refill_requirements": {"0x1": {ZERO_ADDRESS: int(chain == "base")}},
+                "protocol_asset_requirements": {},
+                "allow_start_agent": chain != "optimism",
+            }
+
+        operate = OperateApp(
+            home=tmp_path / OPERATE_TEST,
+        )
+        operate.setup()
+        operate.create_user_account(password=password)
+        operate.password = password
+        service_manager = operate.service_manager()
+        service_manager.load = Mock(  # type: ignore
+            return_value=Mock(chain_configs={chain: Mock() for chain in chains})
+        )
+        service_manager._chain_refill_requirements = (  # type: ignore
+            _chain_refill_requirements
+        )
+
+        start = time.monotonic()
+        result = service_manager.refill_requirements("sc-00000000")
+        elapsed = time.monotonic() - start
+
+        assert elapsed < delay * len(chains) / 2
+        assert list(result["balances"]) == list(chains)
+        assert result["refill_requirements"]["base"] == {"0x1": {ZERO_ADDRESS: 1}}
+        assert result["is_refill_required"]
+        assert not result["allow_start_agent"]
+
+    def test_service_manager_get_all_services_registry(
+        self, tmp_path: Path, password: str
+    ) -> None:
+        """Test that operate.service_manager().get_all_services() reuses the loaded services until they change."""
+
+        operate = OperateApp(
+            home=tmp_path / OPERATE_TEST,
+        )
+        operate.setup()
+        operate.create_user_account(password=password)
+        operate.password = password
+        service_manager = operate.service_manager()
+        service = service_manager.create(get_template(**DEFAULT_CONFIG_KWARGS))
+
+        with patch.object(Service, "load", wraps=Service.load) as load:
+            services, success = service_manager.get_all_services()
+            assert success
+            assert services[0].json == service.json
+            assert service_manager.get_all_services()[0][0] is not services[0]
+            load.assert_not_called()
+
+            # the returned services are copies of the registered ones
+            services[0].description = "description_modified"
+            assert service_manager.get_all_services()[0][0].json == service.json
+
+            # a store writes through to the registry
+            service = service_manager.load(service.service_config_id)
+            service.description = "description_updated"
+            service.store()
+            load.reset_mock()
+            assert (
+                service_manager.get_all_services()[0][0].description
+                == "description_updated"
+            )
+            load.assert_not_called()
+
+            # a change on disk invalidates the registered service
+            config = service.path / "config.json"
+            config.write_text(
+                config.read_text(encoding="utf-8").replace(
+                    "description_updated", "description_edited"
+                ),
+                encoding="utf-8",
+            )
+            assert (
+                service_manager.get_all_services()[0][0].description
+                == "description_edited"
+            )
+            load.assert_called_once()
+
+        shutil.rmtree(service.path)
+        assert service_manager.get_all_services() == ([], True)
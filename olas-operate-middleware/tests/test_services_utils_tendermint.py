@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for services.utils.tendermint module."""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from operate.services.utils import tendermint
+from operate.services.utils.tendermint import RotatingLogWriter
+
+
+# long enough for the periodic flushes not to run during a test
+FLUSH_INTERVAL = 60.0
+
+
+def _writer(path: Path, **kwargs: float) -> RotatingLogWriter:
+    """Get a writer of the given log file."""
+    return RotatingLogWriter(
+        path=str(path), flush_interval=FLUSH_INTERVAL, **kwargs  # type: ignore
+    )
+
+
+class TestRotatingLogWriter:
+    """Tests for `RotatingLogWriter`."""
+
+    def test_rotate_by_size(self, tmp_path: Path) -> None:
+        """Test that the file is rotated once it reaches the maximum size."""
+        path = tmp_path / "tendermint.log"
+        writer = _writer(path, max_bytes=10)
+        writer.write("0123456789")
+        writer.write("abc\n")
+        writer.close()
+
+        assert path.read_text() == "abc\n"
+        assert (tmp_path / "tendermint.log.1").read_text() == "0123456789"
+
+    def test_size_in_bytes(self, tmp_path: Path) -> None:
+        """Test that the size of the file is counted in bytes, not in characters."""
+        path = tmp_path / "tendermint.log"
+        writer = _writer(path, max_bytes=10)
+        # 5 characters, 10 bytes
+        writer.write("ααααα")
+        writer.write("abc\n")
+        writer.close()
+
+        assert path.read_text() == "abc\n"
+        assert (tmp_path / "tendermint.log.1").read_text(encoding="utf-8") == "ααααα"
+
+    def test_size_of_existing_file(self, tmp_path: Path) -> None:
+        """Test that the size of a file which already exists is taken into account."""
+        path = tmp_path / "tendermint.log"
+        path.write_text("0123456789")
+        writer = _writer(path, max_bytes=15)
+        writer.write("abcdef")
+        writer.write("ghi\n")
+        writer.close()
+
+        assert path.read_text() == "ghi\n"
+        assert (tmp_path / "tendermint.log.1").read_text() == "0123456789abcdef"
+
+    def test_rotate_by_age(self, tmp_path: Path) -> None:
+        """Test that the file is rotated once it is older than the maximum age."""
+        path = tmp_path / "tendermint.log"
+        writer = _writer(path, max_age=60)
+        with patch.object(tendermint, "time", return_value=1000.0):
+            writer.write("old\n")
+        with patch.object(tendermint, "time", return_value=1059.0):
+            writer.write("recent\n")
+        with patch.object(tendermint, "time", return_value=1060.0):
+            writer.write("new\n")
+        writer.close()
+
+        assert path.read_text() == "new\n"
+        assert (tmp_path / "tendermint.log.1").read_text() == "old\nrecent\n"
+
+    def test_backup_count(self, tmp_path: Path) -> None:
+        """Test that only the given number of rotated files are kept."""
+        path = tmp_path / "tendermint.log"
+        writer = _writer(path, max_bytes=1, backup_count=2)
+        for i in range(5):
+            writer.write(str(i))
+        writer.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "tendermint.log",
+            "tendermint.log.1",
+            "tendermint.log.2",
+        ]
+        assert path.read_text() == "4"
+        assert (tmp_path / "tendermint.log.1").read_text() == "3"
+        assert (tmp_path / "tendermint.log.2").read_text() == "2"
+
+    def test_no_backups(self, tmp_path: Path) -> None:
+        """Test that the file is truncated on rotation when no backups are kept."""
+        path = tmp_path / "tendermint.log"
+        writer = _writer(path, max_bytes=1, backup_count=0)
+        writer.write("0")
+        writer.write("1")
+        writer.close()
+
+        assert [p.name for p in tmp_path.iterdir()] == ["tendermint.log"]
+        assert path.read_text() == "1"
+
+    def test_flush_on_close(self, tmp_path: Path) -> None:
+        """Test that the buffered lines are written to the file on close, and that the flushes stop."""
+        path = tmp_path / "tendermint.log"
+        writer = _writer(path)
+        writer.write("line\n")
+        flushing = writer._flushing  # pylint: disable=protected-access
+
+        assert path.read_text() == ""
+        assert flushing is not None and flushing.is_alive()
+
+        writer.close()
+
+        assert path.read_text() == "line\n"
+        assert not flushing.is_alive()
+        assert writer._file is None  # pylint: disable=protected-access
+
+    def test_periodic_flush(self, tmp_path: Path) -> None:
+        """Test that the buffered lines are flushed periodically."""
+        path = tmp_path / "tendermint.log"
+        writer = RotatingLogWriter(path=str(path), flush_interval=0.01)
+        writer.write("line\n")
+        deadline = time.monotonic() + 5.0
+        while path.read_text() == "" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert path.read_text() == "line\n"
+        writer.close()
+
+    def test_write_after_close(self, tmp_path: Path) -> None:
+        """Test that the lines written after close are flushed right away, without starting the periodic flushes."""
+        path = tmp_path / "tendermint.log"
+        writer = _writer(path)
+        writer.write("before\n")
+        writer.close()
+        writer.write("after\n")
+
+        assert path.read_text() == "before\nafter\n"
+        assert writer._flushing is None  # pylint: disable=protected-access
+
+        writer.open()
+        writer.write("reopened\n")
+        flushing = writer._flushing  # pylint: disable=protected-access
+
+        assert flushing is not None and flushing.is_alive()
+        assert path.read_text() == "before\nafter\n"
+
+        writer.close()
+
+        assert path.read_text() == "before\nafter\nreopened\n"
+        assert not flushing.is_alive()
@@ -26,7 +26,13 @@ import typing as t
 import pytest
 from deepdiff import DeepDiff
 
-from operate.utils import SingletonMeta, merge_sum_dicts, subtract_dicts
+from operate.utils import (
+    CONCURRENT_MAP_MAX_WORKERS,
+    SingletonMeta,
+    concurrent_map,
+    merge_sum_dicts,
+    subtract_dicts,
+)
 
 
 class TestUtils:
@@ -132,6 +138,55 @@ class TestUtils:
         assert not diff, "Test failed."
 
 
+class TestConcurrentMap:
+    """Tests for `concurrent_map`."""
+
+    def test_results_in_order(self) -> None:
+        """Test that the results are returned in the order of the items."""
+
+        def _slow_square(x: int) -> int:
+            time.sleep(0.01 * (5 - x))
+            return x * x
+
+        assert concurrent_map(_slow_square, range(5)) == [0, 1, 4, 9, 16]
+        assert concurrent_map(_slow_square, []) == []
+
+    def test_bounded_threads(self) -> None:
+        """Test that the calls run concurrently, on a bounded number of threads."""
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def _call(x: int) -> int:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return x
+
+        items = list(range(3 * CONCURRENT_MAP_MAX_WORKERS))
+        assert concurrent_map(_call, items) == items
+        assert 1 < max_running <= CONCURRENT_MAP_MAX_WORKERS
+
+    def test_error(self) -> None:
+        """Test that the error of a call is raised after all the calls are done."""
+        done = []
+
+        def _call(x: int) -> int:
+            if x == 0:
+                raise ValueError("failed")
+            time.sleep(0.02)
+            done.append(x)
+            return x
+
+        with pytest.raises(ValueError, match="failed"):
+            concurrent_map(_call, range(4))
+        assert sorted(done) == [1, 2, 3]
+
+
 class TestSingletonMeta:
     """Tests for SingletonMeta metaclass."""
 
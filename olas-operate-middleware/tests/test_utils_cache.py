@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for utils.cache module."""
+
+import json
+import time
+import typing as t
+from pathlib import Path
+
+from operate.utils.cache import (
+    BALANCES,
+    BONDED_ASSETS,
+    ChainDataCache,
+    STAKING_PARAMS_STORE_VERSION,
+    StakingParamsStore,
+)
+
+
+SERVICE_CONFIG_ID = "sc-00000000-0000-0000-0000-000000000000"
+STAKING_CONTRACT = "0x389B46c259631Acd6a69Bde8B6cEe218230bAE8C"
+
+
+class Counter:
+    """Count the computations of a cached value."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.calls = 0
+
+    def __call__(self) -> t.Dict:
+        """Compute the value."""
+        self.calls += 1
+        return {"calls": self.calls}
+
+
+class TestChainDataCache:
+    """Tests for `ChainDataCache`."""
+
+    def setup_method(self) -> None:
+        """Start every test with an empty cache."""
+        ChainDataCache().invalidate()
+
+    def test_get(self) -> None:
+        """Test that the data are computed again only once they expire."""
+        cache = ChainDataCache()
+        assert cache is ChainDataCache()
+        compute = Counter()
+
+        assert cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute) == {"calls": 1}
+        value = cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute)
+        assert value == {"calls": 1}
+        value["calls"] = 100
+        assert cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute) == {"calls": 1}
+        assert cache.get(BALANCES, "base", SERVICE_CONFIG_ID, compute) == {"calls": 2}
+        assert cache.get(BONDED_ASSETS, "gnosis", SERVICE_CONFIG_ID, compute) == {
+            "calls": 3
+        }
+
+        ttl = cache.ttls[BALANCES]
+        cache.ttls[BALANCES] = 0.0
+        try:
+            assert cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute) == {
+                "calls": 4
+            }
+        finally:
+            cache.ttls[BALANCES] = ttl
+
+    def test_get_other_inputs(self) -> None:
+        """Test that the data are computed again if they were computed from other inputs."""
+        cache = ChainDataCache()
+        compute = Counter()
+        inputs = (frozenset({"0x1"}), frozenset({"0x0"}))
+
+        assert cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute, inputs) == {
+            "calls": 1
+        }
+        assert cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute, inputs) == {
+            "calls": 1
+        }
+        other_inputs = (frozenset({"0x1", "0x2"}), frozenset({"0x0"}))
+        assert cache.get(
+            BALANCES, "gnosis", SERVICE_CONFIG_ID, compute, other_inputs
+        ) == {"calls": 2}
+
+    def test_invalidate(self) -> None:
+        """Test that invalidated data are computed again."""
+        cache = ChainDataCache()
+        compute = Counter()
+        cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute)
+        cache.get(BALANCES, "base", SERVICE_CONFIG_ID, compute)
+        cache.get(BONDED_ASSETS, "gnosis", SERVICE_CONFIG_ID, compute)
+
+        cache.invalidate(chain="gnosis", data_classes=(BALANCES,))
+        assert cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, compute) == {"calls": 4}
+        assert cache.get(BALANCES, "base", SERVICE_CONFIG_ID, compute) == {"calls": 2}
+        assert cache.get(BONDED_ASSETS, "gnosis", SERVICE_CONFIG_ID, compute) == {
+            "calls": 3
+        }
+
+        cache.invalidate(scope=SERVICE_CONFIG_ID)
+        assert cache.get(BALANCES, "base", SERVICE_CONFIG_ID, compute) == {"calls": 5}
+
+    def test_fetched_at(self) -> None:
+        """Test that the time at which the oldest data were read is reported."""
+        cache = ChainDataCache()
+        assert cache.fetched_at(SERVICE_CONFIG_ID) is None
+
+        before = time.time()
+        cache.get(BONDED_ASSETS, "gnosis", SERVICE_CONFIG_ID, Counter())
+        time.sleep(0.01)
+        cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, Counter())
+        fetched_at = cache.fetched_at(SERVICE_CONFIG_ID)
+        assert fetched_at is not None and before <= fetched_at < time.time() - 0.01
+
+    def test_fetched_at_data_classes(self) -> None:
+        """Test that the time at which the data of the given classes were read is reported."""
+        cache = ChainDataCache()
+        cache.get(BONDED_ASSETS, "gnosis", SERVICE_CONFIG_ID, Counter())
+        time.sleep(0.01)
+        before = time.time()
+        cache.get(BALANCES, "gnosis", SERVICE_CONFIG_ID, Counter())
+
+        fetched_at = cache.fetched_at(SERVICE_CONFIG_ID, data_classes=(BALANCES,))
+        assert fetched_at is not None and fetched_at >= before
+        oldest = cache.fetched_at(SERVICE_CONFIG_ID)
+        assert oldest is not None and oldest < before
+
+
+class TestStakingParamsStore:
+    """Tests for `StakingParamsStore`."""
+
+    def test_get(self, tmp_path: Path) -> None:
+        """Test that the staking params are read once and kept across restarts."""
+        path = tmp_path / "staking_params.json"
+        store = StakingParamsStore()
+        assert store is StakingParamsStore()
+        store.setup(path=path)
+        compute = Counter()
+
+        assert store.get("gnosis", STAKING_CONTRACT, compute) == {"calls": 1}
+        assert store.get("gnosis", STAKING_CONTRACT.lower(), compute) == {"calls": 1}
+        assert store.get("base", STAKING_CONTRACT, compute) == {"calls": 2}
+
+        # a restart loads the stored params
+        store.setup(path=path)
+        assert store.get("gnosis", STAKING_CONTRACT, compute) == {"calls": 1}
+        assert compute.calls == 2
+
+    def test_setup_discards_other_versions(self, tmp_path: Path) -> None:
+        """Test that the params stored with another version of the format are discarded."""
+        path = tmp_path / "staking_params.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": STAKING_PARAMS_STORE_VERSION - 1,
+                    "params": {"gnosis": {STAKING_CONTRACT.lower(): {"calls": 0}}},
+                }
+            ),
+            encoding="utf-8",
+        )
+        store = StakingParamsStore()
+        store.setup(path=path)
+        assert store.get("gnosis", STAKING_CONTRACT, Counter()) == {"calls": 1}
+
+        path.write_text("{", encoding="utf-8")
+        store.setup(path=path)
+        assert store.get("gnosis", STAKING_CONTRACT, Counter()) == {"calls": 1}
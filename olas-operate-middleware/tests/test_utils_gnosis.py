@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for utils.gnosis module."""
+
+import typing as t
+from unittest import mock
+
+import pytest
+from web3 import Web3
+
+from operate.constants import ZERO_ADDRESS
+from operate.utils.gnosis import (
+    BALANCE_OF_SELECTOR,
+    GET_ETH_BALANCE_SELECTOR,
+    GET_OWNERS_SELECTOR,
+    MULTICALL3_ADDRESS,
+    get_assets_balances,
+    get_owners_and_balances,
+)
+
+
+TOKEN = "0x00000000000000000000000000000000000000E0"
+SAFE = "0x00000000000000000000000000000000000000a5"
+OWNERS = [
+    "0x000000000000000000000000000000000000000A",
+    "0x000000000000000000000000000000000000000b",
+]
+ADDRESSES = {
+    "0x0000000000000000000000000000000000000001",
+    "0x0000000000000000000000000000000000000002",
+}
+
+
+def balance_of(asset: str, address: str) -> int:
+    """Get a dummy balance."""
+    return int(asset, 16) * 1000 + int(address, 16)
+
+
+def aggregate3(calls: t.List[t.Tuple[str, bool, str]]) -> mock.MagicMock:
+    """Mock Multicall3's `aggregate3`, reading the dummy balances."""
+    results = []
+    for target, _, call_data in calls:
+        selector, address = call_data[:10], "0x" + call_data[-40:]
+        asset = ZERO_ADDRESS if selector == GET_ETH_BALANCE_SELECTOR else target
+        assert selector in (GET_ETH_BALANCE_SELECTOR, BALANCE_OF_SELECTOR)
+        assert selector != GET_ETH_BALANCE_SELECTOR or target == MULTICALL3_ADDRESS
+        results.append((True, balance_of(asset, address).to_bytes(32, "big")))
+    return mock.MagicMock(call=mock.MagicMock(return_value=results))
+
+
+class TestGetAssetsBalances:
+    """Tests for `get_assets_balances`."""
+
+    def test_multicall(self) -> None:
+        """Test that all the balances are read with a single multicall."""
+        ledger_api = mock.MagicMock()
+        multicall = ledger_api.api.eth.contract.return_value
+        multicall.functions.aggregate3.side_effect = aggregate3
+        with mock.patch("operate.utils.gnosis.get_asset_balance") as get_asset_balance:
+            balances = get_assets_balances(ledger_api, {ZERO_ADDRESS, TOKEN}, ADDRESSES)
+
+        get_asset_balance.assert_not_called()
+        multicall.functions.aggregate3.assert_called_once()
+        assert balances == {
+            address: {
+                ZERO_ADDRESS: balance_of(ZERO_ADDRESS, address),
+                TOKEN: balance_of(TOKEN, address),
+            }
+            for address in ADDRESSES
+        }
+
+    def test_fallback(self) -> None:
+        """Test that the balances are read one by one if the multicall fails."""
+        ledger_api = mock.MagicMock()
+        multicall = ledger_api.api.eth.contract.return_value
+        multicall.functions.aggregate3.side_effect = ValueError("No Multicall3")
+        with mock.patch(
+            "operate.utils.gnosis.get_asset_balance", return_value=1
+        ) as get_asset_balance:
+            balances = get_assets_balances(ledger_api, {ZERO_ADDRESS, TOKEN}, ADDRESSES)
+
+        assert get_asset_balance.call_count == 4
+        assert balances == {
+            address: {ZERO_ADDRESS: 1, TOKEN: 1} for address in ADDRESSES
+        }
+
+    def test_invalid_address(self) -> None:
+        """Test the handling of invalid addresses."""
+        ledger_api = mock.MagicMock()
+        with pytest.raises(ValueError, match="Invalid address"):
+            get_assets_balances(ledger_api, {ZERO_ADDRESS}, {"invalid"})
+
+        balances = get_assets_balances(
+            ledger_api, {ZERO_ADDRESS}, {"invalid"}, raise_on_invalid_address=False
+        )
+        assert balances == {"invalid": {ZERO_ADDRESS: 0}}
+
+
+class TestGetOwnersAndBalances:
+    """Tests for `get_owners_and_balances`."""
+
+    def test_multicall(self) -> None:
+        """Test that the owners and balances are read with a single multicall."""
+        ledger_api = mock.MagicMock()
+        ledger_api.api.codec.decode.return_value = (
+            [owner.lower() for owner in OWNERS],
+        )
+        multicall = ledger_api.api.eth.contract.return_value
+
+        def _aggregate3(calls: t.List[t.Tuple[str, bool, str]]) -> mock.MagicMock:
+            (target, allow_failure, call_data), *balance_calls = calls
+            assert (target.lower(), allow_failure, call_data) == (
+                SAFE,
+                False,
+                GET_OWNERS_SELECTOR,
+            )
+            result = aggregate3(balance_calls).call()
+            return mock.MagicMock(
+                call=mock.MagicMock(return_value=[(True, b"owners"), *result])
+            )
+
+        multicall.functions.aggregate3.side_effect = _aggregate3
+        with mock.patch("operate.utils.gnosis.get_asset_balance") as get_asset_balance:
+            owners, balances = get_owners_and_balances(
+                ledger_api, SAFE, [ZERO_ADDRESS, TOKEN]
+            )
+
+        get_asset_balance.assert_not_called()
+        multicall.functions.aggregate3.assert_called_once()
+        ledger_api.api.codec.decode.assert_called_once_with(["address[]"], b"owners")
+        assert owners == [Web3.to_checksum_address(owner) for owner in OWNERS]
+        assert list(balances) == [ZERO_ADDRESS, TOKEN]
+        assert balances == {
+            ZERO_ADDRESS: balance_of(ZERO_ADDRESS, SAFE),
+            TOKEN: balance_of(TOKEN, SAFE),
+        }
+
+    def test_fallback(self) -> None:
+        """Test that the owners and balances are read one by one if the multicall fails."""
+        ledger_api = mock.MagicMock()
+        multicall = ledger_api.api.eth.contract.return_value
+        multicall.functions.aggregate3.side_effect = ValueError("No Multicall3")
+        with mock.patch(
+            "operate.utils.gnosis.get_owners", return_value=OWNERS
+        ) as get_owners, mock.patch(
+            "operate.utils.gnosis.get_asset_balance", return_value=1
+        ) as get_asset_balance:
+            owners, balances = get_owners_and_balances(
+                ledger_api, SAFE, [ZERO_ADDRESS, TOKEN]
+            )
+
+        get_owners.assert_called_once()
+        assert get_asset_balance.call_count == 2
+        assert owners == [Web3.to_checksum_address(owner) for owner in OWNERS]
+        assert balances == {ZERO_ADDRESS: 1, TOKEN: 1}
@@ -18,3 +18,73 @@
 # ------------------------------------------------------------------------------
 
 """Test for wallet.master module."""
+
+import typing as t
+from pathlib import Path
+from unittest import mock
+
+from operate.constants import ZERO_ADDRESS
+from operate.ledger.profiles import OLAS, USDC
+from operate.operate_types import Chain
+from operate.utils.cache import ChainDataCache
+from operate.wallet.master import EthereumMasterWallet
+
+
+MASTER_EOA = "0x0000000000000000000000000000000000000001"
+BACKUP_OWNER = "0x0000000000000000000000000000000000000002"
+MASTER_SAFE = "0x0000000000000000000000000000000000000003"
+
+
+class TestEthereumMasterWallet:
+    """Tests for `EthereumMasterWallet`."""
+
+    def test_extended_json(self, tmp_path: Path) -> None:
+        """Test that the extended json reads the owners once and the balances on every call."""
+        ChainDataCache().invalidate()
+        chains = (Chain.GNOSIS, Chain.BASE)
+        wallet = EthereumMasterWallet(
+            path=tmp_path,
+            address=MASTER_EOA,
+            safes={chain: MASTER_SAFE for chain in chains},
+            safe_chains=list(chains),
+        )
+
+        def _get_owners_and_balances(
+            ledger_api: t.Any, safe: str, asset_addresses: t.List[str]
+        ) -> t.Tuple[t.List[str], t.Dict[str, int]]:
+            return [MASTER_EOA, BACKUP_OWNER], {asset: 1 for asset in asset_addresses}
+
+        def _get_assets_balances(
+            ledger_api: t.Any, asset_addresses: t.Set[str], addresses: t.Set[str]
+        ) -> t.Dict[str, t.Dict[str, int]]:
+            return {
+                address: {asset: 2 for asset in asset_addresses}
+                for address in addresses
+            }
+
+        with mock.patch.object(wallet, "ledger_api"), mock.patch(
+            "operate.wallet.master.get_owners_and_balances",
+            side_effect=_get_owners_and_balances,
+        ) as get_owners_and_balances, mock.patch(
+            "operate.wallet.master.get_assets_balances",
+            side_effect=_get_assets_balances,
+        ):
+            for expected_balance in (1, 2):
+                wallet_json = wallet.extended_json
+                assert wallet_json["extended_json"] is True
+                assert wallet_json["consistent_safe_address"] is True
+                assert wallet_json["consistent_backup_owner"] is True
+                assert wallet_json["consistent_backup_owner_count"] is True
+                for chain in chains:
+                    assert wallet_json["safes"][chain.value] == {
+                        MASTER_SAFE: {
+                            "backup_owners": [BACKUP_OWNER],
+                            "balances": {
+                                ZERO_ADDRESS: expected_balance,
+                                OLAS[chain]: expected_balance,
+                                USDC[chain]: expected_balance,
+                            },
+                        }
+                    }
+
+            assert get_owners_and_balances.call_count == len(chains)
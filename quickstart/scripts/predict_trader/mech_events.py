@@ -23,13 +23,16 @@
 import json
 import os
 import requests
+import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from string import Template
 from tqdm import tqdm
-from typing import Any, ClassVar, Dict
+from typing import Any, ClassVar, Dict, Iterable, Optional, Tuple
 
 from gql import Client, gql
 from gql.transport.requests import RequestsHTTPTransport
@@ -40,6 +43,7 @@ from scripts.utils import get_subgraph_api_key
 
 SCRIPT_PATH = Path(__file__).resolve().parent
 MECH_EVENTS_JSON_PATH = Path(SCRIPT_PATH.parents[1], "data", "mech_events.json")
+MECH_EVENTS_DB_PATH = MECH_EVENTS_JSON_PATH.with_suffix(".db")
 HTTP = "http://"
 HTTPS = HTTP[:4] + "s" + HTTP[4:]
 CID_PREFIX = "f01701220"
@@ -57,6 +61,9 @@ SUBGRAPH_HEADERS = {
     "Content-Type": "application/json",
 }
 QUERY_BATCH_SIZE = 1000
+IPFS_MAX_IN_FLIGHT_REQUESTS = 16
+IPFS_REQUEST_TIMEOUT = 30
+DB_COMMIT_BATCH_SIZE = 100
 MECH_EVENTS_SUBGRAPH_QUERY_TEMPLATE = Template(
     """
     query mech_events_subgraph_query($sender: Bytes, $id_gt: Bytes, $first: Int)  {
@@ -78,6 +85,30 @@ MECH_EVENTS_SUBGRAPH_QUERY_TEMPLATE = Template(
     """
 )
 
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Get the HTTP session of the current thread, reusing its connections to the IPFS gateway."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+
+def _fetch_ipfs_contents(ipfs_hash: str) -> Tuple[str, Dict[str, Any]]:
+    """Fetch the IPFS contents of an event, trying its metadata file first."""
+    url = f"{IPFS_ADDRESS}{ipfs_hash}"
+    for _url in [f"{url}/metadata.json", url]:
+        try:
+            response = _get_session().get(_url, timeout=IPFS_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return _url, response.json()
+        except Exception:  # pylint: disable=broad-except
+            continue
+    return "", {}
+
+
 @dataclass
 class MechBaseEvent:  # pylint: disable=too-many-instance-attributes
     """Base class for mech's on-chain event representation."""
@@ -102,28 +133,20 @@ class MechBaseEvent:  # pylint: disable=too-many-instance-attributes
         transaction_hash: str,
         block_number: int,
         block_timestamp: int,
+        ipfs_contents: Optional[Tuple[str, Dict[str, Any]]] = None,
     ):  # pylint: disable=too-many-arguments
-        """Initializes the MechBaseEvent"""
+        """Initializes the MechBaseEvent, fetching its IPFS contents unless they are given as (link, contents)."""
         self.event_id = event_id
         self.sender = sender
         self.ipfs_hash = ipfs_hash
         self.transaction_hash = transaction_hash
         self.block_number = block_number
         self.block_timestamp = block_timestamp
-        self.ipfs_link = ""
-        self.ipfs_contents = {}
-        self._populate_ipfs_contents(ipfs_hash)
-
-    def _populate_ipfs_contents(self, data: str) -> None:
-        url = f"{IPFS_ADDRESS}{data}"
-        for _url in [f"{url}/metadata.json", url]:
-            try:
-                response = requests.get(_url)
-                response.raise_for_status()
-                self.ipfs_contents = response.json()
-                self.ipfs_link = _url
-            except Exception:  # pylint: disable=broad-except
-                continue
+        self.ipfs_link, self.ipfs_contents = (
+            ipfs_contents
+            if ipfs_contents is not None
+            else _fetch_ipfs_contents(ipfs_hash)
+        )
 
 
 @dataclass
@@ -136,7 +159,11 @@ class MechRequest(MechBaseEvent):
     event_name: ClassVar[str] = "Request"
     subgraph_event_name: ClassVar[str] = "request"
 
-    def __init__(self, event: AttributeDict):
+    def __init__(
+        self,
+        event: AttributeDict,
+        ipfs_contents: Optional[Tuple[str, Dict[str, Any]]] = None,
+    ):
         """Initializes the MechRequest"""
 
         super().__init__(
@@ -146,6 +173,7 @@ class MechRequest(MechBaseEvent):
             transaction_hash=event["transactionHash"],
             block_number=int(event["blockNumber"]),
             block_timestamp=int(event["blockTimestamp"]),
+            ipfs_contents=ipfs_contents,
         )
 
         self.request_id = self.event_id
@@ -153,45 +181,102 @@ class MechRequest(MechBaseEvent):
         self.fee = DEFAULT_MECH_FEE
 
 
-def _read_mech_events_data_from_file() -> Dict[str, Any]:
-    """Read Mech events data from the JSON file."""
+def _import_mech_events_json(connection: sqlite3.Connection) -> None:
+    """Import the events of the former JSON database, if any, into the SQLite database."""
+    if not MECH_EVENTS_JSON_PATH.exists():
+        return
+
+    current_time = time.strftime("%Y-%m-%d_%H-%M-%S")
     try:
         with open(MECH_EVENTS_JSON_PATH, "r", encoding="utf-8") as file:
             mech_events_data = json.load(file)
-
-        # Check if it is an old DB version
-        if mech_events_data.get("db_version", 0) < MECH_EVENTS_DB_VERSION:
-            current_time = time.strftime("%Y-%m-%d_%H-%M-%S")
-            old_db_filename = f"mech_events.{current_time}.old.json"
-            os.rename(MECH_EVENTS_JSON_PATH, MECH_EVENTS_JSON_PATH.parent / old_db_filename)
-            mech_events_data = {}
-            mech_events_data["db_version"] = MECH_EVENTS_DB_VERSION
-    except FileNotFoundError:
-        mech_events_data = {}
-        mech_events_data["db_version"] = MECH_EVENTS_DB_VERSION
     except json.decoder.JSONDecodeError:
         print(
             f'\nERROR: The local Mech events database "{MECH_EVENTS_JSON_PATH.resolve()}" is corrupted. Please try delete or rename the file, and run the script again.'
         )
         sys.exit(1)
 
-    return mech_events_data
+    # Events of an old DB version are discarded
+    if mech_events_data.pop("db_version", 0) < MECH_EVENTS_DB_VERSION:
+        os.rename(
+            MECH_EVENTS_JSON_PATH,
+            MECH_EVENTS_JSON_PATH.parent / f"mech_events.{current_time}.old.json",
+        )
+        return
+
+    with connection:
+        for sender, sender_events in mech_events_data.items():
+            for event_name, events in sender_events.items():
+                _insert_mech_events(connection, sender, event_name, events.values())
+    os.rename(
+        MECH_EVENTS_JSON_PATH,
+        MECH_EVENTS_JSON_PATH.parent / f"mech_events.{current_time}.migrated.json",
+    )
 
 
-MINIMUM_WRITE_FILE_DELAY = 20
-last_write_time = 0.0
+def _connect_mech_events_db() -> sqlite3.Connection:
+    """Connect to the local Mech events database, creating it if needed."""
+    MECH_EVENTS_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        connection = sqlite3.connect(MECH_EVENTS_DB_PATH)
+        (db_version,) = connection.execute("PRAGMA user_version").fetchone()
 
+        # Check if it is an old DB version
+        if 0 < db_version < MECH_EVENTS_DB_VERSION:
+            connection.close()
+            current_time = time.strftime("%Y-%m-%d_%H-%M-%S")
+            os.rename(
+                MECH_EVENTS_DB_PATH,
+                MECH_EVENTS_DB_PATH.parent / f"mech_events.{current_time}.old.db",
+            )
+            connection = sqlite3.connect(MECH_EVENTS_DB_PATH)
+
+        with connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS mech_events (
+                    sender TEXT NOT NULL,
+                    event_name TEXT NOT NULL,
+                    event_id TEXT NOT NULL,
+                    block_timestamp INTEGER NOT NULL,
+                    has_ipfs_contents INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (sender, event_name, event_id)
+                )
+                """
+            )
+            connection.execute(f"PRAGMA user_version = {MECH_EVENTS_DB_VERSION}")
+    except sqlite3.DatabaseError:
+        print(
+            f'\nERROR: The local Mech events database "{MECH_EVENTS_DB_PATH.resolve()}" is corrupted. Please try delete or rename the file, and run the script again.'
+        )
+        sys.exit(1)
 
-def _write_mech_events_data_to_file(
-    mech_events_data: Dict[str, Any], force_write: bool = False
-) -> None:
-    global last_write_time  # pylint: disable=global-statement
-    now = time.time()
+    _import_mech_events_json(connection)
+    return connection
 
-    if force_write or (now - last_write_time) >= MINIMUM_WRITE_FILE_DELAY:
-        with open(MECH_EVENTS_JSON_PATH, "w", encoding="utf-8") as file:
-            json.dump(mech_events_data, file, indent=2)
-        last_write_time = now
+
+def _insert_mech_events(
+    connection: sqlite3.Connection,
+    sender: str,
+    event_name: str,
+    events: Iterable[Dict[str, Any]],
+) -> None:
+    """Insert or replace events in the local Mech events database."""
+    connection.executemany(
+        "INSERT OR REPLACE INTO mech_events VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (
+                sender,
+                event_name,
+                event["event_id"],
+                int(event["block_timestamp"]),
+                bool(event.get("ipfs_contents")),
+                json.dumps(event),
+            )
+            for event in events
+        ),
+    )
 
 
 def get_mech_subgraph_url() -> str:
@@ -244,38 +329,57 @@ def _update_mech_events_db(
         f"    Sender address: {sender}"
     )
 
+    connection = _connect_mech_events_db()
     try:
         # Query the subgraph
         query = _query_mech_events_subgraph(sender, event_cls)
         subgraph_data = query["data"]
 
-        # Read the current Mech events database
-        mech_events_data = _read_mech_events_data_from_file()
-        stored_events = mech_events_data.setdefault(sender, {}).setdefault(
-            event_cls.event_name, {}
-        )
-
+        # Events are fetched again until their IPFS contents are found
+        complete_event_ids = {
+            event_id
+            for (event_id,) in connection.execute(
+                "SELECT event_id FROM mech_events WHERE sender = ? AND event_name = ? AND has_ipfs_contents",
+                (sender, event_cls.event_name),
+            )
+        }
         subgraph_event_set_name = f"{event_cls.subgraph_event_name}s"
-        for subgraph_event in tqdm(
-            subgraph_data[subgraph_event_set_name],
-            miniters=1,
-            desc="        Processing",
-        ):
-            if subgraph_event[
-                "requestId"
-            ] not in stored_events or not stored_events.get(
-                subgraph_event["requestId"], {}
-            ).get(
-                "ipfs_contents"
-            ):
-                mech_event = event_cls(subgraph_event)  # type: ignore
-                stored_events[mech_event.event_id] = mech_event.__dict__
-
-                _write_mech_events_data_to_file(mech_events_data=mech_events_data)
-
-        _write_mech_events_data_to_file(
-            mech_events_data=mech_events_data, force_write=True
-        )
+        pending_events = [
+            subgraph_event
+            for subgraph_event in subgraph_data[subgraph_event_set_name]
+            if subgraph_event["requestId"] not in complete_event_ids
+        ]
+
+        # The IPFS contents are fetched concurrently, and each event is inserted as soon as they arrive,
+        # so an interrupted update resumes from the events still missing
+        with ThreadPoolExecutor(max_workers=IPFS_MAX_IN_FLIGHT_REQUESTS) as executor:
+            futures = {
+                executor.submit(
+                    _fetch_ipfs_contents, subgraph_event["ipfsHash"]
+                ): subgraph_event
+                for subgraph_event in pending_events
+            }
+            try:
+                for i, future in enumerate(
+                    tqdm(
+                        as_completed(futures),
+                        total=len(futures),
+                        miniters=1,
+                        desc="        Processing",
+                    )
+                ):
+                    mech_event = event_cls(  # type: ignore
+                        futures[future], ipfs_contents=future.result()
+                    )
+                    _insert_mech_events(
+                        connection, sender, event_cls.event_name, [mech_event.__dict__]
+                    )
+                    if (i + 1) % DB_COMMIT_BATCH_SIZE == 0:
+                        connection.commit()
+            finally:
+                for future in futures:
+                    future.cancel()
+                connection.commit()
 
     except KeyboardInterrupt:
         print(
@@ -293,17 +397,31 @@ def _update_mech_events_db(
             "You may attempt to rerun this script to retry synchronizing the database."
         )
         input("Press Enter to continue...")
+    finally:
+        connection.close()
 
     print("")
 
 
-def _get_mech_events(sender: str, event_cls: type[MechBaseEvent]) -> Dict[str, Any]:
-    """Updates the local database of Mech events and returns the Mech events."""
+def _get_mech_events(
+    sender: str,
+    event_cls: type[MechBaseEvent],
+    from_timestamp: float = DEFAULT_FROM_TIMESTAMP,
+    to_timestamp: float = DEFAULT_TO_TIMESTAMP,
+) -> Dict[str, Any]:
+    """Updates the local database of Mech events and returns the Mech events within the time range."""
 
     _update_mech_events_db(sender, event_cls)
-    mech_events_data = _read_mech_events_data_from_file()
-    sender_data = mech_events_data.get(sender, {})
-    return sender_data.get(event_cls.event_name, {})
+    connection = _connect_mech_events_db()
+    try:
+        rows = connection.execute(
+            "SELECT event_id, data FROM mech_events WHERE sender = ? AND event_name = ? AND block_timestamp BETWEEN ? AND ? "
+            "ORDER BY block_timestamp",
+            (sender, event_cls.event_name, from_timestamp, to_timestamp),
+        )
+        return {event_id: json.loads(data) for event_id, data in rows}
+    finally:
+        connection.close()
 
 
 def get_mech_requests(
@@ -313,11 +431,4 @@ def get_mech_requests(
 ) -> Dict[str, Any]:
     """Returns the Mech requests."""
 
-    all_mech_events = _get_mech_events(sender, MechRequest)
-    filtered_mech_events = {}
-    for event_id, event_data in all_mech_events.items():
-        block_timestamp = int(event_data["block_timestamp"])
-        if from_timestamp <= block_timestamp <= to_timestamp:
-            filtered_mech_events[event_id] = event_data
-
-    return filtered_mech_events
+    return _get_mech_events(sender, MechRequest, from_timestamp, to_timestamp)
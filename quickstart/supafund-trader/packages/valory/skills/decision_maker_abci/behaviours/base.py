@@ -20,7 +20,7 @@
 """This module contains the base behaviour for the 'decision_maker_abci' skill."""
 
 import dataclasses
-import os
+import importlib.util
 from abc import ABC
 from datetime import datetime, timedelta
 from enum import Enum
@@ -46,7 +46,12 @@ from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.protocols.ipfs import IpfsMessage
 from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
 from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
+from packages.valory.skills.decision_maker_abci.io_.cache import PackagesCache
+from packages.valory.skills.decision_maker_abci.io_.dataset import DatasetIndex
 from packages.valory.skills.decision_maker_abci.io_.loader import ComponentPackageLoader
+from packages.valory.skills.decision_maker_abci.io_.results import (
+    BenchmarkResultsWriter,
+)
 from packages.valory.skills.decision_maker_abci.models import (
     AccuracyInfoFields,
     BenchmarkingMockData,
@@ -86,9 +91,7 @@ WXDAI = "0xe91D153E0b41518A2Ce8Dd3D7944Fa863463a97d"
 BET_AMOUNT_FIELD = "bet_amount"
 SUPPORTED_STRATEGY_LOG_LEVELS = ("info", "warning", "error")
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
-NEW_LINE = "\n"
-QUOTE = '"'
-TWO_QUOTES = '""'
+STRATEGIES_CACHE_DIRNAME = "strategies"
 INIT_LIQUIDITY_INFO = LiquidityInfo()
 
 
@@ -119,7 +122,11 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         self.multisend_data = b""
         self._safe_tx_hash = ""
         self._policy: Optional[EGreedyPolicy] = None
-        self._inflight_strategy_req: Optional[str] = None
+        # a mapping from the nonces of the in-flight strategy requests to the strategies and their file hashes
+        self._inflight_strategy_reqs: Dict[str, Tuple[str, str]] = {}
+        self.strategies_cache = PackagesCache(
+            self.params.store_path / STRATEGIES_CACHE_DIRNAME
+        )
 
         self.sell_amount: int = 0
         self.buy_amount: int = 0
@@ -148,6 +155,27 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         """Get the executable strategy file's content."""
         return self.shared_state.strategies_executables.get(strategy, None)
 
+    def _strategy_namespace(
+        self, trading_strategy: str, strategy_exec: str
+    ) -> Dict[str, Any]:
+        """Get the isolated namespace of a strategy, executing its code only if the strategy's file hash has changed."""
+        # if the strategy was not downloaded via a file hash, its executable identifies it instead
+        file_hash = self.shared_state.strategies_filehashes.get(
+            trading_strategy, strategy_exec
+        )
+        cached = self.shared_state.strategies_namespaces.get(trading_strategy, None)
+        if cached is not None and cached[0] == file_hash:
+            return cached[1]
+
+        code = compile(strategy_exec, f"<{trading_strategy} strategy>", "exec")
+        namespace: Dict[str, Any] = {}
+        exec(code, namespace)  # pylint: disable=W0122  # nosec
+        self.shared_state.strategies_namespaces[trading_strategy] = (
+            file_hash,
+            namespace,
+        )
+        return namespace
+
     def execute_strategy(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
         """Execute the strategy and return the results."""
         trading_strategy = kwargs.pop("trading_strategy", None)
@@ -163,11 +191,8 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
             return {BET_AMOUNT_FIELD: 0}
 
         strategy_exec, callable_method = strategy
-        if callable_method in globals():
-            del globals()[callable_method]
-
-        exec(strategy_exec, globals())  # pylint: disable=W0122  # nosec
-        method = globals().get(callable_method, None)
+        namespace = self._strategy_namespace(trading_strategy, strategy_exec)
+        method = namespace.get(callable_method, None)
         if method is None:
             self.context.logger.error(
                 f"No {callable_method!r} method was found in {trading_strategy} strategy's executable."
@@ -189,6 +214,28 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
             raise ValueError("Attempted to access the mock data while being empty!")
         return mock_data
 
+    @property
+    def dataset_index(self) -> DatasetIndex:
+        """Return the index of the benchmarking dataset, building it if this has not been done yet."""
+        dataset_index = self.shared_state.dataset_index
+        if dataset_index is None:
+            dataset_index = DatasetIndex(
+                self.params.store_path / self.benchmarking_mode.dataset_filename,
+                self.benchmarking_mode.sep,
+                self.benchmarking_mode.question_id_field,
+            )
+            self.shared_state.dataset_index = dataset_index
+        return dataset_index
+
+    def initialize_bet_id_row_manager(self) -> Dict[str, List[int]]:
+        """Initialization of the dictionary used to traverse mocked tool responses."""
+        rows_per_question = self.dataset_index.rows_per_question
+        # the row numbers are copied, as they are consumed while the benchmark is running
+        return {
+            question_id: list(row_numbers)
+            for question_id, row_numbers in rows_per_question.items()
+        }
+
     @property
     def acc_info_fields(self) -> AccuracyInfoFields:
         """Return the accuracy information fieldnames."""
@@ -399,29 +446,57 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         self.shared_state.req_to_callback[nonce] = callback
         self.shared_state.in_flight_req = True
 
-    def _handle_get_strategy(self, message: IpfsMessage, _: Dialogue) -> None:
-        """Handle get strategy response."""
-        strategy_req = self._inflight_strategy_req
-        if strategy_req is None:
-            self.context.logger.error(f"No strategy request to handle for {message=}.")
-            return
-
-        # store the executable and remove the hash from the mapping because we have downloaded it
+    def _set_strategy(
+        self, strategy: str, file_hash: str, files: Dict[str, str]
+    ) -> None:
+        """Set the executable of a strategy from the files of its component package."""
         _component_yaml, strategy_exec, callable_method = ComponentPackageLoader.load(
-            message.files
+            files
         )
 
-        self.shared_state.strategies_executables[strategy_req] = (
+        self.shared_state.strategies_executables[strategy] = (
             strategy_exec,
             callable_method,
         )
-        self.shared_state.strategy_to_filehash.pop(strategy_req)
-        self._inflight_strategy_req = None
+        self.shared_state.strategies_filehashes[strategy] = file_hash
+        # remove the hash from the mapping because the strategy has been obtained
+        self.shared_state.strategy_to_filehash.pop(strategy, None)
+
+    def _handle_get_strategy(self, message: IpfsMessage, dialogue: Dialogue) -> None:
+        """Handle get strategy response."""
+        nonce = dialogue.dialogue_label.dialogue_reference[0]
+        strategy_req = self._inflight_strategy_reqs.pop(nonce, None)
+        if strategy_req is None:
+            self.context.logger.error(f"No strategy request to handle for {message=}.")
+            return
+
+        strategy, file_hash = strategy_req
+        self._set_strategy(strategy, file_hash, message.files)
+        try:
+            self.strategies_cache.write(file_hash, message.files)
+        except (PermissionError, OSError) as exc:
+            self.context.logger.error(
+                f"Could not cache the {strategy} strategy's package: {exc}"
+            )
 
-    def download_next_strategy(self) -> None:
-        """Download the strategies one by one.
+    def load_cached_strategies(self) -> None:
+        """Load the strategies whose packages have been cached on the disk, by their file hashes."""
+        pending = list(self.shared_state.strategy_to_filehash.items())
+        for strategy, file_hash in pending:
+            try:
+                files = self.strategies_cache.read(file_hash)
+                if files is None:
+                    continue
+                self._set_strategy(strategy, file_hash, files)
+            except (ValueError, OSError) as exc:
+                self.context.logger.warning(
+                    f"Could not load the cached package of the {strategy} strategy: {exc}"
+                )
+                continue
+            self.context.logger.info(f"Loaded {strategy} strategy from the cache.")
 
-        The next strategy in the list is downloaded each time this method is called.
+    def download_pending_strategies(self) -> None:
+        """Request all the strategies which are pending to be fetched concurrently.
 
         We download all the strategies,
         because in the future we will perform some complicated logic,
@@ -430,24 +505,25 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
 
         :return: None
         """
-        if self._inflight_strategy_req is not None:
-            # there already is a req in flight
-            return
-        if len(self.shared_state.strategy_to_filehash) == 0:
-            # no strategies pending to be fetched
-            return
+        inflight_strategies = {
+            strategy for strategy, _ in self._inflight_strategy_reqs.values()
+        }
         for strategy, file_hash in self.shared_state.strategy_to_filehash.items():
+            if strategy in inflight_strategies:
+                continue
             self.context.logger.info(f"Fetching {strategy} strategy...")
-            ipfs_msg, message = self._build_ipfs_get_file_req(file_hash)
-            self._inflight_strategy_req = strategy
-            self.send_message(ipfs_msg, message, self._handle_get_strategy)
-            return
+            ipfs_msg, dialogue = self._build_ipfs_get_file_req(file_hash)
+            nonce = dialogue.dialogue_label.dialogue_reference[0]
+            self._inflight_strategy_reqs[nonce] = (strategy, file_hash)
+            self.send_message(ipfs_msg, dialogue, self._handle_get_strategy)
 
     def download_strategies(self) -> Generator:
         """Download all the strategies, if not yet downloaded."""
-        while len(self.shared_state.strategy_to_filehash) > 0:
-            self.download_next_strategy()
-            yield from self.sleep(self.params.sleep_time)
+        self.load_cached_strategies()
+        self.download_pending_strategies()
+        yield from self.wait_for_condition(
+            lambda: len(self.shared_state.strategy_to_filehash) == 0
+        )
 
     def get_bet_amount(
         self,
@@ -705,6 +781,41 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
             self.context.logger.info(f"Retrying in {sleep_time} seconds.")
             yield from self.sleep(sleep_time)
 
+    @property
+    def benchmark_results(self) -> BenchmarkResultsWriter:
+        """Return the writer of the benchmarking results, creating it if this has not been done yet."""
+        benchmark_results = self.shared_state.benchmark_results
+        if benchmark_results is not None:
+            return benchmark_results
+
+        mode = self.benchmarking_mode
+        columnar = mode.columnar_results
+        if columnar and importlib.util.find_spec("pyarrow") is None:
+            self.context.logger.error(
+                "The columnar benchmarking results require `pyarrow` to be installed. "
+                "Only the CSV results will be written."
+            )
+            columnar = False
+
+        fields = (
+            (mode.question_id_field, str),
+            (mode.question_field, str),
+            (mode.answer_field, str),
+            (P_YES_FIELD, float),
+            (P_NO_FIELD, float),
+            (CONFIDENCE_FIELD, float),
+            (mode.bet_amount_field, int),
+            (L0_START_FIELD, int),
+            (L1_START_FIELD, int),
+            (L0_END_FIELD, int),
+            (L1_END_FIELD, int),
+        )
+        benchmark_results = BenchmarkResultsWriter(
+            self.params.store_path / mode.results_filename, fields, columnar
+        )
+        self.shared_state.benchmark_results = benchmark_results
+        return benchmark_results
+
     def _write_benchmark_results(
         self,
         prediction_response: PredictionResponse,
@@ -712,47 +823,20 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         liquidity_info: LiquidityInfo = INIT_LIQUIDITY_INFO,
     ) -> None:
         """Write the results to the benchmarking file."""
-        add_headers = False
-        results_path = self.params.store_path / self.benchmarking_mode.results_filename
-        if not os.path.isfile(results_path):
-            add_headers = True
-
-        with open(results_path, "a") as results_file:
-            if add_headers:
-                headers = (
-                    self.benchmarking_mode.question_id_field,
-                    self.benchmarking_mode.question_field,
-                    self.benchmarking_mode.answer_field,
-                    P_YES_FIELD,
-                    P_NO_FIELD,
-                    CONFIDENCE_FIELD,
-                    self.benchmarking_mode.bet_amount_field,
-                    L0_START_FIELD,
-                    L1_START_FIELD,
-                    L0_END_FIELD,
-                    L1_END_FIELD,
-                )
-                row = ",".join(headers) + NEW_LINE
-                results_file.write(row)
-
-            results = (
-                self.mock_data.id,
-                # reintroduce duplicate quotes and quote the question
-                # as it may contain commas which are also used as separators
-                QUOTE + self.mock_data.question.replace(QUOTE, TWO_QUOTES) + QUOTE,
-                self.mock_data.answer,
-                prediction_response.p_yes,
-                prediction_response.p_no,
-                prediction_response.confidence,
-                bet_amount,
-                liquidity_info.l0_start,
-                liquidity_info.l1_start,
-                liquidity_info.l0_end,
-                liquidity_info.l1_end,
-            )
-            results_text = tuple(str(res) for res in results)
-            row = ",".join(results_text) + NEW_LINE
-            results_file.write(row)
+        results = (
+            self.mock_data.id,
+            self.mock_data.question,
+            self.mock_data.answer,
+            prediction_response.p_yes,
+            prediction_response.p_no,
+            prediction_response.confidence,
+            bet_amount,
+            liquidity_info.l0_start,
+            liquidity_info.l1_start,
+            liquidity_info.l0_end,
+            liquidity_info.l1_end,
+        )
+        self.benchmark_results.append(results)
 
     def _calc_token_amount(
         self,
@@ -19,7 +19,6 @@
 
 """This module contains the behaviour for the decision-making of the skill."""
 
-import csv
 import json
 from copy import deepcopy
 from datetime import datetime
@@ -118,10 +117,6 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
         :return: a dictionary with the header fields mapped to the values of the first row.
             If no rows are left to process in the file, returns `None`.
         """
-        sep = self.benchmarking_mode.sep
-        dataset_filepath = (
-            self.params.store_path / self.benchmarking_mode.dataset_filename
-        )
         active_sampled_bet = self.get_active_sampled_bet()
         sampled_bet_id = active_sampled_bet.id
 
@@ -138,17 +133,11 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
             self._rows_exceeded = True
             return None
 
-        row_with_headers: Optional[Dict[str, str]] = None
-        with open(dataset_filepath) as read_dataset:
-            reader = csv.DictReader(read_dataset, delimiter=sep)
-
-            for _ in range(next_mock_data_row):
-                row_with_headers = next(reader, {})
-
-            if not row_with_headers:
-                # if no rows are in the file, then we finished the benchmarking
-                self._rows_exceeded = True
-                return None
+        row_with_headers = self.dataset_index.row(next_mock_data_row)
+        if not row_with_headers:
+            # if no rows are in the file, then we finished the benchmarking
+            self._rows_exceeded = True
+            return None
 
         msg = f"Processing question in row with index {next_mock_data_row}: {row_with_headers}"
         self.context.logger.info(msg)
@@ -569,22 +558,6 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
             return True
         return False
 
-    def initialize_bet_id_row_manager(self) -> Dict[str, List[int]]:
-        """Initialization of the dictionary used to traverse mocked tool responses."""
-        bets_mapping: Dict[str, List[int]] = {}
-        dataset_filepath = (
-            self.params.store_path / self.benchmarking_mode.dataset_filename
-        )
-
-        with open(dataset_filepath, mode="r") as file:
-            reader = csv.DictReader(file)
-            for row_number, row in enumerate(reader, start=1):
-                question_id = row[self.benchmarking_mode.question_id_field]
-                if question_id not in bets_mapping:
-                    bets_mapping[question_id] = []
-                bets_mapping[question_id].append(row_number)
-        return bets_mapping
-
     def async_act(self) -> Generator:
         """Do the action."""
 
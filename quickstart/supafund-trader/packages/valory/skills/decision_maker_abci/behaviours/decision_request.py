@@ -19,10 +19,9 @@
 
 """This module contains the behaviour of the skill which is responsible for requesting a decision from the mech."""
 
-import csv
 import json
 from dataclasses import asdict
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, Optional
 from uuid import uuid4
 
 from packages.valory.skills.decision_maker_abci.behaviours.base import (
@@ -72,22 +71,6 @@ class DecisionRequestBehaviour(DecisionMakerBaseBehaviour):
         msg = f"Prepared metadata {self.metadata!r} for the request."
         self.context.logger.info(msg)
 
-    def initialize_bet_id_row_manager(self) -> Dict[str, List[int]]:
-        """Initialization of the dictionary used to traverse mocked tool responses."""
-        bets_mapping: Dict[str, List[int]] = {}
-        dataset_filepath = (
-            self.params.store_path / self.benchmarking_mode.dataset_filename
-        )
-
-        with open(dataset_filepath, mode="r") as file:
-            reader = csv.DictReader(file)
-            for row_number, row in enumerate(reader, start=1):
-                question_id = row[self.benchmarking_mode.question_id_field]
-                if question_id not in bets_mapping:
-                    bets_mapping[question_id] = []
-                bets_mapping[question_id].append(row_number)
-        return bets_mapping
-
     def async_act(self) -> Generator:
         """Do the action."""
         with self.context.benchmark_tool.measure(self.behaviour_id).local():
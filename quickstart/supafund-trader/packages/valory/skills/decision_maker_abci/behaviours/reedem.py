@@ -503,7 +503,7 @@ class RedeemBehaviour(RedeemInfoBehaviour):
             return False
 
         # get the user's positions
-        user_positions = yield from self.fetch_user_positions(safe_address)
+        user_positions = yield from self.fetch_positions_index(safe_address)
         if user_positions is None:
             return False
 
@@ -139,6 +139,13 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             bets_by_status[QueueStatus.REPROCESSED],
         )
 
+    def _bet_idx(self, bet: Bet) -> int:
+        """Get the index of the given bet, out of all the available bets."""
+        idx = self.bets.get_idx(bet.id)
+        if idx is None:
+            raise ValueError(f"Bet {bet.id!r} is not part of the available bets.")
+        return idx
+
     def _sampled_bet_idx(self, bets: List[Bet]) -> int:
         """
         Sample a bet and return its index.
@@ -167,7 +174,7 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
 
         sorted_bets = self._sort_by_priority_logic(bets_to_sort)
 
-        return self.bets.index(sorted_bets[0])
+        return self._bet_idx(sorted_bets[0])
 
     def _sampling_benchmarking_bet(self, bets: List[Bet]) -> Optional[int]:
         """Sample bet for benchmarking"""
@@ -192,7 +199,7 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
         bets_to_sort: List[Bet] = to_process_bets or processed_bets or reprocessed_bets
         sorted_bets = self._sort_by_priority_logic(bets_to_sort)
 
-        return self.bets.index(sorted_bets[0])
+        return self._bet_idx(sorted_bets[0])
 
     def _sample(self) -> Optional[int]:
         """Sample a bet, mark it as processed, and return its index."""
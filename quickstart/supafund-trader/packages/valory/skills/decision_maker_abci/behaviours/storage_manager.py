@@ -208,18 +208,13 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
 
     def _get_tools_from_benchmark_file(self) -> None:
         """Get the tools from the benchmark dataset."""
-        dataset_filepath = (
-            self.params.store_path / self.benchmarking_mode.dataset_filename
-        )
-        with open(dataset_filepath) as read_dataset:
-            row = read_dataset.readline()
-            if not row:
-                # if no headers are in the file, then we finished the benchmarking
-                self.context.logger.error("No headers in dataset file.")
-                return
+        headers = self.dataset_index.fieldnames
+        if not headers:
+            # if no headers are in the file, then we finished the benchmarking
+            self.context.logger.error("No headers in dataset file.")
+            return
 
         # parse tools from headers
-        headers = row.split(self.benchmarking_mode.sep)
         p_yes_part = self.benchmarking_mode.p_yes_field_part
         self.mech_tools = [
             header.replace(p_yes_part, "") for header in headers if p_yes_part in header
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains an on-disk cache of the component packages downloaded from IPFS."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+
+READ_MODE = "r"
+WRITE_MODE = "w"
+PACKAGE_EXTENSION = ".json"
+
+
+class PackagesCache:
+    """A directory storing the files of each component package, addressed by the package's IPFS hash."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache."""
+        self.path = path
+
+    def _package_path(self, file_hash: str) -> Path:
+        """Get the path of the package with the given hash."""
+        return self.path / f"{file_hash}{PACKAGE_EXTENSION}"
+
+    def read(self, file_hash: str) -> Optional[Dict[str, str]]:
+        """Read the files of the package with the given hash, if it is cached."""
+        package_path = self._package_path(file_hash)
+        if not package_path.is_file():
+            return None
+        with open(package_path, READ_MODE) as package_file:
+            files = json.load(package_file)
+        if not isinstance(files, dict):
+            raise ValueError(f"Invalid cached package in {str(package_path)!r}.")
+        return files
+
+    def write(self, file_hash: str, files: Dict[str, str]) -> None:
+        """Write the files of the package with the given hash."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        package_path = self._package_path(file_hash)
+        # the package is written to a temporary file first so that an interrupted write is never read as a package
+        tmp_path = package_path.with_name(package_path.name + ".tmp")
+        with open(tmp_path, WRITE_MODE) as package_file:
+            json.dump(files, package_file)
+        os.replace(tmp_path, package_path)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a random-access index of the benchmarking dataset."""
+
+import csv
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+
+READ_BINARY_MODE = "rb"
+ENCODING = "utf-8"
+
+
+class DatasetIndex:
+    """An index of the byte offset of each row of a CSV dataset, built with a single pass over the file.
+
+    The rows are numbered starting from 1 and, same as with a `csv.DictReader`, the header and the empty rows are not
+    counted. The rows of each question are also indexed, so that they can be replayed without scanning the file again.
+    """
+
+    def __init__(self, path: Path, sep: str, question_id_field: str) -> None:
+        """Initialize the index, by scanning the dataset once."""
+        self.path = path
+        self.sep = sep
+        self.fieldnames: List[str] = []
+        self._offsets: List[int] = []
+        self.rows_per_question: Dict[str, List[int]] = {}
+        self._build(question_id_field)
+
+    @staticmethod
+    def _lines(file: BinaryIO, starts: List[int]) -> Iterator[str]:
+        """Iterate over the lines of the file, recording the offset of each line in the given list."""
+        while True:
+            starts.append(file.tell())
+            line = file.readline()
+            if not line:
+                return
+            yield line.decode(ENCODING)
+
+    def _records(self, file: BinaryIO) -> Iterator[Tuple[int, List[str]]]:
+        """Iterate over the non-empty records of the file, along with the offset at which each one starts."""
+        # a record may span multiple lines if it contains quoted newlines,
+        # and the reader only consumes the lines of a record before returning it
+        starts: List[int] = []
+        reader = csv.reader(self._lines(file, starts), delimiter=self.sep)
+        for record in reader:
+            record_start = starts[0]
+            starts.clear()
+            if record:
+                yield record_start, record
+
+    def _build(self, question_id_field: str) -> None:
+        """Build the index of the dataset."""
+        with open(self.path, READ_BINARY_MODE) as file:
+            records = self._records(file)
+            _header_start, self.fieldnames = next(records, (0, []))
+            if not self.fieldnames:
+                return
+
+            question_id_idx = self.fieldnames.index(question_id_field)
+            for row_number, (record_start, record) in enumerate(records, start=1):
+                self._offsets.append(record_start)
+                question_id = record[question_id_idx]
+                self.rows_per_question.setdefault(question_id, []).append(row_number)
+
+    def __len__(self) -> int:
+        """Get the number of rows in the dataset."""
+        return len(self._offsets)
+
+    def _to_dict(self, record: List[str]) -> Dict[Any, Any]:
+        """Map the header fields to the values of a record, in the same way as a `csv.DictReader`."""
+        row: Dict[Any, Any] = dict(zip(self.fieldnames, record))
+        n_fields = len(self.fieldnames)
+        if len(record) > n_fields:
+            row[None] = record[n_fields:]
+        for field in self.fieldnames[len(record) :]:
+            row[field] = None
+        return row
+
+    def row(self, row_number: int) -> Optional[Dict[str, str]]:
+        """Get the row with the given number, if it exists, reading only that row from the dataset."""
+        if not 0 < row_number <= len(self._offsets):
+            return None
+
+        with open(self.path, READ_BINARY_MODE) as file:
+            file.seek(self._offsets[row_number - 1])
+            _record_start, record = next(self._records(file))
+        return self._to_dict(record)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a buffered writer of the benchmarking results."""
+
+import csv
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, TextIO, Tuple, Type
+
+
+APPEND_MODE = "a"
+COLUMNAR_EXTENSION = ".arrow"
+# the maximum number of rows to keep in memory, regardless of whether the simulated day is over
+MAX_BUFFERED_ROWS = 1000
+
+FieldsType = Sequence[Tuple[str, Type]]
+
+
+class BenchmarkResultsWriter:
+    """A sink of the benchmarking results, which stays open for the whole session and writes the rows in batches.
+
+    The rows are always appended to a CSV file. If the columnar output is enabled, they are also written as an Arrow
+    IPC stream next to it, which requires `pyarrow` to be installed.
+    """
+
+    def __init__(self, path: Path, fields: FieldsType, columnar: bool = False) -> None:
+        """Initialize the writer, given the path of the CSV file and the name and type of each field."""
+        self.path = path
+        self.fields = fields
+        self.columnar = columnar
+        self._rows: List[Sequence[Any]] = []
+        self._file: Optional[TextIO] = None
+        self._writer: Any = None
+        self._columnar_writer: Any = None
+
+    @property
+    def columnar_path(self) -> Path:
+        """Get the path of the columnar copy of the results."""
+        return self.path.with_suffix(COLUMNAR_EXTENSION)
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Append a row of results, which is written on the next flush."""
+        self._rows.append(row)
+        if len(self._rows) >= MAX_BUFFERED_ROWS:
+            self.flush()
+
+    def _open(self) -> None:
+        """Open the CSV file in append mode, writing the headers if the file is empty."""
+        self._file = open(self.path, APPEND_MODE, newline="")  # pylint: disable=R1732
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow(name for name, _ in self.fields)
+
+    def _write_columnar(self, rows: List[Sequence[Any]]) -> None:
+        """Write the given rows to the columnar copy of the results, as a record batch."""
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        # big integers such as wei amounts do not fit in 64 bits, so they are stored as decimals
+        arrow_types = {str: pa.string(), float: pa.float64(), int: pa.decimal128(38)}
+        schema = pa.schema(
+            (name, arrow_types[type_]) for name, type_ in self.fields  # type: ignore
+        )
+
+        if self._columnar_writer is None:
+            # a stream cannot be appended to, so the results of any previous session are rewritten to the new one
+            # the previous results are read in memory, as the file is truncated when the new stream is opened
+            previous = None
+            if self.columnar_path.is_file():
+                with pa.ipc.open_stream(self.columnar_path.read_bytes()) as reader:
+                    previous = reader.read_all()
+            self._columnar_writer = pa.ipc.new_stream(str(self.columnar_path), schema)
+            if previous is not None:
+                self._columnar_writer.write_table(previous.cast(schema))
+
+        columns = [
+            [None if value is None else type_(value) for value in column]
+            for (_, type_), column in zip(self.fields, zip(*rows))
+        ]
+        self._columnar_writer.write_batch(
+            pa.RecordBatch.from_arrays(columns, schema=schema)
+        )
+
+    def flush(self) -> None:
+        """Write the buffered rows."""
+        if not self._rows:
+            return
+
+        rows, self._rows = self._rows, []
+        if self._file is None:
+            self._open()
+        # the values are written as text, so that missing values are written as `None`, like they were always written
+        self._writer.writerows([str(value) for value in row] for row in rows)
+        self._file.flush()  # type: ignore
+        if self.columnar:
+            self._write_columnar(rows)
+
+    def close(self) -> None:
+        """Flush the buffered rows and close the files."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._columnar_writer is not None:
+            self._columnar_writer.close()
+            self._columnar_writer = None
@@ -25,7 +25,19 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from string import Template
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from aea.exceptions import enforce
 from aea.skills.base import Model, SkillContext
@@ -45,12 +57,20 @@ from packages.valory.skills.agent_performance_summary_abci.models import (
     AgentPerformanceSummaryParams,
 )
 from packages.valory.skills.chatui_abci.models import SharedState as BaseSharedState
+from packages.valory.skills.decision_maker_abci.io_.dataset import DatasetIndex
+from packages.valory.skills.decision_maker_abci.io_.results import (
+    BenchmarkResultsWriter,
+)
 from packages.valory.skills.decision_maker_abci.policy import EGreedyPolicy
 from packages.valory.skills.decision_maker_abci.redeem_info import Trade
 from packages.valory.skills.decision_maker_abci.rounds import DecisionMakerAbciApp
 from packages.valory.skills.market_manager_abci.bets import Bet
+from packages.valory.skills.market_manager_abci.graph_tooling.utils import (
+    PositionsIndex,
+)
 from packages.valory.skills.market_manager_abci.models import (
     MarketManagerParams,
+    PositionsIndexKeyType,
     Subgraph,
 )
 from packages.valory.skills.mech_interact_abci.models import (
@@ -198,6 +218,9 @@ class SharedState(BaseSharedState):
         self.redeeming_progress: RedeemingProgress = RedeemingProgress()
         self.strategy_to_filehash: Dict[str, str] = {}
         self.strategies_executables: Dict[str, Tuple[str, str]] = {}
+        # the file hash of each downloaded strategy, and the namespace in which its executable has been run
+        self.strategies_filehashes: Dict[str, str] = {}
+        self.strategies_namespaces: Dict[str, Tuple[str, Dict[str, Any]]] = {}
         self.in_flight_req: bool = False
         self.req_to_callback: Dict[str, Callable] = {}
         self.mock_data: Optional[BenchmarkingMockData] = None
@@ -215,10 +238,18 @@ class SharedState(BaseSharedState):
         # the mapping from bet id to the row number in the dataset
         # the key is the market id/question_id
         self.bet_id_row_manager: Dict[str, List[int]] = {}
+        # the index of the benchmarking dataset, built once and used to read its rows directly
+        self.dataset_index: Optional[DatasetIndex] = None
+        # the writer of the benchmarking results, kept open for the whole benchmarking session
+        self.benchmark_results: Optional[BenchmarkResultsWriter] = None
         # mech call counter for benchmarking behaviour
         self.benchmarking_mech_calls: int = 0
         # whether the code has detected the new mech marketplace being used
         self.new_mm_detected: Optional[bool] = None
+        # the latest index of the user's positions, shared with the market manager's behaviours
+        self.positions_index: Optional[
+            Tuple[PositionsIndexKeyType, PositionsIndex]
+        ] = None
 
     @property
     def mock_question_id(self) -> Any:
@@ -260,7 +291,7 @@ class SharedState(BaseSharedState):
         self.liquidity_amounts[self.mock_question_id] = value
 
     def _initialize_simulated_now_timestamps(
-        self, bets: List[Bet], safe_voting_range: int
+        self, bets: Iterable[Bet], safe_voting_range: int
     ) -> None:
         """Creates the list of simulated days for the benchmarking mode"""
         self.simulated_days_idx = 0
@@ -291,13 +322,16 @@ class SharedState(BaseSharedState):
     def increase_one_day_simulation(self) -> None:
         """Increased the index used for the current simulated day."""
         self.simulated_days_idx += 1
+        # the results of a simulated day are written once the day is over
+        if self.benchmark_results is not None:
+            self.benchmark_results.flush()
 
     def check_benchmarking_finished(self) -> bool:
         """Checks if we simulated already all days."""
         return self.simulated_days_idx >= len(self.simulated_days)
 
     def get_simulated_now_timestamp(
-        self, bets: List[Bet], safe_voting_range: int
+        self, bets: Iterable[Bet], safe_voting_range: int
     ) -> int:
         """Gets the current simulated day timestamp."""
         if len(self.simulated_days) == 0:
@@ -325,6 +359,12 @@ class SharedState(BaseSharedState):
                 f"is not in the strategies' executables {strategy_exec}."
             )
 
+    def teardown(self) -> None:
+        """Tear down the model."""
+        if self.benchmark_results is not None:
+            self.benchmark_results.close()
+        super().teardown()
+
 
 def extract_keys_from_template(delimiter: str, template: str) -> Set[str]:
     """Extract the keys from a string template, given the delimiter."""
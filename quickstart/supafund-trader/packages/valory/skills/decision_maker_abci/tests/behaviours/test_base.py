@@ -42,6 +42,7 @@ from packages.valory.skills.decision_maker_abci.behaviours.base import (
 from packages.valory.skills.decision_maker_abci.behaviours.blacklisting import (
     BlacklistingBehaviour,
 )
+from packages.valory.skills.decision_maker_abci.io_.cache import PackagesCache
 from packages.valory.skills.decision_maker_abci.tests.conftest import profile_name
 from packages.valory.skills.market_manager_abci.behaviours import READ_MODE
 
@@ -154,6 +155,8 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
         context_mock.state.synchronized_data.db.get_strict = lambda _: 0
         self.round_sequence_mock.block_stall_deadline_expired = False
         self.behaviour = BlacklistingBehaviour(name="", skill_context=context_mock)
+        self.behaviour.shared_state.strategies_filehashes = {}
+        self.behaviour.shared_state.strategies_namespaces = {}
         self.benchmark_dir = MagicMock()
 
     @given(strategy_executables())
@@ -220,6 +223,54 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
         res = behaviour.execute_strategy(*args, **kwargs)
         assert res == expected_result
 
+    def test_execute_strategy_cached(self) -> None:
+        """Test that the strategy's executable is only run again if its file hash changes."""
+        behaviour = self.behaviour
+        shared_state = behaviour.shared_state
+        with open(DUMMY_STRATEGY_PATH, READ_MODE) as strategy_file:
+            dummy_strategy = strategy_file.read()
+        shared_state.strategies_executables = {"test": (dummy_strategy, "dummy")}
+        shared_state.strategies_filehashes = {"test": "hash"}
+
+        assert behaviour.execute_strategy(trading_strategy="test") == "dummy"
+        namespace = shared_state.strategies_namespaces["test"][1]
+        assert behaviour.execute_strategy(trading_strategy="test") == "dummy"
+        assert shared_state.strategies_namespaces["test"][1] is namespace
+        assert "dummy" not in globals()
+
+        shared_state.strategies_executables["test"] = (
+            dummy_strategy.replace('"dummy"', '"updated"'),
+            "dummy",
+        )
+        assert behaviour.execute_strategy(trading_strategy="test") == "dummy"
+        shared_state.strategies_filehashes["test"] = "new_hash"
+        assert behaviour.execute_strategy(trading_strategy="test") == "updated"
+
+    def test_load_cached_strategies(self, tmp_path: Path) -> None:
+        """Test that the strategies cached on the disk are loaded without being downloaded."""
+        behaviour = self.behaviour
+        shared_state = behaviour.shared_state
+        behaviour.strategies_cache = PackagesCache(tmp_path)
+        with open(DUMMY_STRATEGY_PATH, READ_MODE) as strategy_file:
+            dummy_strategy = strategy_file.read()
+        files = {
+            "component.yaml": "entry_point: dummy_strategy.py\ncallable: dummy\n",
+            "dummy_strategy.py": dummy_strategy,
+        }
+        behaviour.strategies_cache.write("cached_hash", files)
+        shared_state.strategy_to_filehash = {
+            "cached": "cached_hash",
+            "missing": "missing_hash",
+        }
+        shared_state.strategies_executables = {}
+
+        behaviour.load_cached_strategies()
+        assert shared_state.strategy_to_filehash == {"missing": "missing_hash"}
+        assert shared_state.strategies_executables == {
+            "cached": (dummy_strategy, "dummy")
+        }
+        assert shared_state.strategies_filehashes == {"cached": "cached_hash"}
+
     @given(st.integers())
     def test_wei_to_native(self, wei: int) -> None:
         """Test the `wei_to_native` method."""
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests for the packages' cache of the decision maker."""
+
+from pathlib import Path
+
+import pytest
+
+from packages.valory.skills.decision_maker_abci.io_.cache import PackagesCache
+
+
+FILE_HASH = "bafybeihufqu2ra7vud4h6g2nwahx7mvdido7ff6prwnib2tdlc4np7dw24"
+FILES = {
+    "component.yaml": "entry_point: strategy.py\ncallable: run\n",
+    "strategy.py": "def run(*args, **kwargs):\n    return {}\n",
+}
+
+
+def test_read_missing(tmp_path: Path) -> None:
+    """Test reading a package which has not been cached."""
+    cache = PackagesCache(tmp_path / "packages")
+    assert cache.read(FILE_HASH) is None
+
+
+def test_write_read(tmp_path: Path) -> None:
+    """Test that a written package can be read back by its hash."""
+    cache = PackagesCache(tmp_path / "packages")
+    cache.write(FILE_HASH, FILES)
+    assert cache.read(FILE_HASH) == FILES
+    assert cache.read("other_hash") is None
+    assert [path.name for path in cache.path.iterdir()] == [f"{FILE_HASH}.json"]
+
+
+def test_read_invalid(tmp_path: Path) -> None:
+    """Test reading an invalid package."""
+    cache = PackagesCache(tmp_path)
+    (tmp_path / f"{FILE_HASH}.json").write_text("[]")
+    with pytest.raises(ValueError, match="Invalid cached package"):
+        cache.read(FILE_HASH)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests for the benchmarking dataset's index."""
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from packages.valory.skills.decision_maker_abci.io_.dataset import DatasetIndex
+
+
+FIELDNAMES = ["question_id", "question", "p_yes_tool"]
+ROWS = [
+    ["0x1", "Will it rain?", "0.1"],
+    ["0x2", 'A "quoted" question,\nspanning two lines?', "0.2"],
+    ["0x1", "Will it rain tomorrow?", "0.3"],
+    ["0x3", "Ünïcödé?", "0.4"],
+]
+
+
+@pytest.mark.parametrize("sep", (",", ";"))
+def test_index(tmp_path: Path, sep: str) -> None:
+    """Test that the indexed rows are the same as the ones read by a `csv.DictReader`."""
+    dataset_path = tmp_path / "dataset.csv"
+    with open(dataset_path, "w", newline="", encoding="utf-8") as dataset:
+        writer = csv.writer(dataset, delimiter=sep)
+        writer.writerow(FIELDNAMES)
+        for row in ROWS:
+            writer.writerow(row)
+            # empty lines are not counted as rows
+            dataset.write("\r\n")
+
+    index = DatasetIndex(dataset_path, sep, "question_id")
+    with open(dataset_path, newline="", encoding="utf-8") as dataset:
+        expected = list(csv.DictReader(dataset, delimiter=sep))
+
+    assert index.fieldnames == FIELDNAMES
+    assert len(index) == len(ROWS)
+    assert [index.row(n) for n in range(1, len(ROWS) + 1)] == expected
+    assert index.row(0) is None
+    assert index.row(len(ROWS) + 1) is None
+    assert index.rows_per_question == {"0x1": [1, 3], "0x2": [2], "0x3": [4]}
+
+
+def test_empty(tmp_path: Path) -> None:
+    """Test indexing an empty dataset."""
+    dataset_path = tmp_path / "dataset.csv"
+    dataset_path.touch()
+    index = DatasetIndex(dataset_path, ",", "question_id")
+
+    assert index.fieldnames == []
+    assert len(index) == 0
+    assert index.row(1) is None
+    assert index.rows_per_question == {}
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests for the benchmarking results' writer."""
+
+import csv
+from pathlib import Path
+from unittest import mock
+
+from packages.valory.skills.decision_maker_abci.io_.results import (
+    BenchmarkResultsWriter,
+)
+
+
+FIELDS = (("question_id", str), ("question", str), ("p_yes", float), ("amount", int))
+ROW = ("0x1", 'Will it "rain", tomorrow?', 0.5, None)
+
+
+def read_rows(path: Path) -> list:
+    """Read the rows of a CSV file."""
+    with open(path, newline="") as results_file:
+        return list(csv.reader(results_file))
+
+
+def test_rows_are_buffered(tmp_path: Path) -> None:
+    """Test that the rows are only written when the writer is flushed."""
+    path = tmp_path / "results.csv"
+    writer = BenchmarkResultsWriter(path, FIELDS)
+    writer.append(ROW)
+    assert not path.exists()
+
+    writer.flush()
+    expected = [
+        ["question_id", "question", "p_yes", "amount"],
+        ["0x1", ROW[1], "0.5", "None"],
+    ]
+    assert read_rows(path) == expected
+    writer.close()
+
+
+def test_headers_are_written_once(tmp_path: Path) -> None:
+    """Test that the results of multiple sessions are appended under the same headers."""
+    path = tmp_path / "results.csv"
+    for _ in range(2):
+        writer = BenchmarkResultsWriter(path, FIELDS)
+        writer.append(ROW)
+        writer.close()
+
+    rows = read_rows(path)
+    assert len(rows) == 3
+    assert rows[1] == rows[2]
+
+
+def test_flush_when_buffer_is_full(tmp_path: Path) -> None:
+    """Test that the rows are written once the maximum number of buffered rows is reached."""
+    path = tmp_path / "results.csv"
+    writer = BenchmarkResultsWriter(path, FIELDS)
+    with mock.patch(
+        "packages.valory.skills.decision_maker_abci.io_.results.MAX_BUFFERED_ROWS", 2
+    ):
+        writer.append(ROW)
+        assert not path.exists()
+        writer.append(ROW)
+    assert len(read_rows(path)) == 3
+    writer.close()
@@ -19,25 +19,23 @@
 
 """This module contains the behaviours for the MarketManager skill."""
 
-import json
 import os.path
 import time
 from abc import ABC
-from json import JSONDecodeError
+from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Set, Type, cast
 
-from aea.helpers.ipfs.base import IPFSHashOnly
-
 from packages.valory.skills.abstract_round_abci.behaviour_utils import BaseBehaviour
 from packages.valory.skills.abstract_round_abci.behaviours import AbstractRoundBehaviour
 from packages.valory.skills.market_manager_abci.bets import (
     Bet,
-    BetsDecoder,
+    BetsCollection,
     BinaryOutcome,
-    serialize_bets,
+    QueueStatus,
+    hash_bets,
 )
+from packages.valory.skills.market_manager_abci.bets_store import BetsStore
 from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
-    FetchStatus,
     MAX_LOG_SIZE,
     QueryingBehaviour,
 )
@@ -57,6 +55,7 @@ from packages.valory.skills.market_manager_abci.rounds import (
 
 BETS_FILENAME = "bets.json"
 MULTI_BETS_FILENAME = "multi_bets.json"
+MULTI_BETS_LOG_FILENAME = "multi_bets.log"
 READ_MODE = "r"
 WRITE_MODE = "w"
 
@@ -67,9 +66,14 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
     def __init__(self, **kwargs: Any) -> None:
         """Initialize `BetsManagerBehaviour`."""
         super().__init__(**kwargs)
-        self.bets: List[Bet] = []
-        self.multi_bets_filepath: str = self.params.store_path / MULTI_BETS_FILENAME
-        self.bets_filepath: str = self.params.store_path / BETS_FILENAME
+        self.bets: BetsCollection = BetsCollection()
+        self.multi_bets_filepath: Path = self.params.store_path / MULTI_BETS_FILENAME
+        self.bets_filepath: Path = self.params.store_path / BETS_FILENAME
+        self.bets_store = BetsStore(
+            snapshot_path=self.multi_bets_filepath,
+            log_path=self.params.store_path / MULTI_BETS_LOG_FILENAME,
+            legacy_path=self.bets_filepath,
+        )
 
     @property
     def shared_state(self) -> SharedState:
@@ -82,57 +86,49 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
         return cast(BenchmarkingMode, self.context.benchmarking_mode)
 
     def store_bets(self) -> None:
-        """Store the bets to the agent's data dir as JSON."""
-        serialized = serialize_bets(self.bets)
-        if serialized is None:
+        """Store the bets to the agent's data dir, only persisting the ones that changed since they were read."""
+        if len(self.bets) == 0:
             self.context.logger.warning("No bets to store.")
             return
 
         try:
-            with open(self.multi_bets_filepath, WRITE_MODE) as bets_file:
-                try:
-                    bets_file.write(serialized)
-                    return
-                except (IOError, OSError):
-                    err = f"Error writing to file {self.multi_bets_filepath!r}!"
+            self.bets_store.write(self.bets)
+            return
         except (FileNotFoundError, PermissionError, OSError):
-            err = f"Error opening file {self.multi_bets_filepath!r} in write mode!"
+            err = f"Error writing the bets to {self.multi_bets_filepath!r}!"
 
         self.context.logger.error(err)
 
     def read_bets(self) -> None:
         """Read the bets from the agent's data dir as JSON."""
-        self.bets = []
-        read_path = self.multi_bets_filepath
+        self.bets = BetsCollection()
+        read_path = self.bets_store.read_path
 
-        if not os.path.isfile(read_path):
+        if not os.path.isfile(self.multi_bets_filepath):
             self.context.logger.warning(
-                f"No stored bets file was detected in {read_path}. "
+                f"No stored bets file was detected in {self.multi_bets_filepath}. "
                 "Assuming trader is being run for the first time in multi-bets mode."
             )
-            read_path = self.bets_filepath
 
-        if not os.path.isfile(read_path):
+        if read_path is None:
             self.context.logger.warning(
-                f"No stored bets file was detected in {read_path}. Assuming bets are empty."
+                f"No stored bets file was detected in {self.bets_filepath}. Assuming bets are empty."
             )
             return
 
         try:
-            with open(read_path, READ_MODE) as bets_file:
-                try:
-                    self.bets = json.load(bets_file, cls=BetsDecoder)
-                    return
-                except (JSONDecodeError, TypeError):
-                    err = f"Error decoding file {read_path!r} to a list of bets!"
+            self.bets = self.bets_store.read()
+            return
+        except (ValueError, TypeError, KeyError):
+            err = f"Error decoding file {read_path!r} to a list of bets!"
         except (FileNotFoundError, PermissionError, OSError):
             err = f"Error opening file {read_path!r} in read mode!"
 
         self.context.logger.error(err)
 
     def hash_stored_bets(self) -> str:
-        """Get the hash of the stored bets' file."""
-        return IPFSHashOnly.hash_file(self.multi_bets_filepath)
+        """Get the hash of the stored bets, which is the same for all the agents that hold the same bets."""
+        return hash_bets(self.bets)
 
 
 class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
@@ -171,9 +167,9 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
 
     def _blacklist_expired_bets(self) -> None:
         """Blacklist bets that are older than the opening margin."""
-        for bet in self.bets:
-            if self.synced_time >= bet.openingTimestamp - self.params.opening_margin:
-                bet.blacklist_forever()
+        expiry_threshold = self.synced_time + self.params.opening_margin
+        for bet in self.bets.opening_until(expiry_threshold):
+            bet.blacklist_forever()
 
     def review_bets_for_selling(self) -> bool:
         """Review bets for selling."""
@@ -209,7 +205,7 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         if trades is None:
             return {}
 
-        user_positions = yield from self.fetch_user_positions(
+        user_positions = yield from self.fetch_positions_index(
             self.synchronized_data.safe_contract_address.lower()
         )
         if user_positions is None:
@@ -243,20 +239,13 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
 
     def get_bet_idx(self, bet_id: str) -> Optional[int]:
         """Get the index of the bet with the given id, if it exists, otherwise `None`."""
-        return next((i for i, bet in enumerate(self.bets) if bet.id == bet_id), None)
+        return self.bets.get_idx(bet_id)
 
-    def _process_chunk(self, chunk: Optional[List[Dict[str, Any]]]) -> None:
+    def _process_chunk(self, chunk: List[Dict[str, Any]], market: str) -> None:
         """Process a chunk of bets."""
-        if chunk is None:
-            return
-
         for raw_bet in chunk:
-            bet = Bet(**raw_bet, market=self._current_market)
-            index = self.get_bet_idx(bet.id)
-            if index is None:
-                self.bets.append(bet)
-            else:
-                self.bets[index].update_market_info(bet)
+            bet = Bet(**raw_bet, market=market)
+            self.bets.upsert(bet)
 
     def _update_bets(
         self,
@@ -264,17 +253,15 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         """Fetch the questions from all the prediction markets and update the local copy of the bets."""
 
         # Fetching bets from the prediction markets
-        while True:
-            can_proceed = self._prepare_fetching()
-            if not can_proceed:
-                break
-
-            bets_market_chunk = yield from self._fetch_bets()
-            self._process_chunk(bets_market_chunk)
+        questions_per_market = yield from self.fetch_all_questions()
 
-        if self._fetch_status != FetchStatus.SUCCESS:
+        if questions_per_market is None:
             # this won't wipe the bets as the `store_bets` of the `BetsManagerBehaviour` takes this into consideration
-            self.bets = []
+            self.bets = BetsCollection()
+        else:
+            # the bets are processed in the markets' order, regardless of the order in which the responses arrived
+            for market, chunk in questions_per_market:
+                self._process_chunk(chunk, market)
 
         # truncate the bets, otherwise logs get too big
         bets_str = str(self.bets)[:MAX_LOG_SIZE]
@@ -284,18 +271,15 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         """Check the freshness of the bets."""
         # single-bets mode case - mark any market with a `FRESH` status as processable
         if not self.params.use_multi_bets_mode:
-            for bet in self.bets:
-                if bet.queue_status.is_fresh():
-                    bet.queue_status = bet.queue_status.move_to_process()
+            for bet in self.bets.with_status(QueueStatus.FRESH):
+                bet.queue_status = bet.queue_status.move_to_process()
             return
 
         # muti-bets mode case - mark markets as processable only if all the unexpired ones have a `FRESH` status
         # this will happen if the agent just started or the checkpoint has just been reached
-        all_bets_fresh = all(
-            bet.queue_status.is_fresh()
-            for bet in self.bets
-            if not bet.queue_status.is_expired()
-        )
+        unexpired_statuses = set(QueueStatus) - {QueueStatus.EXPIRED}
+        unexpired = self.bets.count_with_status(*unexpired_statuses)
+        all_bets_fresh = unexpired == self.bets.count_with_status(QueueStatus.FRESH)
 
         if all_bets_fresh:
             for bet in self.bets:
@@ -20,12 +20,28 @@
 
 """Structures for the bets."""
 
-import builtins
 import dataclasses
+import hashlib
 import json
 import sys
+from bisect import bisect_right, insort
+from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 
 P_YES_FIELD = "p_yes"
@@ -34,6 +50,64 @@ CONFIDENCE_FIELD = "confidence"
 INFO_UTILITY_FIELD = "info_utility"
 BINARY_N_SLOTS = 2
 DAY_IN_SECONDS = 24 * 60 * 60
+QUEUE_STATUS_FIELD = "queue_status"
+OPENING_TIMESTAMP_FIELD = "openingTimestamp"
+INVESTMENTS_FIELD = "investments"
+INDEXED_FIELDS = frozenset((QUEUE_STATUS_FIELD, OPENING_TIMESTAMP_FIELD))
+ID_FIELD = "id"
+CASTABLE_TYPES = (int, float, str)
+# attributes of a bet which are not fields, and are therefore never serialized
+BET_EXTRA_SLOTS = ("_owner", "_idx", "last_processed_sell_check")
+
+CastPlanType = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+
+def with_slots(*extra_slots: str) -> Callable[[type], type]:
+    """Recreate a dataclass with `__slots__` for its fields and the given extra attributes.
+
+    This is what `dataclass(slots=True)` does in python 3.10 onwards.
+    Methods of the decorated class should not use the zero-argument form of `super()`,
+    as its implicit reference would point to the original class.
+
+    :param extra_slots: the names of any attributes which are not fields.
+    :return: the decorator.
+    """
+
+    def wrap(cls: type) -> type:
+        """Recreate the given dataclass with slots."""
+        slots = tuple(field.name for field in dataclasses.fields(cls)) + extra_slots
+        cls_dict = dict(cls.__dict__)
+        cls_dict["__slots__"] = slots
+        for name in (*slots, "__dict__", "__weakref__"):
+            # the defaults are already part of the generated `__init__`
+            cls_dict.pop(name, None)
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+
+    return wrap
+
+
+def _list_caster(type_: type) -> Callable[[Any], Any]:
+    """Get a function casting all the items of an iterable to the given type."""
+    return lambda values: [type_(value) for value in values]
+
+
+@lru_cache(maxsize=None)
+def get_cast_plan(cls: type) -> CastPlanType:
+    """Get the `(field, caster)` pairs of the fields of a dataclass which are hinted as a builtin or a list of it."""
+    plan = []
+    for field in dataclasses.fields(cls):
+        hinted_type = field.type
+        if hinted_type in CASTABLE_TYPES:
+            plan.append((field.name, hinted_type))
+            continue
+        args = get_args(hinted_type)
+        if get_origin(hinted_type) is list and len(args) == 1:
+            (item_type,) = args
+            if item_type in CASTABLE_TYPES:
+                plan.append((field.name, _list_caster(item_type)))
+    return tuple(plan)
 
 
 class BinaryOutcome(Enum):
@@ -93,6 +167,7 @@ class QueueStatus(Enum):
         return self
 
 
+@with_slots()
 @dataclasses.dataclass(init=False)
 class PredictionResponse:
     """A response of a prediction."""
@@ -135,6 +210,7 @@ def get_default_prediction_response() -> PredictionResponse:
     return PredictionResponse(p_yes=0.5, p_no=0.5, confidence=0.5, info_utility=0.5)
 
 
+@with_slots(*BET_EXTRA_SLOTS)
 @dataclasses.dataclass
 class Bet:
     """A bet's structure."""
@@ -171,6 +247,26 @@ class Bet:
         if BinaryOutcome.NO.value not in self.investments:
             self.investments[BinaryOutcome.NO.value] = []
 
+    def __new__(cls, *_args: Any, **_kwargs: Any) -> "Bet":
+        """Create a bet which does not belong to any collection."""
+        bet = object.__new__(cls)
+        # the collection that the bet belongs to, if any, and the bet's index in it
+        object.__setattr__(bet, "_owner", None)
+        object.__setattr__(bet, "_idx", None)
+        return bet
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, notifying the owning collection about the change."""
+        owner = self._owner
+        if owner is not None:
+            owner.track_change(self, name, value)
+        object.__setattr__(self, name, value)
+
+    def _touch_investments(self) -> None:
+        """Notify the owning collection that the investments are about to be modified in place."""
+        if self._owner is not None:
+            self._owner.track_change(self, INVESTMENTS_FIELD, self.investments)
+
     def __lt__(self, other: "Bet") -> bool:
         """Implements less than operator."""
         return self.scaledLiquidityMeasure < other.scaledLiquidityMeasure
@@ -260,18 +356,11 @@ class Bet:
 
     def _cast(self) -> None:
         """Cast the values of the instance."""
-        types_to_cast = ("int", "float", "str")
-        str_to_type = {getattr(builtins, type_): type_ for type_ in types_to_cast}
-        for field, hinted_type in self.__annotations__.items():
+        for field, cast in get_cast_plan(type(self)):
             uncasted = getattr(self, field)
-            if uncasted is None:
-                continue
-
-            for type_to_cast, type_name in str_to_type.items():
-                if hinted_type == type_to_cast:
-                    setattr(self, field, hinted_type(uncasted))
-                if f"{str(List)}[{type_name}]" == str(hinted_type):
-                    setattr(self, field, list(type_to_cast(val) for val in uncasted))
+            if uncasted is not None:
+                # only called on initialization, before the bet can belong to a collection, so there is nothing to track
+                object.__setattr__(self, field, cast(uncasted))
 
     def _check_usefulness(self) -> None:
         """If the bet is deemed unhelpful, then blacklist it."""
@@ -315,12 +404,14 @@ class Bet:
 
     def reset_investments(self) -> None:
         """Reset the investments."""
+        self._touch_investments()
         for outcome in BinaryOutcome:
             self.investments[outcome.value] = []
 
     def append_investment_amount(self, vote: int, amount: int) -> None:
         """Append an investment amount to the vote."""
         vote_name = self.get_outcome(vote)
+        self._touch_investments()
         if vote_name not in self.investments:
             self.investments[vote_name] = []
         self.investments[vote_name].append(amount)
@@ -328,6 +419,7 @@ class Bet:
     def set_investment_amount(self, vote: int, amount: int) -> None:
         """Set the investment amount for a vote."""
         vote_name = self.get_outcome(vote)
+        self._touch_investments()
         self.investments[vote_name] = [amount]
 
     def update_investments(self, amount: int) -> bool:
@@ -346,6 +438,7 @@ class Bet:
             self.set_investment_amount(vote, 0)
             return True
 
+        self._touch_investments()
         self.investments[outcome] = [*self.investments[outcome], amount]
         return True
 
@@ -398,6 +491,178 @@ class Bet:
         )
 
 
+class BetsCollection:
+    """An insertion-ordered collection of bets, indexed by id, queue status and opening timestamp.
+
+    The position of a bet in the collection is part of the agents' consensus (e.g., the sampled bet's index),
+    therefore the order in which the bets are added is always preserved.
+
+    The collection also keeps track of the bets that have been modified since it was last marked as persisted,
+    so that only those need to be stored, and since they were last digested, so that only those need to be hashed.
+    """
+
+    def __init__(self, bets: Iterable[Bet] = ()) -> None:
+        """Initialize the collection."""
+        self._bets: List[Bet] = []
+        self._id_to_idx: Dict[str, int] = {}
+        self._status_to_indexes: Dict[QueueStatus, Set[int]] = defaultdict(set)
+        # sorted `(openingTimestamp, index)` pairs
+        self._opening_index: List[Tuple[int, int]] = []
+        # a mapping from a bet's index to the values of its fields before they were first modified
+        self._originals: Dict[int, Dict[str, Any]] = {}
+        # the number of bets which have been persisted
+        self._n_persisted: int = 0
+        # an opaque token set by the storage, identifying the stored state that the bets correspond to
+        self.store_token: Optional[Any] = None
+        # the digests of the bets' serializations, and the indexes of the bets which were added or changed since
+        self._digests: List[bytes] = []
+        self._undigested: Set[int] = set()
+        for bet in bets:
+            self.append(bet)
+
+    def __len__(self) -> int:
+        """Get the number of bets."""
+        return len(self._bets)
+
+    def __iter__(self) -> Iterator[Bet]:
+        """Iterate over the bets, in insertion order."""
+        return iter(self._bets)
+
+    def __getitem__(self, idx: int) -> Bet:
+        """Get a bet by its index."""
+        return self._bets[idx]
+
+    def __contains__(self, bet_id: object) -> bool:
+        """Check whether a bet with the given id exists."""
+        return bet_id in self._id_to_idx
+
+    def __repr__(self) -> str:
+        """Represent the collection as the list of its bets."""
+        return repr(self._bets)
+
+    def get_idx(self, bet_id: str) -> Optional[int]:
+        """Get the index of the bet with the given id, if it exists, otherwise `None`."""
+        return self._id_to_idx.get(bet_id, None)
+
+    def get(self, bet_id: str) -> Optional[Bet]:
+        """Get the bet with the given id, if it exists, otherwise `None`."""
+        idx = self.get_idx(bet_id)
+        return None if idx is None else self._bets[idx]
+
+    def index(self, bet: Bet) -> int:
+        """Get the index of the given bet."""
+        idx = self.get_idx(bet.id)
+        if idx is None or self._bets[idx] is not bet:
+            raise ValueError(f"Bet {bet.id!r} is not in the collection.")
+        return idx
+
+    def append(self, bet: Bet) -> None:
+        """Append a bet to the collection."""
+        idx = len(self._bets)
+        self._bets.append(bet)
+        self._digests.append(b"")
+        self._undigested.add(idx)
+        # in case of duplicate ids, the first bet is the one indexed, as the lookups have always returned the first
+        self._id_to_idx.setdefault(bet.id, idx)
+        self._status_to_indexes[bet.queue_status].add(idx)
+        if bet.openingTimestamp is not None:
+            insort(self._opening_index, (bet.openingTimestamp, idx))
+        object.__setattr__(bet, "_owner", self)
+        object.__setattr__(bet, "_idx", idx)
+
+    def upsert(self, bet: Bet) -> Bet:
+        """Add the given bet if it is new, otherwise update the market information of the existing one."""
+        existing = self.get(bet.id)
+        if existing is None:
+            self.append(bet)
+            return bet
+        existing.update_market_info(bet)
+        return existing
+
+    def track_change(self, bet: Bet, field: str, value: Any) -> None:
+        """Track a change of a bet's field, which is about to be set to the given value."""
+        if field not in BET_FIELDS:
+            return
+
+        idx: int = getattr(bet, "_idx")
+        self._undigested.add(idx)
+        originals = self._originals.setdefault(idx, {})
+        if field not in originals:
+            current = getattr(bet, field)
+            if field == INVESTMENTS_FIELD:
+                # the investments are modified in place, therefore, a copy is required
+                current = {vote: list(amounts) for vote, amounts in current.items()}
+            originals[field] = current
+
+        if field in INDEXED_FIELDS:
+            self._reindex(bet, idx, field, value)
+
+    def _reindex(self, bet: Bet, idx: int, field: str, value: Any) -> None:
+        """Update the secondary indexes of a bet whose indexed field is about to change to the given value."""
+        if field == QUEUE_STATUS_FIELD:
+            self._status_to_indexes[bet.queue_status].discard(idx)
+            self._status_to_indexes[value].add(idx)
+            return
+
+        if bet.openingTimestamp is not None:
+            pos = bisect_right(self._opening_index, (bet.openingTimestamp, idx)) - 1
+            if pos >= 0 and self._opening_index[pos] == (bet.openingTimestamp, idx):
+                del self._opening_index[pos]
+        if value is not None:
+            insort(self._opening_index, (value, idx))
+
+    @property
+    def digest(self) -> str:
+        """Get the digest of the bets, only digesting again the bets which were added or changed since last time."""
+        for idx in self._undigested:
+            self._digests[idx] = digest_bet(self._bets[idx])
+        self._undigested.clear()
+        return hashlib.sha256(b"".join(self._digests)).hexdigest()
+
+    def count_with_status(self, *statuses: QueueStatus) -> int:
+        """Get the number of bets with any of the given queue statuses."""
+        return sum(len(self._status_to_indexes[status]) for status in statuses)
+
+    def with_status(self, *statuses: QueueStatus) -> List[Bet]:
+        """Get the bets with any of the given queue statuses, in insertion order."""
+        indexes: Set[int] = set()
+        for status in statuses:
+            indexes.update(self._status_to_indexes[status])
+        return [self._bets[idx] for idx in sorted(indexes)]
+
+    def opening_until(self, timestamp: int) -> List[Bet]:
+        """Get the bets with an opening timestamp lower than or equal to the given one, in insertion order."""
+        end = bisect_right(self._opening_index, (timestamp, sys.maxsize))
+        indexes = sorted(idx for _, idx in self._opening_index[:end])
+        return [self._bets[idx] for idx in indexes]
+
+    def modified_indexes(self) -> List[int]:
+        """Get the indexes of the bets that were added or modified since the collection was last persisted."""
+        modified = {
+            idx
+            for idx, originals in self._originals.items()
+            if idx < self._n_persisted
+            and any(
+                getattr(self._bets[idx], field) != original
+                for field, original in originals.items()
+            )
+        }
+        modified.update(range(self._n_persisted, len(self._bets)))
+        return sorted(modified)
+
+    def mark_persisted(self, store_token: Optional[Any] = None) -> None:
+        """Mark the current state of the bets as persisted."""
+        self._originals = {}
+        self._n_persisted = len(self._bets)
+        self.store_token = store_token
+
+
+BET_FIELDS = frozenset(field.name for field in dataclasses.fields(Bet))
+PREDICTION_FIELDS = frozenset(
+    field.name for field in dataclasses.fields(PredictionResponse)
+)
+
+
 class BetsEncoder(json.JSONEncoder):
     """JSON encoder for bets."""
 
@@ -420,31 +685,43 @@ class BetsDecoder(json.JSONDecoder):
     @staticmethod
     def hook(data: Dict[str, Any]) -> Union[Bet, PredictionResponse, Dict[str, Bet]]:
         """Perform the custom decoding."""
+        data_attributes = data.keys()
         # if this is a `PredictionResponse`
-        prediction_attributes = sorted(PredictionResponse.__annotations__.keys())
-        data_attributes = sorted(data.keys())
-        if prediction_attributes == data_attributes:
+        if data_attributes == PREDICTION_FIELDS:
             return PredictionResponse(**data)
 
         # if this is a `Bet`
-        bet_annotations = sorted(Bet.__annotations__.keys())
-        if bet_annotations == data_attributes:
-            data["queue_status"] = QueueStatus(data["queue_status"])
+        if data_attributes == BET_FIELDS:
+            data[QUEUE_STATUS_FIELD] = QueueStatus(data[QUEUE_STATUS_FIELD])
             return Bet(**data)
         # if the data contains an id key, but does not match the bet attributes exactly, process it as a bet
-        elif "id" in data_attributes:
+        elif ID_FIELD in data:
             # Extract only the attributes that exist in both Bet and data to ensure compatibility
-            common_attributes = set(bet_annotations) & set(data_attributes)
-            data = {key: data[key] for key in common_attributes}
+            data = {key: data[key] for key in data_attributes & BET_FIELDS}
             # Convert queue_status to a QueueStatus enum if present in data
-            if "queue_status" in data:
-                data["queue_status"] = QueueStatus(data["queue_status"])
+            if QUEUE_STATUS_FIELD in data:
+                data[QUEUE_STATUS_FIELD] = QueueStatus(data[QUEUE_STATUS_FIELD])
             return Bet(**data)
         return data
 
 
-def serialize_bets(bets: List[Bet]) -> Optional[str]:
+def serialize_bets(bets: Union[List[Bet], BetsCollection]) -> Optional[str]:
     """Get the bets serialized."""
     if len(bets) == 0:
         return None
-    return json.dumps(bets, cls=BetsEncoder)
+    return json.dumps(list(bets), cls=BetsEncoder)
+
+
+def digest_bet(bet: Bet) -> bytes:
+    """Get the digest of a bet's serialization."""
+    return hashlib.sha256(json.dumps(bet, cls=BetsEncoder).encode()).digest()
+
+
+def hash_bets(bets: Union[List[Bet], BetsCollection]) -> str:
+    """Get a digest of the bets, which only depends on their content and order, and not on how they are stored.
+
+    It is the digest of the bets' digests, in order, so that a collection only needs to digest the bets that changed.
+    """
+    if isinstance(bets, BetsCollection):
+        return bets.digest
+    return hashlib.sha256(b"".join(digest_bet(bet) for bet in bets)).hexdigest()
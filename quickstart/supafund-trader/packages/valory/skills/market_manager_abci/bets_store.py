@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Incremental storage for the bets."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from packages.valory.skills.market_manager_abci.bets import (
+    Bet,
+    BetsCollection,
+    BetsDecoder,
+    BetsEncoder,
+)
+
+
+READ_MODE = "r"
+READ_BYTES_MODE = "rb"
+WRITE_MODE = "w"
+APPEND_MODE = "a"
+NEW_LINE = "\n"
+SNAPSHOT_FIELD = "snapshot"
+IDX_FIELD = "idx"
+BET_FIELD = "bet"
+# the log is compacted into the snapshot when it grows beyond this fraction of the snapshot's size
+LOG_COMPACTION_RATIO = 0.5
+
+# the log's header and size; the log only grows for as long as its header remains the same
+StoreTokenType = Optional[Tuple[bytes, int]]
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    """Write the given content to a file, replacing it atomically."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, WRITE_MODE) as tmp_file:
+        tmp_file.write(content)
+    os.replace(tmp_path, path)
+
+
+class BetsStore:
+    """Stores the bets as a snapshot and an append-only log of the bets that changed since the snapshot.
+
+    The snapshot has exactly the format of the full bets' serialization, while the log contains one line per
+    modified or added bet. The first line of the log references the snapshot that the changes apply to,
+    so that a log which is left behind by an interrupted compaction is ignored.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        log_path: Path,
+        legacy_path: Optional[Path] = None,
+    ) -> None:
+        """Initialize the store."""
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.legacy_path = legacy_path
+
+    @property
+    def token(self) -> StoreTokenType:
+        """Get a token identifying the current stored state, or `None` if there is no log.
+
+        Both the header and the size are in bytes, so that they can be compared to each other.
+        """
+        try:
+            with open(self.log_path, READ_BYTES_MODE) as log_file:
+                header = log_file.readline()
+                log_file.seek(0, os.SEEK_END)
+                return header, log_file.tell()
+        except FileNotFoundError:
+            return None
+
+    @property
+    def read_path(self) -> Optional[Path]:
+        """Get the path of the snapshot to read from, if any exists."""
+        for path in (self.snapshot_path, self.legacy_path):
+            if path is not None and os.path.isfile(path):
+                return path
+        return None
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Whether the log contains changes which have not been compacted into the snapshot."""
+        token = self.token
+        if token is None:
+            return False
+        header, log_size = token
+        return log_size > len(header)
+
+    @staticmethod
+    def _snapshot_ref(serialized: str) -> str:
+        """Get the reference of a snapshot, given its content."""
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _read_log(self, snapshot: str) -> List[Dict[str, Any]]:
+        """Read the changes of the log, if they are referring to the given snapshot's content."""
+        if not os.path.isfile(self.log_path):
+            return []
+
+        with open(self.log_path, READ_MODE) as log_file:
+            header = json.loads(log_file.readline() or "{}")
+            if header.get(SNAPSHOT_FIELD, None) != self._snapshot_ref(snapshot):
+                return []
+            return [json.loads(line, cls=BetsDecoder) for line in log_file if line]
+
+    def read(self) -> BetsCollection:
+        """Read the bets, applying the logged changes on top of the snapshot."""
+        token = self.token
+        read_path = self.read_path
+        if read_path is None:
+            return BetsCollection()
+
+        with open(read_path, READ_MODE) as snapshot_file:
+            snapshot = snapshot_file.read()
+
+        bets: List[Bet] = json.loads(snapshot, cls=BetsDecoder)
+        if read_path == self.snapshot_path:
+            for change in self._read_log(snapshot):
+                idx = change[IDX_FIELD]
+                if idx < len(bets):
+                    bets[idx] = change[BET_FIELD]
+                elif idx == len(bets):
+                    bets.append(change[BET_FIELD])
+                else:
+                    raise ValueError(f"Invalid bet index {idx} in {self.log_path!r}.")
+
+        collection = BetsCollection(bets)
+        legacy = read_path != self.snapshot_path
+        collection.mark_persisted(None if legacy else token)
+        return collection
+
+    def _compact(self, bets: BetsCollection) -> None:
+        """Write all the bets to the snapshot and start a new log."""
+        serialized = json.dumps(list(bets), cls=BetsEncoder)
+        _write_atomically(self.snapshot_path, serialized)
+        header = json.dumps({SNAPSHOT_FIELD: self._snapshot_ref(serialized)})
+        _write_atomically(self.log_path, header + NEW_LINE)
+
+    def _should_compact(self, bets: BetsCollection, changes: str) -> bool:
+        """Whether the bets should be compacted instead of logging the given changes."""
+        token = self.token
+        if (
+            token is None
+            or bets.store_token != token
+            or not os.path.isfile(self.snapshot_path)
+        ):
+            # the bets do not correspond to the stored state, e.g., they were not read from the store
+            return True
+
+        _, log_size = token
+        snapshot_size = os.path.getsize(self.snapshot_path)
+        return log_size + len(changes.encode()) > snapshot_size * LOG_COMPACTION_RATIO
+
+    def write(self, bets: BetsCollection) -> None:
+        """Write the bets, only logging the ones that changed, unless a compaction is due."""
+        changes = "".join(
+            json.dumps({IDX_FIELD: idx, BET_FIELD: bets[idx]}, cls=BetsEncoder)
+            + NEW_LINE
+            for idx in bets.modified_indexes()
+        )
+
+        if self._should_compact(bets, changes):
+            self._compact(bets)
+        elif changes:
+            with open(self.log_path, APPEND_MODE) as log_file:
+                log_file.write(changes)
+
+        bets.mark_persisted(self.token)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Local cache of the data synced from the subgraphs."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+READ_MODE = "r"
+WRITE_MODE = "w"
+
+
+class SyncCache:
+    """A JSON file storing the data last synced from a subgraph, per address."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache."""
+        self.path = path
+
+    def _read_all(self) -> Dict[str, Any]:
+        """Read the entries of all the addresses."""
+        if not self.path.is_file():
+            return {}
+        with open(self.path, READ_MODE) as cache_file:
+            entries = json.load(cache_file)
+        if not isinstance(entries, dict):
+            raise ValueError(f"Invalid sync cache in {str(self.path)!r}.")
+        return entries
+
+    def read(self, address: str) -> Optional[Dict[str, Any]]:
+        """Read the entry of the given address, if it exists."""
+        return self._read_all().get(address.lower(), None)
+
+    def write(self, address: str, entry: Dict[str, Any]) -> None:
+        """Write the entry of the given address, keeping the entries of any other addresses."""
+        entries = self._read_all()
+        entries[address.lower()] = entry
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, WRITE_MODE) as cache_file:
+            json.dump(entries, cache_file)
+        os.replace(tmp_path, self.path)
@@ -52,3 +52,14 @@ user_positions = Template(
     }
     """
 )
+
+
+user_last_active = Template(
+    """
+    {
+        user(id: "${id}") {
+            lastActive
+        }
+    }
+    """
+)
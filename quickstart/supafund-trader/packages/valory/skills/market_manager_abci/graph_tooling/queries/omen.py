@@ -31,11 +31,12 @@ questions = Template(
           outcomeSlotCount: ${slot_count},
           openingTimestamp_gt: ${opening_threshold},
           language_in: ${languages},
-          isPendingArbitration: false
+          isPendingArbitration: false,
+          id_gt: "${id_gt}"
         },
-        orderBy: creationTimestamp
-        orderDirection: desc
-        first: 1000
+        orderBy: id
+        orderDirection: asc
+        first: ${first}
       ){
         id
         title
@@ -74,3 +74,52 @@ trades = Template(
         }
         """
 )
+
+
+market_trades = Template(
+    """
+        {
+            fpmmTrades(
+                where: {
+                    type: Buy,
+                    creator: "${creator}",
+                    fpmm_in: ${fpmms},
+                    creationTimestamp_gt: "${creationTimestamp_gt}"
+                }
+                first: ${first}
+                orderBy: creationTimestamp
+                orderDirection: asc
+            ) {
+                id
+                title
+                collateralToken
+                outcomeTokenMarginalPrice
+                oldOutcomeTokenMarginalPrice
+                type
+                creator {
+                    id
+                }
+                creationTimestamp
+                collateralAmount
+                collateralAmountUSD
+                feeAmount
+                outcomeIndex
+                outcomeTokensTraded
+                transactionHash
+                fpmm {
+                    id
+                    outcomes
+                    title
+                    answerFinalizedTimestamp
+                    currentAnswer
+                    isPendingArbitration
+                    arbitrationOccurred
+                    openingTimestamp
+                    condition {
+                        id
+                    }
+                }
+            }
+        }
+        """
+)
@@ -21,14 +21,33 @@
 """Tooling to perform subgraph requests from a behaviour."""
 
 import json
+import time
 from abc import ABC
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, cast
+from string import Template
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
+from aea.protocols.base import Message
 from web3 import Web3
 
+from packages.valory.protocols.http import HttpMessage
 from packages.valory.skills.abstract_round_abci.behaviour_utils import BaseBehaviour
-from packages.valory.skills.abstract_round_abci.models import ApiSpecs
+from packages.valory.skills.abstract_round_abci.models import ApiSpecs, Requests
+from packages.valory.skills.market_manager_abci.graph_tooling.cache import SyncCache
+from packages.valory.skills.market_manager_abci.graph_tooling.queries.conditional_tokens import (
+    user_last_active as user_last_active_query,
+)
 from packages.valory.skills.market_manager_abci.graph_tooling.queries.conditional_tokens import (
     user_positions as user_positions_query,
 )
@@ -42,9 +61,16 @@ from packages.valory.skills.market_manager_abci.graph_tooling.queries.omen impor
 from packages.valory.skills.market_manager_abci.graph_tooling.queries.realitio import (
     answers as answers_query,
 )
+from packages.valory.skills.market_manager_abci.graph_tooling.queries.trades import (
+    market_trades as market_trades_query,
+)
 from packages.valory.skills.market_manager_abci.graph_tooling.queries.trades import (
     trades as trades_query,
 )
+from packages.valory.skills.market_manager_abci.graph_tooling.utils import (
+    PositionsIndex,
+    is_market_closed,
+)
 from packages.valory.skills.market_manager_abci.models import (
     MarketManagerParams,
     SharedState,
@@ -54,6 +80,15 @@ from packages.valory.skills.market_manager_abci.rounds import SynchronizedData
 
 QUERY_BATCH_SIZE = 1000
 MAX_LOG_SIZE = 1000
+FINAL_TX_HASH_KEY = "final_tx_hash"
+TRADES_CACHE_FILENAME = "trades_cache.json"
+POSITIONS_CACHE_FILENAME = "positions_cache.json"
+CURSOR_FIELD = "cursor"
+TRADES_FIELD = "trades"
+CLOSED_MARKETS_FIELD = "closed_markets"
+LAST_ACTIVE_FIELD = "last_active"
+LAST_ACTIVE_RESPONSE_KEY = "data:user:lastActive"
+POSITIONS_FIELD = "positions"
 
 
 def to_content(query: str) -> bytes:
@@ -78,6 +113,35 @@ class FetchStatus(Enum):
     NONE = auto()
 
 
+@dataclass
+class QuestionsFetch:
+    """The state of fetching the questions of a prediction market."""
+
+    market: str
+    creators: List[str]
+    status: FetchStatus = FetchStatus.IN_PROGRESS
+    # the id of the last fetched question, used to paginate
+    cursor: str = ""
+    chunks: List[List[Dict[str, Any]]] = field(default_factory=list)
+    # the nonce of the request in flight, if any
+    nonce: Optional[str] = None
+    # the earliest time at which a failed request may be retried
+    retry_at: float = 0.0
+
+    @property
+    def questions(self) -> List[Dict[str, Any]]:
+        """Get all the fetched questions."""
+        return [question for chunk in self.chunks for question in chunk]
+
+    def is_due(self) -> bool:
+        """Whether the next request of the fetch is due to be sent."""
+        return (
+            self.status == FetchStatus.IN_PROGRESS
+            and self.nonce is None
+            and self.retry_at <= time.time()
+        )
+
+
 class QueryingBehaviour(BaseBehaviour, ABC):
     """Abstract behaviour that implements subgraph querying functionality."""
 
@@ -171,30 +235,153 @@ class QueryingBehaviour(BaseBehaviour, ABC):
         self._fetch_status = FetchStatus.SUCCESS
         return res
 
-    def _fetch_bets(self) -> Generator[None, None, Optional[list]]:
-        """Fetch questions from the current subgraph, for the current creators."""
-        self._fetch_status = FetchStatus.IN_PROGRESS
-
+    def _get_buffering_callback(
+        self, responses: Dict[str, Message]
+    ) -> Callable[[Message, BaseBehaviour], None]:
+        """Get a request callback which buffers the responses, so that several requests can be in flight at once."""
+
+        def callback_request(
+            message: Message, current_behaviour: BaseBehaviour
+        ) -> None:
+            """Buffer the response by the nonce of its request."""
+            if self.is_stopped:
+                self.context.logger.debug(
+                    "Dropping message as behaviour has stopped: %s", message
+                )
+            elif self != current_behaviour:
+                self.handle_late_messages(self.behaviour_id, message)
+            else:
+                responses[message.dialogue_reference[0]] = message
+
+        return callback_request
+
+    def _send_http_request(
+        self,
+        responses: Dict[str, Message],
+        method: str,
+        url: str,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        parameters: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Send an http request without waiting for its response.
+
+        :param responses: the buffer to which the response is added, by the request's nonce.
+        :param method: the http request method (i.e. 'GET' or 'POST').
+        :param url: the url to send the message to.
+        :param content: the payload.
+        :param headers: headers to be included.
+        :param parameters: url query parameters.
+        :return: the nonce of the request.
+        """
+        http_message, http_dialogue = self._build_http_request_message(
+            method=method,
+            url=url,
+            content=content,
+            headers=headers,
+            parameters=parameters,
+        )
+        self.context.outbox.put_message(message=http_message)
+        request_nonce = self._get_request_nonce_from_dialogue(http_dialogue)
+        cast(Requests, self.context.requests).request_id_to_callback[
+            request_nonce
+        ] = self._get_buffering_callback(responses)
+        return request_nonce
+
+    def _send_questions_request(
+        self, fetch: QuestionsFetch, responses: Dict[str, Message]
+    ) -> None:
+        """Request the next page of questions of a market."""
         query = questions.substitute(
-            creators=to_graphql_list(self._current_creators),
+            creators=to_graphql_list(fetch.creators),
             slot_count=self.params.slot_count,
             opening_threshold=self.synced_time + self.params.opening_margin,
             languages=to_graphql_list(self.params.languages),
+            first=QUERY_BATCH_SIZE,
+            id_gt=fetch.cursor,
         )
-
-        res_raw = yield from self.get_http_response(
+        subgraph: ApiSpecs = getattr(self.context, fetch.market)
+        fetch.nonce = self._send_http_request(
+            responses,
             content=to_content(query),
-            **self.current_subgraph.get_spec(),
+            **subgraph.get_spec(),
         )
-        res = self.current_subgraph.process_response(res_raw)
 
-        bets = yield from self._handle_response(
-            self.current_subgraph,
-            res,
-            res_context="questions",
-        )
+    def _handle_questions_response(
+        self, fetch: QuestionsFetch, response: HttpMessage
+    ) -> None:
+        """Handle a response with questions, updating the state of the market's fetch."""
+        fetch.nonce = None
+        subgraph: ApiSpecs = getattr(self.context, fetch.market)
+        res = subgraph.process_response(response)
+
+        if res is None:
+            self.context.logger.error(f"Could not get questions from {subgraph.api_id}")
+            subgraph.increment_retries()
+            if subgraph.is_retries_exceeded():
+                fetch.status = FetchStatus.FAIL
+            else:
+                sleep_time = subgraph.retries_info.suggested_sleep_time
+                fetch.retry_at = time.time() + sleep_time
+            return
+
+        # truncate the response, otherwise logs get too big
+        res_str = str(res)[:MAX_LOG_SIZE]
+        self.context.logger.info(f"Retrieved questions: {res_str}.")
+        subgraph.reset_retries()
+
+        chunk = cast(List[Dict[str, Any]], res)
+        fetch.chunks.append(chunk)
+        if len(chunk) < QUERY_BATCH_SIZE:
+            fetch.status = FetchStatus.SUCCESS
+        else:
+            fetch.cursor = chunk[-1]["id"]
+
+    def fetch_all_questions(
+        self,
+    ) -> Generator[None, None, Optional[List[Tuple[str, List[Dict[str, Any]]]]]]:
+        """Fetch the questions from all the prediction markets.
+
+        The requests to the different markets' subgraphs are in flight at once, each with its own retries,
+        while the pages of each market are requested one after the other.
+
+        :return: the questions of each market, in the configured markets' order, or `None` if any market failed.
+        :yield: None
+        """
+        self._fetch_status = FetchStatus.IN_PROGRESS
+        fetches = [
+            QuestionsFetch(market, creators)
+            for market, creators in self._creators_iterator
+        ]
+        responses: Dict[str, Message] = {}
+
+        def can_progress() -> bool:
+            """Whether any response has arrived or any request is due."""
+            return bool(responses) or any(fetch.is_due() for fetch in fetches)
 
-        return bets
+        while True:
+            if any(fetch.status == FetchStatus.FAIL for fetch in fetches):
+                self._call_failed = True
+                self._fetch_status = FetchStatus.FAIL
+                return None
+
+            if all(fetch.status == FetchStatus.SUCCESS for fetch in fetches):
+                break
+
+            for fetch in fetches:
+                if fetch.is_due():
+                    self._send_questions_request(fetch, responses)
+
+            yield from self.wait_for_condition(can_progress)
+
+            for fetch in fetches:
+                if fetch.nonce in responses:
+                    response = responses.pop(cast(str, fetch.nonce))
+                    self._handle_questions_response(fetch, cast(HttpMessage, response))
+
+        self._call_failed = False
+        self._fetch_status = FetchStatus.SUCCESS
+        return [(fetch.market, fetch.questions) for fetch in fetches]
 
     def _fetch_redeem_info(self) -> Generator[None, None, Optional[list]]:
         """Fetch redeeming information from the current subgraph."""
@@ -309,32 +496,47 @@ class QueryingBehaviour(BaseBehaviour, ABC):
         ]
         return answers
 
-    def fetch_trades(
+    def _read_sync_cache(self, filename: str, address: str) -> Optional[Dict[str, Any]]:
+        """Read the synced data of the given address from a cache file, if they exist."""
+        cache = SyncCache(self.params.store_path / filename)
+        try:
+            return cache.read(address)
+        except (OSError, ValueError) as exc:
+            self.context.logger.warning(f"Ignoring the sync cache {filename!r}: {exc}")
+            return None
+
+    def _write_sync_cache(
+        self, filename: str, address: str, entry: Dict[str, Any]
+    ) -> None:
+        """Write the synced data of the given address to a cache file."""
+        cache = SyncCache(self.params.store_path / filename)
+        try:
+            cache.write(address, entry)
+        except (OSError, ValueError) as exc:
+            self.context.logger.warning(
+                f"Could not update the sync cache {filename!r}: {exc}"
+            )
+
+    def _fetch_trades_chunks(
         self,
-        creator: str,
-        from_timestamp: float,
-        to_timestamp: float,
-    ) -> Generator[None, None, Optional[List[Dict[str, Any]]]]:
-        """Fetch trades from the subgraph."""
-        self._fetch_status = FetchStatus.IN_PROGRESS
+        query_kwargs: Dict[str, Any],
+        creation_timestamp_gt: int = 0,
+        query: Template = trades_query,
+    ) -> Generator[None, None, Tuple[List[Dict[str, Any]], bool]]:
+        """Fetch trades from the subgraph, in batches, and whether all of them were fetched."""
         current_subgraph = self.context.trades_subgraph
 
         all_trades: List[Dict[str, Any]] = []
-        creation_timestamp_gt = (
-            0  # used to allow for batching based on creation timestamp
-        )
         # fetch trades in batches of `QUERY_BATCH_SIZE`
         while True:
-            query = trades_query.substitute(
-                creator=creator.lower(),
-                creationTimestamp_lte=int(to_timestamp),
-                creationTimestamp_gte=int(from_timestamp),
+            substituted = query.substitute(
+                **query_kwargs,
                 first=QUERY_BATCH_SIZE,
                 creationTimestamp_gt=creation_timestamp_gt,
             )
 
             res_raw = yield from self.get_http_response(
-                content=to_content(query),
+                content=to_content(substituted),
                 **current_subgraph.get_spec(),
             )
             res = current_subgraph.process_response(res_raw)
@@ -346,12 +548,12 @@ class QueryingBehaviour(BaseBehaviour, ABC):
             if res is None:
                 # something went wrong
                 self.context.logger.error("Failed to process all trades.")
-                return all_trades
+                return all_trades, False
 
             trades_chunk = cast(List[Dict[str, Any]], trades_chunk)
             if len(trades_chunk) == 0:
                 # no more trades to fetch
-                return all_trades
+                return all_trades, True
 
             # this is the last trade's creation timestamp
             # they are sorted by creation timestamp in ascending order
@@ -359,11 +561,142 @@ class QueryingBehaviour(BaseBehaviour, ABC):
             creation_timestamp_gt = trades_chunk[-1]["creationTimestamp"]
             all_trades.extend(trades_chunk)
 
-    def fetch_user_positions(
-        self, user: str
+    def _sync_trades(
+        self, creator: str, to_timestamp: float
+    ) -> Generator[None, None, List[Dict[str, Any]]]:
+        """Sync the trades of a creator with the local cache, fetching only the trades after the cached ones.
+
+        The trades of the markets which were not closed when they were last fetched are fetched again,
+        as the markets' information that they contain may have changed since.
+
+        :param creator: the creator of the trades.
+        :param to_timestamp: the timestamp up to which to return the trades.
+        :return: all the creator's trades up to the given timestamp.
+        :yield: None
+        """
+        cached = self._read_sync_cache(TRADES_CACHE_FILENAME, creator) or {}
+        cursor: int = cached.get(CURSOR_FIELD, 0)
+        trades = {trade["id"]: trade for trade in cached.get(TRADES_FIELD, [])}
+        closed_markets = set(cached.get(CLOSED_MARKETS_FIELD, []))
+        open_markets = {
+            trade["fpmm"]["id"]
+            for trade in trades.values()
+            if trade["fpmm"]["id"] not in closed_markets
+        }
+
+        query_kwargs = dict(
+            creator=creator,
+            creationTimestamp_lte=int(to_timestamp),
+            creationTimestamp_gte=0,
+        )
+        # the trades created at the cursor are fetched again, in case the cursor was in the middle of a batch
+        new_trades, is_synced = yield from self._fetch_trades_chunks(
+            query_kwargs, max(cursor - 1, 0)
+        )
+        n_new = len({trade["id"] for trade in new_trades} - trades.keys())
+        refreshed_trades: List[Dict[str, Any]] = []
+        if open_markets:
+            market_kwargs = dict(
+                creator=creator, fpmms=to_graphql_list(sorted(open_markets))
+            )
+            refreshed_trades, is_refreshed = yield from self._fetch_trades_chunks(
+                market_kwargs, query=market_trades_query
+            )
+            is_synced = is_synced and is_refreshed
+
+        for trade in new_trades + refreshed_trades:
+            trades[trade["id"]] = trade
+            if is_market_closed(trade["fpmm"]):
+                closed_markets.add(trade["fpmm"]["id"])
+
+        all_trades = sorted(
+            trades.values(), key=lambda trade: int(trade["creationTimestamp"])
+        )
+        self.context.logger.info(
+            f"Synced {n_new} new trades and refreshed {len(refreshed_trades)} trades of open markets, "
+            f"out of {len(all_trades)} trades in total."
+        )
+        if not is_synced:
+            # the cursor is not advanced past trades which may have been missed
+            self.context.logger.error(
+                f"Could not sync all the trades of {creator!r}, the cached trades are not updated."
+            )
+            self._fetch_status = FetchStatus.FAIL
+        else:
+            self._fetch_status = FetchStatus.SUCCESS
+            if all_trades:
+                entry = {
+                    CURSOR_FIELD: int(all_trades[-1]["creationTimestamp"]),
+                    TRADES_FIELD: all_trades,
+                    CLOSED_MARKETS_FIELD: sorted(closed_markets),
+                }
+                self._write_sync_cache(TRADES_CACHE_FILENAME, creator, entry)
+
+        return [
+            trade
+            for trade in all_trades
+            if int(trade["creationTimestamp"]) <= to_timestamp
+        ]
+
+    def fetch_trades(
+        self,
+        creator: str,
+        from_timestamp: float,
+        to_timestamp: float,
     ) -> Generator[None, None, Optional[List[Dict[str, Any]]]]:
-        """Fetch positions for a user from the subgraph."""
+        """Fetch trades from the subgraph.
+
+        The whole history of trades is synced incrementally with a local cache,
+        while the trades of any other time range are always fetched from the subgraph.
+
+        :param creator: the creator of the trades.
+        :param from_timestamp: the timestamp from which to fetch the trades.
+        :param to_timestamp: the timestamp up to which to fetch the trades.
+        :return: the trades.
+        :yield: None
+        """
         self._fetch_status = FetchStatus.IN_PROGRESS
+        if from_timestamp <= 0:
+            trades = yield from self._sync_trades(creator.lower(), to_timestamp)
+            return trades
+
+        query_kwargs = dict(
+            creator=creator.lower(),
+            creationTimestamp_lte=int(to_timestamp),
+            creationTimestamp_gte=int(from_timestamp),
+        )
+        trades, _ = yield from self._fetch_trades_chunks(query_kwargs)
+        return trades
+
+    def _fetch_user_last_active(
+        self, user: str
+    ) -> Generator[None, None, Optional[int]]:
+        """Fetch the last time that a user's positions changed, or `None` if it cannot be determined."""
+        current_subgraph = self.context.conditional_tokens_subgraph
+        query = user_last_active_query.substitute(id=user)
+        res_raw = yield from self.get_http_response(
+            content=to_content(query),
+            **current_subgraph.get_spec(),
+        )
+        # the subgraph's specs are configured for the user positions' query
+        res = current_subgraph.process_response_at(
+            res_raw, response_key=LAST_ACTIVE_RESPONSE_KEY, response_type="str"
+        )
+        last_active = yield from self._handle_response(
+            current_subgraph,
+            res,
+            res_context="last activity",
+            sleep_on_fail=False,
+        )
+        if not last_active:
+            # the user does not exist yet, or the request has failed
+            return None
+        return int(last_active)
+
+    def _fetch_all_user_positions(
+        self, user: str
+    ) -> Generator[None, None, List[Dict[str, Any]]]:
+        """Fetch all the positions of a user from the subgraph."""
         current_subgraph = self.context.conditional_tokens_subgraph
 
         user_positions_id_gt = (
@@ -372,7 +705,7 @@ class QueryingBehaviour(BaseBehaviour, ABC):
         all_positions: List[Dict[str, Any]] = []
         while True:
             query = user_positions_query.substitute(
-                id=user.lower(),
+                id=user,
                 first=QUERY_BATCH_SIZE,
                 userPositions_id_gt=user_positions_id_gt,
             )
@@ -400,6 +733,69 @@ class QueryingBehaviour(BaseBehaviour, ABC):
             all_positions.extend(positions)
             user_positions_id_gt = positions[-1]["id"]
 
+    def fetch_user_positions(
+        self, user: str
+    ) -> Generator[None, None, Optional[List[Dict[str, Any]]]]:
+        """Fetch positions for a user from the subgraph.
+
+        The positions' balances change in place and the positions are not ordered chronologically,
+        therefore, the cached positions are reused only if the user has not been active since they were fetched.
+
+        :param user: the user to fetch the positions for.
+        :return: the user's positions.
+        :yield: None
+        """
+        self._fetch_status = FetchStatus.IN_PROGRESS
+        user = user.lower()
+
+        last_active = yield from self._fetch_user_last_active(user)
+        if last_active is not None:
+            cached = self._read_sync_cache(POSITIONS_CACHE_FILENAME, user) or {}
+            if cached.get(LAST_ACTIVE_FIELD, None) == last_active:
+                self.context.logger.info(
+                    f"Reusing the cached positions of {user!r}, as it has not been active since they were fetched."
+                )
+                self._fetch_status = FetchStatus.SUCCESS
+                return cached[POSITIONS_FIELD]
+
+        all_positions = yield from self._fetch_all_user_positions(user)
+        if last_active is not None and self._fetch_status == FetchStatus.SUCCESS:
+            entry = {LAST_ACTIVE_FIELD: last_active, POSITIONS_FIELD: all_positions}
+            self._write_sync_cache(POSITIONS_CACHE_FILENAME, user, entry)
+
+        return all_positions
+
+    def fetch_positions_index(
+        self, user: str
+    ) -> Generator[None, None, Optional[PositionsIndex]]:
+        """Fetch the positions of a user and index them.
+
+        The index is reused within a period, for as long as no other transaction has been settled.
+
+        :param user: the user to fetch the positions for.
+        :return: the index of the user's positions, or `None` if they could not be fetched.
+        :yield: None
+        """
+        key = (
+            user.lower(),
+            self.synchronized_data.period_count,
+            self.synchronized_data.db.get(FINAL_TX_HASH_KEY, None),
+        )
+        cached = self.shared_state.positions_index
+        if cached is not None and cached[0] == key:
+            _, positions_index = cached
+            return positions_index
+
+        user_positions = yield from self.fetch_user_positions(user)
+        if user_positions is None:
+            return None
+
+        positions_index = PositionsIndex(user_positions)
+        # do not reuse partially fetched positions
+        if self._fetch_status == FetchStatus.SUCCESS:
+            self.shared_state.positions_index = (key, positions_index)
+        return positions_index
+
     def clean_up(self) -> None:
         """Clean up the resources."""
         markets_subgraphs = tuple(market for market, _ in self.params.creators_iterator)
@@ -21,7 +21,7 @@
 import time
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 INVALID_MARKET_ANSWER = (
@@ -43,57 +43,95 @@ class MarketState(Enum):
         return self.name.capitalize()
 
 
-def get_position_balance(
-    user_positions: List[Dict[str, Any]],
-    condition_id: str,
-) -> Dict[str, int]:
-    """Get the balance of a position."""
-    positions: Dict[str, int] = defaultdict(int)
+class PositionsIndex:
+    """An index of a user's positions by condition id.
 
-    for position in user_positions:
-        position_condition_ids = position["position"]["conditionIds"]
-        outcomes = position["position"]["conditions"][0]["outcomes"]
-        indexSets = position["position"]["indexSets"]
+    Each of the balances and the lifetime values is indexed in a single pass over the positions, the first time that
+    it is requested, so that looking them up for every trade is linear in the number of trades and positions.
+    """
 
-        # index set is a position in outcomes counting from 1
-        outcome_index = int(indexSets[0]) - 1
+    def __init__(self, user_positions: List[Dict[str, Any]]) -> None:
+        """Initialize the index."""
+        self.user_positions = user_positions
+        # a mapping from condition id to the balance of each outcome
+        self._balances: Optional[Dict[str, Dict[str, int]]] = None
+        # a mapping from lowercase condition id to the total balance of its first unclaimed position
+        self._lifetime_values: Optional[Dict[str, int]] = None
 
-        balance = int(position["balance"])
-        if condition_id.lower() in position_condition_ids:
-            positions[outcomes[outcome_index]] += balance
+    def _index_balances(self) -> Dict[str, Dict[str, int]]:
+        """Index the balance of each outcome by condition id."""
+        balances: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for position in self.user_positions:
+            position_condition_ids = position["position"]["conditionIds"]
+            outcomes = position["position"]["conditions"][0]["outcomes"]
+            indexSets = position["position"]["indexSets"]
 
-    return positions
+            # index set is a position in outcomes counting from 1
+            outcome_index = int(indexSets[0]) - 1
 
+            balance = int(position["balance"])
+            for condition_id in set(position_condition_ids):
+                balances[condition_id][outcomes[outcome_index]] += balance
 
-def get_position_lifetime_value(
-    user_positions: List[Dict[str, Any]],
-    condition_id: str,
-) -> int:
-    """Get the balance of a position."""
-    for position in user_positions:
-        position_condition_ids = map(
-            lambda x: x.lower(), position["position"]["conditionIds"]
-        )
-        balance = int(position["position"]["lifetimeValue"])
+        return balances
+
+    def _index_lifetime_values(self) -> Dict[str, int]:
+        """Index the lifetime values by lowercase condition id."""
+        lifetime_values: Dict[str, int] = {}
+        for position in self.user_positions:
+            position_condition_ids = {
+                condition_id.lower()
+                for condition_id in position["position"]["conditionIds"]
+            }
+            for condition in position["position"]["conditions"]:
+                condition_id = condition["id"].lower()
+                if condition_id not in position_condition_ids:
+                    continue
+
+                # if position is claimed, balance is 0
+                balance = int(position["totalBalance"])
+                if balance > 0:
+                    lifetime_values.setdefault(condition_id, balance)
 
-        matching_positions = []
+        return lifetime_values
 
-        for condition in position["position"]["conditions"]:
-            if condition["id"].lower() != condition_id.lower():
-                continue
+    def balance(self, condition_id: str) -> Dict[str, int]:
+        """Get the balance of each outcome of the positions with the given condition id."""
+        if self._balances is None:
+            self._balances = self._index_balances()
+        return defaultdict(int, self._balances.get(condition_id.lower(), {}))
 
-            # if position is claimed, balance is 0
-            balance = int(position["totalBalance"])
-            if balance > 0:
-                matching_positions.append(condition)
+    def lifetime_value(self, condition_id: str) -> int:
+        """Get the lifetime value of the first unclaimed position with the given condition id, otherwise `0`."""
+        if self._lifetime_values is None:
+            self._lifetime_values = self._index_lifetime_values()
+        return self._lifetime_values.get(condition_id.lower(), 0)
 
-        if (
-            condition_id.lower() in position_condition_ids
-            and len(matching_positions) > 0
-        ):
-            return balance
 
-    return 0
+UserPositionsType = Union[List[Dict[str, Any]], PositionsIndex]
+
+
+def get_positions_index(user_positions: UserPositionsType) -> PositionsIndex:
+    """Get an index for the given user positions, if they are not already indexed."""
+    if isinstance(user_positions, PositionsIndex):
+        return user_positions
+    return PositionsIndex(user_positions)
+
+
+def get_position_balance(
+    user_positions: UserPositionsType,
+    condition_id: str,
+) -> Dict[str, int]:
+    """Get the balance of a position."""
+    return get_positions_index(user_positions).balance(condition_id)
+
+
+def get_position_lifetime_value(
+    user_positions: UserPositionsType,
+    condition_id: str,
+) -> int:
+    """Get the balance of a position."""
+    return get_positions_index(user_positions).lifetime_value(condition_id)
 
 
 def next_status(
@@ -117,26 +155,39 @@ def next_status(
     return MarketState.CLOSED
 
 
+def is_market_closed(fpmm: Dict[str, Any]) -> bool:
+    """Check whether the given market is closed, i.e., its state will not change anymore."""
+    market_status = next_status(
+        fpmm,
+        fpmm["openingTimestamp"],
+        fpmm["answerFinalizedTimestamp"],
+        fpmm["isPendingArbitration"],
+    )
+    return market_status == MarketState.CLOSED
+
+
 def get_bet_id_to_balance(
     creator_trades: List[Dict[str, Any]],
-    user_positions: List[Dict[str, Any]],
+    user_positions: UserPositionsType,
 ) -> Dict[str, Dict[str, int]]:
     """Get the bet id to balance."""
+    positions_index = get_positions_index(user_positions)
     bet_id_to_balance: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
     for fpmm_trade in creator_trades:
         fpmm = fpmm_trade["fpmm"]
         bet_id = fpmm["id"]
         condition_id = fpmm["condition"]["id"]
-        balance = get_position_balance(user_positions, condition_id)
+        balance = positions_index.balance(condition_id)
         bet_id_to_balance[bet_id] = balance
     return bet_id_to_balance
 
 
 def get_condition_id_to_balances(
     creator_trades: List[Dict[str, Any]],
-    user_positions: List[Dict[str, Any]],
+    user_positions: UserPositionsType,
 ) -> Tuple[Dict[str, int], Dict[str, int]]:
     """Get the condition id to balances."""
+    positions_index = get_positions_index(user_positions)
     condition_id_to_payout = {}
     condition_id_to_balance = {}
     for fpmm_trade in creator_trades:
@@ -157,10 +208,10 @@ def get_condition_id_to_balances(
                 or current_answer == INVALID_MARKET_ANSWER
             ):
                 condition_id = fpmm_trade["fpmm"]["condition"]["id"]
-                balance = get_position_balance(user_positions, condition_id)
+                balance = positions_index.balance(condition_id)
                 condition_id_to_balance[condition_id] = balance[str(outcome_index)]
                 # get the payout for this condition
-                payout = get_position_lifetime_value(user_positions, condition_id)
+                payout = positions_index.lifetime_value(condition_id)
                 if payout > 0 and balance[str(outcome_index)] == 0:
                     condition_id_to_payout[condition_id] = payout
                     # if position is not claimed, balance is the payout
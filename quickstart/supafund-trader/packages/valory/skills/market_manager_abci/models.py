@@ -21,8 +21,9 @@
 """Custom objects for the MarketManager ABCI application."""
 
 import builtins
+import dataclasses
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Tuple, Type
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from aea.skills.base import Model
 
@@ -38,18 +39,31 @@ from packages.valory.skills.abstract_round_abci.models import (
 )
 from packages.valory.skills.abstract_round_abci.models import TypeCheckMixin
 from packages.valory.skills.market_manager_abci.bets import BINARY_N_SLOTS
+from packages.valory.skills.market_manager_abci.graph_tooling.utils import (
+    PositionsIndex,
+)
 from packages.valory.skills.market_manager_abci.rounds import MarketManagerAbciApp
 
 
 Requests = BaseRequests
 BenchmarkTool = BaseBenchmarkTool
 
+# the user, the period and the hash of the last settled transaction that a positions' index corresponds to
+PositionsIndexKeyType = Tuple[str, int, Optional[str]]
+
 
 class SharedState(BaseSharedState):
     """Keep the current shared state of the skill."""
 
     abci_app_cls: Type[AbciApp[Any]] = MarketManagerAbciApp
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the state."""
+        super().__init__(*args, **kwargs)
+        self.positions_index: Optional[
+            Tuple[PositionsIndexKeyType, PositionsIndex]
+        ] = None
+
 
 class Subgraph(ApiSpecs):
     """Specifies `ApiSpecs` with common functionality for subgraphs."""
@@ -90,6 +104,22 @@ class Subgraph(ApiSpecs):
                 self.context.logger.error(err)
         return None
 
+    def process_response_at(
+        self, response: HttpMessage, response_key: str, response_type: str
+    ) -> Any:
+        """Process the response of a query whose result is not found under the configured key."""
+        response_info = self.response_info
+        self.response_info = dataclasses.replace(
+            response_info,
+            response_key=response_key,
+            response_index=None,
+            response_type=response_type,
+        )
+        try:
+            return self.process_response(response)
+        finally:
+            self.response_info = response_info
+
 
 class OmenSubgraph(Subgraph):
     """A model that wraps ApiSpecs for the OMEN's subgraph specifications."""
@@ -165,6 +195,8 @@ class BenchmarkingMode(Model, TypeCheckMixin):
         self.results_filename: Path = Path(
             self._ensure("results_filename", kwargs, str)
         )
+        # whether to also write the results in the Arrow IPC columnar format, next to the CSV file
+        self.columnar_results: bool = self._ensure("columnar_results", kwargs, bool)
         self.randomness: str = self._ensure("randomness", kwargs, str)
         self.nr_mech_calls: int = self._ensure("nr_mech_calls", kwargs, int)
         super().__init__(*args, **kwargs)
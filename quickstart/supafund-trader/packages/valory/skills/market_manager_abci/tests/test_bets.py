@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the bets' structures of the MarketManager ABCI application."""
+
+import dataclasses
+import json
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.market_manager_abci import bets as bets_module
+from packages.valory.skills.market_manager_abci.bets import (
+    Bet,
+    BetsCollection,
+    BetsDecoder,
+    PredictionResponse,
+    QueueStatus,
+    hash_bets,
+    serialize_bets,
+)
+
+
+def get_dummy_bet(
+    bet_id: str,
+    opening_timestamp: int,
+    queue_status: QueueStatus = QueueStatus.FRESH,
+) -> Bet:
+    """Get a dummy bet."""
+    return Bet(
+        id=bet_id,
+        market="omen_subgraph",
+        title="dummy title",
+        collateralToken="0xe91d153e0b41518a2ce8dd3d7944fa863463a97d",  # nosec
+        creator="0x89c5cc945dd550bcffb72fe42bff002429f46fec",
+        fee=10000000000000000,
+        openingTimestamp=opening_timestamp,
+        outcomeSlotCount=2,
+        outcomeTokenAmounts=[12821128072452298989, 3821816592354479467],
+        outcomeTokenMarginalPrices=[0.2296358408518959, 0.7703641591481041],
+        outcomes=["Yes", "No"],
+        scaledLiquidityMeasure=5.888381051174862,
+        queue_status=queue_status,
+    )
+
+
+def get_dummy_collection() -> BetsCollection:
+    """Get a dummy collection of bets, with decreasing opening timestamps."""
+    return BetsCollection(get_dummy_bet(f"0x{i}", 100 - i) for i in range(5))
+
+
+def test_lookups() -> None:
+    """Test the lookups of the bets' collection."""
+    bets = get_dummy_collection()
+
+    assert len(bets) == 5
+    assert [bet.id for bet in bets] == ["0x0", "0x1", "0x2", "0x3", "0x4"]
+    assert "0x3" in bets
+    assert "0x5" not in bets
+    assert bets.get_idx("0x3") == 3
+    assert bets.get_idx("0x5") is None
+    assert bets.get("0x2") is bets[2]
+    assert bets.get("0x5") is None
+    assert bets.index(bets[1]) == 1
+
+    with pytest.raises(ValueError):
+        bets.index(get_dummy_bet("0x1", 99))
+
+
+def test_upsert() -> None:
+    """Test upserting bets to the collection."""
+    bets = get_dummy_collection()
+
+    updated = get_dummy_bet("0x1", 99)
+    updated.scaledLiquidityMeasure = 1.0
+    existing = bets.upsert(updated)
+    assert existing is bets[1]
+    assert existing.scaledLiquidityMeasure == 1.0
+    assert len(bets) == 5
+
+    new = bets.upsert(get_dummy_bet("0x5", 95))
+    assert new is bets[5]
+    assert bets.get_idx("0x5") == 5
+
+
+def test_status_index() -> None:
+    """Test that the queue status index follows the bets' updates."""
+    bets = get_dummy_collection()
+    assert bets.count_with_status(QueueStatus.FRESH) == 5
+
+    bets[3].queue_status = QueueStatus.TO_PROCESS
+    bets[1].queue_status = QueueStatus.TO_PROCESS
+    bets[2].blacklist_forever()
+
+    to_process = bets.with_status(QueueStatus.TO_PROCESS)
+    assert [bet.id for bet in to_process] == ["0x1", "0x3"]
+    assert [bet.id for bet in bets.with_status(QueueStatus.EXPIRED)] == ["0x2"]
+    assert bets.count_with_status(QueueStatus.FRESH) == 2
+    assert bets.count_with_status(QueueStatus.FRESH, QueueStatus.EXPIRED) == 3
+
+
+def test_opening_index() -> None:
+    """Test the opening timestamp index."""
+    bets = get_dummy_collection()
+    assert [bet.id for bet in bets.opening_until(97)] == ["0x3", "0x4"]
+    assert bets.opening_until(0) == []
+
+    bets[4].openingTimestamp = 1000
+    bets[0].openingTimestamp = 1
+    assert [bet.id for bet in bets.opening_until(97)] == ["0x0", "0x3"]
+
+
+def test_serialize_collection() -> None:
+    """Test that a collection is serialized exactly as the list of its bets."""
+    bets = get_dummy_collection()
+    assert serialize_bets(bets) == serialize_bets(list(bets))
+    assert serialize_bets(BetsCollection()) is None
+
+
+def test_digest() -> None:
+    """Test that a collection's digest only digests the changed bets again, and that it depends on their order."""
+    bets = get_dummy_collection()
+    digest = bets.digest
+    assert digest == hash_bets(list(bets))
+
+    with mock.patch.object(
+        bets_module, "digest_bet", wraps=bets_module.digest_bet
+    ) as digest_bet:
+        assert bets.digest == digest
+        assert digest_bet.call_count == 0
+
+        bets[1].queue_status = QueueStatus.TO_PROCESS
+        bets[3].append_investment_amount(0, 10)
+        bets.append(get_dummy_bet("0x5", 95))
+        changed_digest = bets.digest
+        assert digest_bet.call_count == 3
+
+    assert changed_digest != digest
+    assert changed_digest == hash_bets(list(bets))
+    assert hash_bets(list(reversed(list(bets)))) != changed_digest
+
+
+def test_slots() -> None:
+    """Test that the bets and the prediction responses are not backed by a `__dict__`."""
+    bet = get_dummy_bet("0x0", 0)
+    assert not hasattr(bet, "__dict__")
+    assert not hasattr(bet.prediction_response, "__dict__")
+
+    with pytest.raises(AttributeError):
+        bet.unknown = 0  # type: ignore  # pylint: disable=assigning-non-slot
+
+    with pytest.raises(AttributeError):
+        _ = bet.last_processed_sell_check
+    bet.set_processed_sell_check(1)
+    assert bet.last_processed_sell_check == 1
+
+
+def test_cast() -> None:
+    """Test that the values of a bet are cast to their hinted types."""
+    bet = get_dummy_bet("0x0", 0)
+    bet_data = dataclasses.asdict(bet)
+    bet_data.update(fee="100", outcomeTokenMarginalPrices=["0.25", 0.75])
+    bet_data["prediction_response"] = bet.prediction_response
+    casted = Bet(**bet_data)
+
+    assert casted.fee == 100
+    assert casted.outcomeTokenMarginalPrices == [0.25, 0.75]
+    assert casted.outcomes == ["Yes", "No"]
+
+
+def test_decoder() -> None:
+    """Test that the decoder recognizes the bets and the prediction responses."""
+    bets = get_dummy_collection()
+    bets[1].queue_status = QueueStatus.TO_PROCESS
+    decoded = json.loads(serialize_bets(bets), cls=BetsDecoder)
+    assert decoded == list(bets)
+    assert isinstance(decoded[0].prediction_response, PredictionResponse)
+    assert decoded[1].queue_status == QueueStatus.TO_PROCESS
+
+    # a bet with extra keys and without any of the optional ones is still decoded as a bet
+    bet_data = json.loads(serialize_bets(bets))[0]
+    bet_data["extra"] = None
+    del bet_data["queue_status"]
+    del bet_data["investments"]
+    decoded_bet = json.loads(json.dumps(bet_data), cls=BetsDecoder)
+    assert decoded_bet == bets[0]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the bets' storage of the MarketManager ABCI application."""
+
+from pathlib import Path
+
+from packages.valory.skills.market_manager_abci.bets import (
+    BetsCollection,
+    QueueStatus,
+    hash_bets,
+    serialize_bets,
+)
+from packages.valory.skills.market_manager_abci.bets_store import BetsStore
+from packages.valory.skills.market_manager_abci.tests.test_bets import get_dummy_bet
+
+
+N_BETS = 20
+
+
+def get_store(tmp_path: Path) -> BetsStore:
+    """Get a store under the given path."""
+    return BetsStore(
+        snapshot_path=tmp_path / "multi_bets.json",
+        log_path=tmp_path / "multi_bets.log",
+        legacy_path=tmp_path / "bets.json",
+    )
+
+
+def store_dummy_bets(store: BetsStore) -> None:
+    """Store some dummy bets."""
+    store.write(BetsCollection(get_dummy_bet(f"0x{i}", i) for i in range(N_BETS)))
+
+
+def test_read_empty(tmp_path: Path) -> None:
+    """Test reading from an empty store."""
+    store = get_store(tmp_path)
+    assert store.read_path is None
+    assert len(store.read()) == 0
+
+
+def test_write_compacts_bets_not_read_from_store(tmp_path: Path) -> None:
+    """Test that writing bets which were not read from the store writes the full snapshot."""
+    store = get_store(tmp_path)
+    store_dummy_bets(store)
+
+    assert not store.has_pending_changes
+    bets = store.read()
+    assert store.snapshot_path.read_text() == serialize_bets(bets)
+
+
+def test_write_logs_only_changes(tmp_path: Path) -> None:
+    """Test that only the modified and the new bets are logged."""
+    store = get_store(tmp_path)
+    store_dummy_bets(store)
+    snapshot = store.snapshot_path.read_text()
+
+    bets = store.read()
+    bets[3].queue_status = QueueStatus.TO_PROCESS
+    bets[4].append_investment_amount(0, 10)
+    # setting the same values should not be considered a change
+    bets[5].update_market_info(get_dummy_bet("0x5", 5))
+    bets[6].reset_investments()
+    bets.append(get_dummy_bet("0xnew", 100))
+    assert bets.modified_indexes() == [3, 4, N_BETS]
+
+    store.write(bets)
+    assert store.snapshot_path.read_text() == snapshot
+    assert len(store.log_path.read_text().splitlines()) == 4
+    assert store.has_pending_changes
+
+    stored = store.read()
+    assert len(stored) == N_BETS + 1
+    assert stored[3].queue_status == QueueStatus.TO_PROCESS
+    assert stored[4].investments == {"Yes": [10], "No": []}
+    assert stored[N_BETS].id == "0xnew"
+    assert serialize_bets(stored) == serialize_bets(bets)
+
+
+def test_stale_bets_are_compacted(tmp_path: Path) -> None:
+    """Test that writing bets which do not correspond to the stored state rewrites the snapshot."""
+    store = get_store(tmp_path)
+    store_dummy_bets(store)
+
+    stale = store.read()
+    latest = store.read()
+    latest[1].queue_status = QueueStatus.PROCESSED
+    store.write(latest)
+    stale[2].queue_status = QueueStatus.PROCESSED
+    store.write(stale)
+
+    assert not store.has_pending_changes
+    stored = store.read()
+    assert stored[1].queue_status == QueueStatus.FRESH
+    assert stored[2].queue_status == QueueStatus.PROCESSED
+
+
+def test_log_of_other_snapshot_is_ignored(tmp_path: Path) -> None:
+    """Test that a log which does not reference the current snapshot is ignored."""
+    store = get_store(tmp_path)
+    store_dummy_bets(store)
+    bets = store.read()
+    bets[1].queue_status = QueueStatus.PROCESSED
+    store.write(bets)
+
+    other_bets = BetsCollection([get_dummy_bet("0x0", 0)])
+    store.snapshot_path.write_text(serialize_bets(other_bets))
+    assert len(store.read()) == 1
+
+
+def test_token_is_in_bytes(tmp_path: Path) -> None:
+    """Test that the token's header and size are both measured in bytes."""
+    store = get_store(tmp_path)
+    store_dummy_bets(store)
+    token = store.token
+    assert token is not None
+    header, log_size = token
+    assert log_size == len(header) == store.log_path.stat().st_size
+
+    bets = store.read()
+    bets[1].title = "non-ascii title: éèê"
+    store.write(bets)
+    _, log_size = store.token or (b"", 0)
+    assert log_size == store.log_path.stat().st_size
+
+
+def test_hash_does_not_depend_on_the_storage_history(tmp_path: Path) -> None:
+    """Test that the same bets have the same hash, regardless of whether they were logged or compacted."""
+    logged_store = get_store(tmp_path / "logged")
+    compacted_store = get_store(tmp_path / "compacted")
+    for path in (tmp_path / "logged", tmp_path / "compacted"):
+        path.mkdir()
+
+    for store in (logged_store, compacted_store):
+        store_dummy_bets(store)
+    logged = logged_store.read()
+    logged[1].queue_status = QueueStatus.PROCESSED
+    logged_store.write(logged)
+    compacted = BetsCollection(compacted_store.read())
+    compacted[1].queue_status = QueueStatus.PROCESSED
+    compacted_store.write(compacted)
+
+    assert logged_store.has_pending_changes
+    assert not compacted_store.has_pending_changes
+    assert hash_bets(logged_store.read()) == hash_bets(compacted_store.read())
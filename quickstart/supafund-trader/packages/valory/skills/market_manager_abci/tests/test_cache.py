@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the subgraphs' sync cache of the MarketManager ABCI application."""
+
+from pathlib import Path
+
+import pytest
+
+from packages.valory.skills.market_manager_abci.graph_tooling.cache import SyncCache
+
+
+def test_sync_cache(tmp_path: Path) -> None:
+    """Test that the sync cache keeps a separate entry per address."""
+    cache = SyncCache(tmp_path / "cache.json")
+    assert cache.read("0xA") is None
+
+    cache.write("0xA", {"cursor": 1})
+    cache.write("0xb", {"cursor": 2})
+    cache.write("0xa", {"cursor": 3})
+
+    assert cache.read("0xA") == {"cursor": 3}
+    assert cache.read("0xB") == {"cursor": 2}
+    assert not (tmp_path / "cache.json.tmp").exists()
+
+
+def test_invalid_sync_cache(tmp_path: Path) -> None:
+    """Test that an invalid sync cache raises a `ValueError`."""
+    path = tmp_path / "cache.json"
+    path.write_text("[]")
+    with pytest.raises(ValueError):
+        SyncCache(path).read("0xa")
+
+    path.write_text("{")
+    with pytest.raises(ValueError):
+        SyncCache(path).read("0xa")
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the concurrent fetching of the questions of the MarketManager ABCI application."""
+
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+from unittest import mock
+from unittest.mock import MagicMock
+
+from packages.valory.skills.market_manager_abci.graph_tooling import requests
+from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
+    FetchStatus,
+    QueryingBehaviour,
+    QuestionsFetch,
+)
+
+
+BATCH_SIZE = 2
+MARKETS = (("omen_subgraph", ["0xa"]), ("other_subgraph", ["0xb"]))
+
+# the pages of each market, by the cursor they are requested with; `None` stands for a failed request
+PagesType = Dict[str, List[Optional[List[Dict[str, Any]]]]]
+
+
+class DummyQueryingBehaviour(QueryingBehaviour):
+    """A querying behaviour which is not bound to a round."""
+
+    matching_round = MagicMock()
+
+    def setup(self) -> None:
+        """Set up the behaviour."""
+
+    def teardown(self) -> None:
+        """Tear down the behaviour."""
+
+    def async_act(self) -> Generator:
+        """Do the behaviour's action."""
+        yield
+
+
+class SubgraphsStub:
+    """Stubs the markets' subgraphs, answering the requests of each market in the given order."""
+
+    def __init__(self, pages: PagesType, delivery: List[str]) -> None:
+        """Initialize the stub.
+
+        :param pages: the pages that each market's subgraph responds with, in order.
+        :param delivery: the order in which the responses of the markets' requests arrive.
+        """
+        self.pages = pages
+        self.delivery = delivery
+        self.sent: List[Tuple[str, str]] = []
+        self.in_flight: Dict[str, str] = {}
+        self.responses: Dict[str, Any] = {}
+        self.context = MagicMock()
+        for market, _ in MARKETS:
+            subgraph = getattr(self.context, market)
+            subgraph.api_id = market
+            subgraph.process_response.side_effect = lambda response: response
+            subgraph.is_retries_exceeded.return_value = False
+            subgraph.retries_info.suggested_sleep_time = 0
+
+    def send(self, fetch: QuestionsFetch, responses: Dict[str, Any]) -> None:
+        """Send the next request of a market's fetch."""
+        self.responses = responses
+        fetch.nonce = f"{fetch.market}-{len(self.sent)}"
+        self.sent.append((fetch.market, fetch.cursor))
+        self.in_flight[fetch.market] = fetch.nonce
+
+    def wait_for_condition(
+        self, condition: Callable[[], bool], timeout: Optional[float] = None
+    ) -> Generator:
+        """Deliver the response of the next market in the delivery order."""
+        if not condition():
+            market = self.delivery.pop(0)
+            nonce = self.in_flight.pop(market)
+            self.responses[nonce] = self.pages[market].pop(0)
+        yield
+
+
+def fetch_all_questions(
+    stub: SubgraphsStub,
+) -> Tuple[Optional[List[Tuple[str, List[Dict[str, Any]]]]], FetchStatus]:
+    """Run `fetch_all_questions` against the stubbed subgraphs, returning its result and the fetch status."""
+    behaviour = object.__new__(DummyQueryingBehaviour)
+    behaviour._creators_iterator = iter(MARKETS)
+    behaviour._fetch_status = FetchStatus.NONE
+    behaviour._call_failed = False
+
+    with mock.patch.object(
+        DummyQueryingBehaviour,
+        "context",
+        new_callable=mock.PropertyMock,
+        return_value=stub.context,
+    ), mock.patch.object(
+        DummyQueryingBehaviour, "_send_questions_request", side_effect=stub.send
+    ), mock.patch.object(
+        DummyQueryingBehaviour,
+        "wait_for_condition",
+        side_effect=stub.wait_for_condition,
+    ), mock.patch.object(
+        requests, "QUERY_BATCH_SIZE", BATCH_SIZE
+    ):
+        gen = behaviour.fetch_all_questions()
+        try:
+            while True:
+                next(gen)
+        except StopIteration as stop:
+            return stop.value, behaviour._fetch_status
+
+
+def question(id_: str) -> Dict[str, Any]:
+    """Get a dummy question."""
+    return {"id": id_}
+
+
+def test_fetch_all_questions_out_of_order() -> None:
+    """Test that the questions are returned in the markets' order, regardless of the order of the responses."""
+    pages: PagesType = {
+        "omen_subgraph": [[question("q1"), question("q2")], [question("q3")]],
+        "other_subgraph": [[question("q4")]],
+    }
+    delivery = ["other_subgraph", "omen_subgraph", "omen_subgraph"]
+    stub = SubgraphsStub(pages, delivery)
+
+    result, status = fetch_all_questions(stub)
+
+    assert status == FetchStatus.SUCCESS
+    assert result == [
+        ("omen_subgraph", [question("q1"), question("q2"), question("q3")]),
+        ("other_subgraph", [question("q4")]),
+    ]
+    # both markets are requested at once, and each page is requested from the cursor of the last one
+    assert stub.sent == [
+        ("omen_subgraph", ""),
+        ("other_subgraph", ""),
+        ("omen_subgraph", "q2"),
+    ]
+
+
+def test_fetch_all_questions_last_short_page() -> None:
+    """Test that a market's fetch ends with its first page which is shorter than a batch, even if it is empty."""
+    pages: PagesType = {
+        "omen_subgraph": [[question("q1"), question("q2")], []],
+        "other_subgraph": [[question("q3"), question("q4")], [question("q5")]],
+    }
+    delivery = ["omen_subgraph", "other_subgraph", "omen_subgraph", "other_subgraph"]
+    stub = SubgraphsStub(pages, delivery)
+
+    result, status = fetch_all_questions(stub)
+
+    assert status == FetchStatus.SUCCESS
+    assert result == [
+        ("omen_subgraph", [question("q1"), question("q2")]),
+        ("other_subgraph", [question("q3"), question("q4"), question("q5")]),
+    ]
+    assert len(stub.sent) == 4
+
+
+def test_fetch_all_questions_failed_page() -> None:
+    """Test that a failed page is retried, and that the fetch fails once the retries are exceeded."""
+    pages: PagesType = {
+        "omen_subgraph": [None, [question("q1")]],
+        "other_subgraph": [[question("q2")]],
+    }
+    delivery = ["omen_subgraph", "other_subgraph", "omen_subgraph"]
+    stub = SubgraphsStub(pages, delivery)
+
+    result, status = fetch_all_questions(stub)
+
+    assert status == FetchStatus.SUCCESS
+    assert result == [
+        ("omen_subgraph", [question("q1")]),
+        ("other_subgraph", [question("q2")]),
+    ]
+    assert stub.sent[-1] == ("omen_subgraph", "")
+    stub.context.omen_subgraph.increment_retries.assert_called_once()
+
+    pages = {"omen_subgraph": [None], "other_subgraph": [[question("q2")]]}
+    stub = SubgraphsStub(pages, ["omen_subgraph"])
+    stub.context.omen_subgraph.is_retries_exceeded.return_value = True
+
+    result, status = fetch_all_questions(stub)
+
+    assert result is None
+    assert status == FetchStatus.FAIL
@@ -29,8 +29,11 @@ from packages.valory.skills.market_manager_abci.bets import (
     serialize_bets,
 )
 from packages.valory.skills.market_manager_abci.graph_tooling.utils import (
+    PositionsIndex,
     get_condition_id_to_balances,
     get_position_lifetime_value,
+    get_positions_index,
+    is_market_closed,
 )
 
 
@@ -163,3 +166,59 @@ def test_get_condition_id_to_balances() -> None:
     # needs to be presented in both
     assert condition_to_payout[condition_id] == 2238183507853351332
     assert condition_to_balance[condition_id] == 2238183507853351332
+
+
+def test_positions_index() -> None:
+    """Test that the positions' index aggregates the positions of each condition."""
+    user_positions = [
+        {
+            "position": {
+                "indexSets": [str(index_set)],
+                "conditionIds": [condition_id],
+                "conditions": [{"id": condition_id.upper(), "outcomes": ["0", "1"]}],
+            },
+            "balance": str(balance),
+            "totalBalance": str(total_balance),
+        }
+        for condition_id, index_set, balance, total_balance in (
+            ("0xa", 1, 10, 0),
+            ("0xa", 2, 5, 3),
+            ("0xa", 2, 1, 7),
+            ("0xb", 1, 2, 0),
+        )
+    ]
+    positions_index = PositionsIndex(user_positions)
+
+    assert positions_index.balance("0xA") == {"0": 10, "1": 6}
+    assert positions_index.balance("0xb") == {"0": 2}
+    assert positions_index.balance("0xc") == {}
+    assert positions_index.balance("0xc")["0"] == 0
+    # the first unclaimed position of a condition is used
+    assert positions_index.lifetime_value("0xa") == 3
+    assert positions_index.lifetime_value("0xb") == 0
+    assert get_positions_index(positions_index) is positions_index
+
+
+@pytest.mark.parametrize(
+    "current_answer, answer_finalized_timestamp, is_pending_arbitration, expected",
+    [
+        (None, None, False, False),
+        ("0x0", str(2**40), False, False),
+        ("0x0", "0", True, False),
+        ("0x0", "0", False, True),
+    ],
+)
+def test_is_market_closed(
+    current_answer: str,
+    answer_finalized_timestamp: str,
+    is_pending_arbitration: bool,
+    expected: bool,
+) -> None:
+    """Test the is_market_closed function."""
+    fpmm = {
+        "currentAnswer": current_answer,
+        "answerFinalizedTimestamp": answer_finalized_timestamp,
+        "isPendingArbitration": is_pending_arbitration,
+        "openingTimestamp": "0",
+    }
+    assert is_market_closed(fpmm) is expected
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Benchmark the bets' decoder against the previous, dict-backed implementation.
+
+Usage: `python scripts/benchmark_bets_decoder.py --n-bets 20000 --repeats 5`
+"""
+
+import argparse
+import builtins
+import dataclasses
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from packages.valory.skills.market_manager_abci.bets import (
+    Bet,
+    BetsDecoder,
+    PredictionResponse,
+    QueueStatus,
+    get_default_prediction_response,
+    serialize_bets,
+)
+
+
+@dataclasses.dataclass(init=False)
+class LegacyPredictionResponse:
+    """The previous, dict-backed prediction response."""
+
+    p_yes: float
+    p_no: float
+    confidence: float
+    info_utility: float
+
+    __init__ = PredictionResponse.__init__
+
+
+@dataclasses.dataclass
+class LegacyBet:  # pylint: disable=too-many-instance-attributes
+    """The previous, dict-backed bet, which builds its casting rules for every instance."""
+
+    id: str
+    market: str
+    title: str
+    collateralToken: str
+    creator: str
+    fee: int
+    openingTimestamp: int
+    outcomeSlotCount: int
+    outcomeTokenAmounts: List[int]
+    outcomeTokenMarginalPrices: List[float]
+    outcomes: Optional[List[str]]
+    scaledLiquidityMeasure: float
+    prediction_response: Any = dataclasses.field(
+        default_factory=get_default_prediction_response
+    )
+    position_liquidity: int = 0
+    potential_net_profit: int = 0
+    processed_timestamp: int = 0
+    queue_status: QueueStatus = QueueStatus.FRESH
+    investments: Dict[str, List[int]] = dataclasses.field(default_factory=dict)
+
+    __post_init__ = Bet.__post_init__
+    _validate = Bet._validate
+    _check_usefulness = Bet._check_usefulness
+    blacklist_forever = Bet.blacklist_forever
+
+    def _cast(self) -> None:
+        """Cast the values of the instance."""
+        types_to_cast = ("int", "float", "str")
+        str_to_type = {getattr(builtins, type_): type_ for type_ in types_to_cast}
+        for field, hinted_type in self.__annotations__.items():
+            uncasted = getattr(self, field)
+            if uncasted is None:
+                continue
+
+            for type_to_cast, type_name in str_to_type.items():
+                if hinted_type == type_to_cast:
+                    setattr(self, field, hinted_type(uncasted))
+                if f"{str(List)}[{type_name}]" == str(hinted_type):
+                    setattr(self, field, list(type_to_cast(val) for val in uncasted))
+
+
+class LegacyBetsDecoder(json.JSONDecoder):
+    """The previous decoder, which sorts the keys of every decoded object."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the decoder."""
+        super().__init__(object_hook=self.hook, *args, **kwargs)
+
+    @staticmethod
+    def hook(data: Dict[str, Any]) -> Any:
+        """Perform the custom decoding."""
+        prediction_attributes = sorted(LegacyPredictionResponse.__annotations__.keys())
+        data_attributes = sorted(data.keys())
+        if prediction_attributes == data_attributes:
+            return LegacyPredictionResponse(**data)
+
+        bet_annotations = sorted(LegacyBet.__annotations__.keys())
+        if bet_annotations == data_attributes:
+            data["queue_status"] = QueueStatus(data["queue_status"])
+            return LegacyBet(**data)
+        elif "id" in data_attributes:
+            common_attributes = set(bet_annotations) & set(data_attributes)
+            data = {key: data[key] for key in common_attributes}
+            if "queue_status" in data:
+                data["queue_status"] = QueueStatus(data["queue_status"])
+            return LegacyBet(**data)
+        return data
+
+
+def get_serialized_bets(n_bets: int) -> str:
+    """Get the given number of synthetic bets serialized."""
+    bets = [
+        Bet(
+            id=f"0x{i:040x}",
+            market="omen_subgraph",
+            title=f"Will event {i} happen?",
+            collateralToken="0xe91d153e0b41518a2ce8dd3d7944fa863463a97d",  # nosec
+            creator="0x89c5cc945dd550bcffb72fe42bff002429f46fec",
+            fee=10000000000000000,
+            openingTimestamp=1700000000 + i,
+            outcomeSlotCount=2,
+            outcomeTokenAmounts=[12821128072452298989 + i, 3821816592354479467],
+            outcomeTokenMarginalPrices=[0.2296358408518959, 0.7703641591481041],
+            outcomes=["Yes", "No"],
+            scaledLiquidityMeasure=5.888381051174862,
+        )
+        for i in range(n_bets)
+    ]
+    serialized = serialize_bets(bets)
+    if serialized is None:
+        raise ValueError("At least one bet is required.")
+    return serialized
+
+
+def measure(
+    load: Callable[[], List[Any]], repeats: int
+) -> Tuple[float, int, List[Any]]:
+    """Measure the best loading time and the memory retained by the loaded bets."""
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = load()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, retained, loaded
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-bets", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    serialized = get_serialized_bets(args.n_bets)
+    decoders: Tuple[Type[json.JSONDecoder], ...] = (LegacyBetsDecoder, BetsDecoder)
+    results = {}
+    for decoder in decoders:
+        results[decoder.__name__] = measure(
+            lambda decoder=decoder: json.loads(serialized, cls=decoder),  # type: ignore
+            args.repeats,
+        )
+
+    (_, _, legacy_bets), (_, _, bets) = results.values()
+    if [dataclasses.astuple(bet) for bet in legacy_bets] != [
+        dataclasses.astuple(bet) for bet in bets
+    ]:
+        raise ValueError("The decoders produced different bets.")
+
+    print(f"Decoding {args.n_bets} bets ({len(serialized) / 2 ** 20:.1f} MiB):")
+    for name, (best, retained, _) in results.items():
+        print(f"{name:>20}: {best * 1000:9.1f} ms, {retained / 2 ** 20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
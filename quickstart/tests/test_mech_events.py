@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""Test the local Mech events database of scripts/predict_trader/mech_events.py."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import pytest
+
+from scripts.predict_trader import mech_events
+from scripts.predict_trader.mech_events import MechRequest, get_mech_requests
+
+
+SENDER = "0x0000000000000000000000000000000000000001"
+
+
+def subgraph_event(request_id: str, block_timestamp: int) -> Dict[str, Any]:
+    """Get a request event, as returned by the Mech subgraph."""
+    return {
+        "id": f"0x{request_id}",
+        "ipfsHash": f"hash{request_id}",
+        "requestId": request_id,
+        "sender": SENDER,
+        "transactionHash": f"0xtx{request_id}",
+        "blockNumber": str(block_timestamp // 5),
+        "blockTimestamp": str(block_timestamp),
+    }
+
+
+def stored_event(
+    request_id: str, block_timestamp: int, ipfs_contents: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Get a request event, as stored in the former JSON database."""
+    ipfs_link = f"{mech_events.IPFS_ADDRESS}hash{request_id}" if ipfs_contents else ""
+    return MechRequest(
+        subgraph_event(request_id, block_timestamp),
+        ipfs_contents=(ipfs_link, ipfs_contents),
+    ).__dict__
+
+
+class ClientStub:
+    """Stubs the client of the Mech subgraph, answering the queries in pages."""
+
+    def __init__(self, events: List[Dict[str, Any]]) -> None:
+        """Initialize the client."""
+        self.events = sorted(events, key=lambda event: event["id"])
+        self.queries = 0
+
+    def execute(self, query: Any, variable_values: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a query."""
+        del query
+        self.queries += 1
+        events = [
+            event
+            for event in self.events
+            if event["sender"] == variable_values["sender"]
+            and event["id"] > variable_values["id_gt"]
+        ]
+        return {"requests": events[: variable_values["first"]]}
+
+
+class ResponseStub:
+    """Stubs a response of the IPFS gateway."""
+
+    def __init__(self, contents: Optional[Dict[str, Any]]) -> None:
+        """Initialize the response."""
+        self.contents = contents
+
+    def raise_for_status(self) -> None:
+        """Raise if the contents are not found."""
+        if self.contents is None:
+            raise OSError("404 Not Found")
+
+    def json(self) -> Dict[str, Any]:
+        """Get the contents."""
+        return self.contents or {}
+
+
+class SessionStub:
+    """Stubs the session to the IPFS gateway, serving the metadata files of the given hashes."""
+
+    def __init__(self, contents: Dict[str, Dict[str, Any]]) -> None:
+        """Initialize the session."""
+        self.contents = contents
+        self.requested: List[str] = []
+
+    def get(self, url: str, timeout: float) -> ResponseStub:
+        """Request a file."""
+        del timeout
+        self.requested.append(url)
+        ipfs_hash, _, file = url[len(mech_events.IPFS_ADDRESS) :].partition("/")
+        if file != "metadata.json":
+            return ResponseStub(None)
+        return ResponseStub(self.contents.get(ipfs_hash))
+
+
+class TestMechEvents:
+    """Tests for the local Mech events database."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> Any:
+        """Store the databases in a temporary directory, and stub the subgraph and the IPFS gateway."""
+        self.tmp_path = tmp_path
+        self.json_path = tmp_path / "mech_events.json"
+        self.client = ClientStub([])
+        self.session = SessionStub({})
+        with mock.patch.object(
+            mech_events, "MECH_EVENTS_JSON_PATH", self.json_path
+        ), mock.patch.object(
+            mech_events, "MECH_EVENTS_DB_PATH", tmp_path / "mech_events.db"
+        ), mock.patch.object(
+            mech_events, "QUERY_BATCH_SIZE", 2
+        ), mock.patch.object(
+            mech_events, "get_subgraph_api_key", return_value="key"
+        ), mock.patch.object(
+            mech_events, "RequestsHTTPTransport"
+        ), mock.patch.object(
+            mech_events, "gql"
+        ), mock.patch.object(
+            mech_events, "Client", side_effect=lambda **kwargs: self.client
+        ), mock.patch.object(
+            mech_events, "_get_session", side_effect=lambda: self.session
+        ):
+            yield
+
+    def test_fetch(self) -> None:
+        """Test that the events of the subgraph are stored with their IPFS contents."""
+        self.client = ClientStub(
+            [subgraph_event(str(i), 1000 + i) for i in range(5)]
+            + [{**subgraph_event("9", 1009), "sender": "0xother"}]
+        )
+        self.session = SessionStub({f"hash{i}": {"prompt": str(i)} for i in range(5)})
+
+        events = get_mech_requests(SENDER)
+
+        assert list(events) == [str(i) for i in range(5)]
+        assert events["3"]["ipfs_contents"] == {"prompt": "3"}
+        assert (
+            events["3"]["ipfs_link"] == f"{mech_events.IPFS_ADDRESS}hash3/metadata.json"
+        )
+        assert events["3"]["block_timestamp"] == 1003
+        # the events are queried in pages, until an empty one
+        assert self.client.queries == 4
+
+    def test_resume_events_without_ipfs_contents(self) -> None:
+        """Test that only the events whose IPFS contents were not found are fetched again."""
+        self.client = ClientStub([subgraph_event(str(i), 1000 + i) for i in range(3)])
+        self.session = SessionStub({"hash0": {"prompt": "0"}, "hash2": {"prompt": "2"}})
+
+        events = get_mech_requests(SENDER)
+
+        assert events["1"]["ipfs_contents"] == {}
+        assert events["1"]["ipfs_link"] == ""
+
+        self.session = SessionStub({"hash1": {"prompt": "1"}})
+
+        events = get_mech_requests(SENDER)
+
+        assert self.session.requested == [
+            f"{mech_events.IPFS_ADDRESS}hash1/metadata.json"
+        ]
+        assert events["0"]["ipfs_contents"] == {"prompt": "0"}
+        assert events["1"]["ipfs_contents"] == {"prompt": "1"}
+
+    def test_timestamp_filter(self) -> None:
+        """Test that only the events within the time range are returned, in order."""
+        self.client = ClientStub(
+            [subgraph_event(str(i), 1000 - 10 * i) for i in range(5)]
+        )
+        self.session = SessionStub({f"hash{i}": {"prompt": str(i)} for i in range(5)})
+
+        events = get_mech_requests(SENDER, from_timestamp=970, to_timestamp=990)
+
+        assert list(events) == ["3", "2", "1"]
+
+    def test_import_json(self) -> None:
+        """Test that the events of the former JSON database are imported, and that the file is set aside."""
+        imported = {
+            "0": stored_event("0", 1000, {"prompt": "0"}),
+            "1": stored_event("1", 1001, {}),
+        }
+        self.json_path.write_text(
+            json.dumps(
+                {
+                    "db_version": mech_events.MECH_EVENTS_DB_VERSION,
+                    SENDER: {MechRequest.event_name: imported},
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.client = ClientStub([subgraph_event(str(i), 1000 + i) for i in range(3)])
+        self.session = SessionStub({"hash1": {"prompt": "1"}, "hash2": {"prompt": "2"}})
+
+        events = get_mech_requests(SENDER)
+
+        # the imported event without IPFS contents is fetched again
+        assert sorted(self.session.requested) == [
+            f"{mech_events.IPFS_ADDRESS}hash1/metadata.json",
+            f"{mech_events.IPFS_ADDRESS}hash2/metadata.json",
+        ]
+        assert events["0"] == imported["0"]
+        assert events["1"]["ipfs_contents"] == {"prompt": "1"}
+        assert events["2"]["ipfs_contents"] == {"prompt": "2"}
+        assert not self.json_path.exists()
+        assert len(list(self.tmp_path.glob("mech_events.*.migrated.json"))) == 1
+
+    def test_import_old_json(self) -> None:
+        """Test that the events of an old version of the JSON database are discarded."""
+        self.json_path.write_text(
+            json.dumps(
+                {
+                    "db_version": mech_events.MECH_EVENTS_DB_VERSION - 1,
+                    SENDER: {
+                        MechRequest.event_name: {
+                            "0": stored_event("0", 1000, {"prompt": "0"})
+                        }
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        events = get_mech_requests(SENDER)
+
+        assert events == {}
+        assert not self.json_path.exists()
+        assert len(list(self.tmp_path.glob("mech_events.*.old.json"))) == 1